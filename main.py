@@ -26,6 +26,7 @@ Environment Variables:
 """
 
 import asyncio
+import heapq
 import logging
 import os
 import signal
@@ -438,13 +439,7 @@ class TextRPBot:
             
             # Fetch balance
             try:
-                # First try with strict=True
-                account_info = await self.xrpl.get_account_info(address, strict=True)
-                
-                # If that fails, try without strict
-                if account_info is None:
-                    logger.info(f"Account lookup failed with strict=True, trying without strict for {address}")
-                    account_info = await self.xrpl.get_account_info(address, strict=False)
+                account_info = await self.xrpl.get_account_info(address)
                 
                 if account_info is None:
                     await self.textrp.send_message(
@@ -654,25 +649,21 @@ class TextRPBot:
                     msg += f"━━━━━━━━━━━━━━━━━━━━━\n"
                     msg += f"**Total Trust Lines:** {len(trust_lines)}\n\n"
                     
-                    # Sort by balance (descending)
-                    sorted_lines = sorted(
-                        trust_lines,
-                        key=lambda x: abs(float(x.get("balance", 0))),
-                        reverse=True
+                    # Largest balances first; parse each balance once and
+                    # only order the lines that are shown
+                    top_lines = heapq.nlargest(
+                        15,
+                        ((float(line.get("balance", 0)), line) for line in trust_lines),
+                        key=lambda parsed: abs(parsed[0]),
                     )
                     
-                    for i, line in enumerate(sorted_lines[:15]):
+                    for i, (balance, line) in enumerate(top_lines):
                         currency = line.get("currency", "???")
-                        balance = float(line.get("balance", 0))
                         limit = line.get("limit", "0")
                         issuer = line.get("account", "Unknown")
                         
                         # Format currency code (could be hex for long codes)
-                        if len(currency) > 3:
-                            try:
-                                currency = bytes.fromhex(currency).decode('utf-8').rstrip('\x00')
-                            except:
-                                currency = currency[:8] + "..."
+                        currency = XRPLClient.format_currency(currency)
                         
                         balance_str = f"{balance:,.6f}".rstrip('0').rstrip('.')
                         
@@ -728,7 +719,11 @@ class TextRPBot:
                 return
             
             try:
-                tokens = await self.xrpl.get_token_balances(address)
+                # Tokens and XRP balance are independent, fetch both at once
+                tokens, xrp_balance = await asyncio.gather(
+                    self.xrpl.get_token_balances(address),
+                    self.xrpl.get_account_balance(address),
+                )
                 
                 if tokens is None:
                     await self.textrp.send_message(
@@ -736,8 +731,6 @@ class TextRPBot:
                         f"⚠️ Could not fetch tokens for `{address}`"
                     )
                 elif len(tokens) == 0:
-                    # Also get XRP balance
-                    xrp_balance = await self.xrpl.get_account_balance(address)
                     if xrp_balance:
                         await self.textrp.send_message(
                             room.room_id,
@@ -752,32 +745,29 @@ class TextRPBot:
                             f"📭 No tokens found for `{address}`"
                         )
                 else:
-                    # Get XRP balance too
-                    xrp_balance = await self.xrpl.get_account_balance(address)
-                    
-                    msg = f"💰 **Tokens for** `{address[:8]}...{address[-6:]}`\n"
-                    msg += f"━━━━━━━━━━━━━━━━━━━━━\n\n"
+                    # One line per token and a wallet can hold hundreds, so
+                    # collect the lines and join them once
+                    parts = [
+                        f"💰 **Tokens for** `{address[:8]}...{address[-6:]}`\n",
+                        f"━━━━━━━━━━━━━━━━━━━━━\n\n",
+                    ]
                     
                     if xrp_balance:
-                        msg += f"**XRP:** {xrp_balance:,.6f}\n\n"
+                        parts.append(f"**XRP:** {xrp_balance:,.6f}\n\n")
                     
                     for token in tokens:
                         currency = token.get("currency", "???")
                         balance = token.get("balance", "0")
                         
                         # Decode hex currency codes
-                        if len(currency) > 3:
-                            try:
-                                currency = bytes.fromhex(currency).decode('utf-8').rstrip('\x00')
-                            except:
-                                currency = currency[:8]
+                        currency = XRPLClient.format_currency(currency)
                         
                         balance_float = float(balance)
                         balance_str = f"{balance_float:,.6f}".rstrip('0').rstrip('.')
                         
-                        msg += f"**{currency}:** {balance_str}\n"
+                        parts.append(f"**{currency}:** {balance_str}\n")
                     
-                    await self.textrp.send_message(room.room_id, msg)
+                    await self.textrp.send_message(room.room_id, "".join(parts))
                     
             except Exception as e:
                 logger.error(f"Error fetching tokens: {e}")
@@ -1029,6 +1019,16 @@ class TextRPBot:
         except Exception as e:
             logger.warning(f"Error closing client: {e}")
         
+        try:
+            await self.weather.close()
+        except Exception as e:
+            logger.warning(f"Error closing weather client: {e}")
+        
+        try:
+            await self.xrpl.close()
+        except Exception as e:
+            logger.warning(f"Error closing XRPL client: {e}")
+        
         logger.info("Shutdown complete")
 
 
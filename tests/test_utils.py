@@ -17,6 +17,8 @@ from utils.sanitizer import (
     SanitizationLevel,
     validate_xrp_address,
     validate_tx_hash,
+    validate_xrp_address_batch,
+    validate_tx_hash_batch,
     validate_command_name,
     validate_city_name,
     sanitize_command_input,
@@ -36,6 +38,11 @@ from utils.analytics import (
     CommandMetrics,
     Timer,
 )
+from utils.retry import (
+    RetryConfig,
+    retry_async,
+    retry_iter,
+)
 
 
 # =============================================================================
@@ -108,6 +115,14 @@ class TestInputSanitizer:
         result = sanitizer.sanitize("New York, NY", context="city")
         
         assert result.sanitized == "New York, NY"
+    
+    def test_dangerous_pattern_in_long_ascii_input(self):
+        """Test detection on input long enough to use the RE2 backend."""
+        sanitizer = InputSanitizer()
+        result = sanitizer.sanitize("please show the weather <img onerror=alert(1)>")
+        
+        assert not result.is_safe
+        assert any("on\\w+" in issue for issue in result.issues_found)
 
 
 # =============================================================================
@@ -140,6 +155,15 @@ class TestValidation:
         assert result.is_valid is False
         assert "empty" in str(result.errors).lower()
     
+    def test_validate_xrp_address_cached_result_is_copied(self):
+        """Test that mutating a result doesn't leak into later calls."""
+        first = validate_xrp_address("invalid_address")
+        first.errors.clear()
+        second = validate_xrp_address("invalid_address")
+        
+        assert second is not first
+        assert len(second.errors) > 0
+    
     def test_validate_tx_hash_valid(self):
         """Test transaction hash validation."""
         valid_hash = "A" * 64
@@ -154,6 +178,24 @@ class TestValidation:
         assert result.is_valid is False
         assert "length" in str(result.errors).lower()
     
+    def test_validate_xrp_address_batch(self):
+        """Test batch address validation keeps order and error messages."""
+        results = validate_xrp_address_batch([
+            " rN7n3473SaZBCG4dFL83w7a1RXtXtbk2D9 ",
+            "invalid_address",
+        ])
+        
+        assert [r.is_valid for r in results] == [True, False]
+        assert results[0].value == "rN7n3473SaZBCG4dFL83w7a1RXtXtbk2D9"
+        assert results[1].errors == validate_xrp_address("invalid_address").errors
+    
+    def test_validate_tx_hash_batch(self):
+        """Test batch transaction hash validation normalizes case."""
+        results = validate_tx_hash_batch(["a" * 64, "XYZ"])
+        
+        assert [r.is_valid for r in results] == [True, False]
+        assert results[0].value == "A" * 64
+    
     def test_validate_command_name_valid(self):
         """Test command name validation."""
         result = validate_command_name("balance")
@@ -293,6 +335,42 @@ class TestResponseTemplate:
         
         assert "USD" in message
         assert "100.50" in message
+    
+    def test_transaction_info_status_emoji(self):
+        """Test transaction status maps to the matching emoji."""
+        template = ResponseTemplate()
+        tx_hash = "A" * 64
+        
+        assert "✅" in template.transaction_info(tx_hash, "Success")
+        assert "❌" in template.transaction_info(tx_hash, "failed")
+        assert "⏳" in template.transaction_info(tx_hash, "queued")
+    
+    def test_help_command(self):
+        """Test help text formatting and reuse of the rendered string."""
+        template = ResponseTemplate()
+        message = template.help_command(
+            command="!weather",
+            description="Get current weather",
+            usage="!weather <city>",
+            examples=["!weather London", "!weather 10001"],
+        )
+        
+        assert "!weather <city>" in message
+        assert "`!weather London`" in message
+        # Same arguments (examples passed as a fresh list) hit the cache
+        assert template.help_command(
+            "!weather",
+            "Get current weather",
+            "!weather <city>",
+            ["!weather London", "!weather 10001"],
+        ) is message
+    
+    def test_loading_message(self):
+        """Test loading message formatting."""
+        template = ResponseTemplate()
+        
+        assert template.loading() == "🔄 Processing..."
+        assert template.loading("Fetching") == "🔄 Fetching"
 
 
 class TestConvenienceFormatters:
@@ -468,6 +546,52 @@ class TestTimer:
         assert t.elapsed_ms >= 10
 
 
+# =============================================================================
+# RETRY TESTS
+# =============================================================================
+
+class TestRetryIter:
+    """Tests for the retry_iter generator."""
+    
+    @pytest.mark.asyncio
+    async def test_stops_after_success(self):
+        """Test iteration ends once the caller stops asking for attempts."""
+        config = RetryConfig(max_attempts=5, base_delay=0.001, jitter=False)
+        attempts = []
+        
+        async for attempt in retry_iter(config):
+            attempts.append(attempt)
+            if attempt == 1:
+                break
+        
+        assert attempts == [0, 1]
+    
+    @pytest.mark.asyncio
+    async def test_yields_max_attempts(self):
+        """Test the caller gets exactly max_attempts tries."""
+        config = RetryConfig(max_attempts=3, base_delay=0.001, jitter=False)
+        
+        with pytest.raises(ConnectionError):
+            async for attempt in retry_iter(config):
+                try:
+                    raise ConnectionError(f"attempt {attempt}")
+                except config.retry_exceptions:
+                    if attempt == config.max_attempts - 1:
+                        raise
+        
+        assert attempt == 2
+
+
+class TestRetryAsync:
+    """Tests for the retry_async decorator."""
+    
+    def test_rejects_fewer_than_one_attempt(self):
+        """Test that max_attempts below 1 is refused when decorating."""
+        for max_attempts in (0, -1):
+            with pytest.raises(ValueError):
+                retry_async(max_attempts=max_attempts)
+
+
 # =============================================================================
 # EMOJI CONSTANTS TESTS
 # =============================================================================
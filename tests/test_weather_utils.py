@@ -207,6 +207,13 @@ class TestUnitConfiguration:
     def test_celsius_speed_unit(self, celsius_client):
         """Test Celsius speed unit (m/s)."""
         assert celsius_client._get_speed_unit() == "m/s"
+    
+    def test_changing_units_updates_symbols(self, fahrenheit_client):
+        """Test that unit labels follow a change of units."""
+        fahrenheit_client.units = TemperatureUnit.KELVIN
+        
+        assert fahrenheit_client._get_unit_symbol() == "K"
+        assert fahrenheit_client._get_speed_unit() == "m/s"
 
 
 # =============================================================================
@@ -378,6 +385,85 @@ class TestMockedAPIRequests:
             await weather_client.get_weather("New York")
             
             mock_city.assert_called_once_with("New York")
+    
+    @pytest.mark.asyncio
+    async def test_repeated_query_served_from_cache(self, weather_client, mock_weather_response):
+        """Test that an identical request within the TTL skips the network."""
+        with patch('aiohttp.ClientSession') as mock_session_class, \
+                patch('aiohttp.TCPConnector'):
+            mock_session = MagicMock()
+            mock_session.closed = False
+            mock_response = MagicMock()
+            mock_response.status = 200
+            mock_response.json = AsyncMock(return_value=mock_weather_response)
+            
+            mock_context = MagicMock()
+            mock_context.__aenter__ = AsyncMock(return_value=mock_response)
+            mock_context.__aexit__ = AsyncMock(return_value=None)
+            
+            mock_session.get = MagicMock(return_value=mock_context)
+            mock_session_class.return_value = mock_session
+            
+            first = await weather_client.get_weather_by_city("New York")
+            second = await weather_client.get_weather_by_city("New York")
+            
+            assert first == second
+            assert mock_session.get.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_weather_bundle_isolates_failures(self, weather_client, mock_weather_response):
+        """Test that a failed forecast doesn't lose the current weather."""
+        current = weather_client._parse_weather_response(mock_weather_response)
+        with patch.object(weather_client, 'get_weather', new_callable=AsyncMock) as mock_current, \
+                patch.object(weather_client, '_fetch_forecast', new_callable=AsyncMock) as mock_forecast:
+            mock_current.return_value = current
+            mock_forecast.side_effect = ConnectionError("boom")
+            
+            bundle = await weather_client.get_weather_bundle("10001")
+            
+            assert bundle == {"current": current, "forecast": None}
+            mock_forecast.assert_called_once_with({"zip": "10001,US"}, 5)
+    
+    @pytest.mark.asyncio
+    async def test_session_reused_until_closed(self, weather_client):
+        """Test that requests share one HTTP session until close()."""
+        with patch('aiohttp.ClientSession') as mock_session_class, \
+                patch('aiohttp.TCPConnector'):
+            mock_session = MagicMock()
+            mock_session.closed = False
+            mock_session.close = AsyncMock()
+            mock_session_class.return_value = mock_session
+            
+            first = await weather_client._get_session()
+            second = await weather_client._get_session()
+            await weather_client.close()
+            
+            assert first is second
+            mock_session_class.assert_called_once()
+            mock_session.close.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_shared_pool_across_clients(self):
+        """Test that share_pool clients use one session until close_shared()."""
+        with patch('aiohttp.ClientSession') as mock_session_class, \
+                patch('aiohttp.TCPConnector'):
+            mock_session = MagicMock()
+            mock_session.closed = False
+            mock_session.close = AsyncMock()
+            mock_session_class.return_value = mock_session
+            
+            first = WeatherClient(api_key="test", share_pool=True)
+            second = WeatherClient(api_key="test", share_pool=True)
+            try:
+                assert await first._get_session() is await second._get_session()
+                
+                await first.close()
+                mock_session.close.assert_not_awaited()
+            finally:
+                await WeatherClient.close_shared()
+            
+            mock_session_class.assert_called_once()
+            mock_session.close.assert_awaited_once()
 
 
 # =============================================================================
@@ -411,6 +497,128 @@ class TestRetryLogic:
         sig = inspect.signature(weather_client._make_request)
         assert 'max_retries' in sig.parameters
         assert 'base_delay' in sig.parameters
+    
+    @pytest.mark.asyncio
+    async def test_rate_limit_honors_retry_after(self, weather_client, mock_weather_response):
+        """Test that a 429 waits for the Retry-After delay before retrying."""
+        limited = MagicMock()
+        limited.status = 429
+        limited.headers = {"Retry-After": "4"}
+        
+        ok = MagicMock()
+        ok.status = 200
+        ok.json = AsyncMock(return_value=mock_weather_response)
+        
+        contexts = []
+        for response in (limited, ok):
+            context = MagicMock()
+            context.__aenter__ = AsyncMock(return_value=response)
+            context.__aexit__ = AsyncMock(return_value=None)
+            contexts.append(context)
+        
+        mock_session = MagicMock()
+        mock_session.closed = False
+        mock_session.get = MagicMock(side_effect=contexts)
+        weather_client._session = mock_session
+        
+        with patch('weather_utils.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            data = await weather_client._make_request("https://example.invalid", {})
+        
+        assert data == mock_weather_response
+        delay = mock_sleep.call_args.args[0]
+        assert 4.0 <= delay <= 5.0
+    
+    @pytest.mark.asyncio
+    async def test_circuit_opens_after_retries_exhausted(self, weather_client):
+        """Test that requests fail fast once a request runs out of retries."""
+        failing = MagicMock()
+        failing.status = 500
+        
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=failing)
+        context.__aexit__ = AsyncMock(return_value=None)
+        
+        mock_session = MagicMock()
+        mock_session.closed = False
+        mock_session.get = MagicMock(return_value=context)
+        weather_client._session = mock_session
+        
+        with patch('weather_utils.asyncio.sleep', new_callable=AsyncMock):
+            assert await weather_client._make_request("https://example.invalid", {}) is None
+            assert mock_session.get.call_count == 3
+            
+            assert await weather_client._make_request("https://example.invalid", {}) is None
+            assert mock_session.get.call_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_open_circuit_still_serves_cache(self, weather_client, mock_weather_response):
+        """Test that cached responses are returned while the circuit is open."""
+        def respond(endpoint, params=None):
+            response = MagicMock()
+            response.status = 200 if endpoint == "https://example.invalid/ok" else 500
+            response.json = AsyncMock(return_value=mock_weather_response)
+            context = MagicMock()
+            context.__aenter__ = AsyncMock(return_value=response)
+            context.__aexit__ = AsyncMock(return_value=None)
+            return context
+        
+        mock_session = MagicMock()
+        mock_session.closed = False
+        mock_session.get = MagicMock(side_effect=respond)
+        weather_client._session = mock_session
+        
+        with patch('weather_utils.asyncio.sleep', new_callable=AsyncMock):
+            assert await weather_client._make_request("https://example.invalid/ok", {}) == mock_weather_response
+            assert await weather_client._make_request("https://example.invalid/down", {}) is None
+            calls = mock_session.get.call_count
+            
+            # Circuit is open now: the cached query is served, a new one is not sent
+            assert await weather_client._make_request("https://example.invalid/ok", {}) == mock_weather_response
+            assert await weather_client._make_request("https://example.invalid/new", {}) is None
+            assert mock_session.get.call_count == calls
+    
+    @pytest.mark.asyncio
+    async def test_rate_limit_waits_for_next_token(self):
+        """Test that a drained bucket waits exactly until the next token refills."""
+        clock = MagicMock(return_value=100.0)
+        with patch('weather_utils.time.monotonic', clock), \
+                patch('weather_utils.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            client = WeatherClient(api_key="test_key", requests_per_minute=6)
+            rate = 6 / 60.0
+            
+            # The bucket starts full, so a burst of requests_per_minute goes straight out
+            for _ in range(6):
+                await client._acquire_rate_token()
+            mock_sleep.assert_not_awaited()
+            
+            # 2.5s refills a quarter token; the rest is waited for
+            clock.return_value = 102.5
+            await client._acquire_rate_token()
+        
+        mock_sleep.assert_awaited_once()
+        assert mock_sleep.call_args.args[0] == pytest.approx((1.0 - 0.25) / rate)
+        assert client._rate_tokens == 0.0
+    
+    @pytest.mark.asyncio
+    async def test_rate_limit_disabled(self):
+        """Test that requests_per_minute=0 never waits."""
+        client = WeatherClient(api_key="test_key", requests_per_minute=0)
+        
+        with patch('weather_utils.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            for _ in range(100):
+                await client._acquire_rate_token()
+        
+        mock_sleep.assert_not_awaited()
+    
+    def test_parse_retry_after(self):
+        """Test Retry-After parsing for seconds, bad values and the cap."""
+        from weather_utils import _parse_retry_after, MAX_RETRY_AFTER
+        
+        assert _parse_retry_after("7") == 7.0
+        assert _parse_retry_after("100000") == MAX_RETRY_AFTER
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert _parse_retry_after("soon") is None
+        assert _parse_retry_after(None) is None
 
 
 # =============================================================================
@@ -435,6 +643,16 @@ class TestClientInitialization:
         client = WeatherClient(api_key="test", lang="es")
         assert client.lang == "es"
     
+    @pytest.mark.asyncio
+    async def test_max_concurrency_sets_connection_limit(self):
+        """Test that max_concurrency caps connections to the API host."""
+        client = WeatherClient(api_key="test", max_concurrency=8)
+        with patch('aiohttp.ClientSession'), \
+                patch('aiohttp.TCPConnector') as mock_connector_class:
+            await client._get_session()
+        
+        assert mock_connector_class.call_args.kwargs["limit_per_host"] == 8
+    
     def test_no_api_key_warning(self, caplog):
         """Test warning when API key is placeholder."""
         import logging
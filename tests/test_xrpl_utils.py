@@ -8,6 +8,7 @@ Run with: pytest tests/test_xrpl_utils.py -v
 """
 
 import asyncio
+import time
 import pytest
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -16,7 +17,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from xrpl_utils import XRPLClient, XRPL_NETWORKS
+from xrpl_utils import XRPLClient, XRPL_NETWORKS, HISTORY_FETCH_SLICES
 
 
 # =============================================================================
@@ -79,6 +80,15 @@ class TestAddressValidation:
             else:
                 assert XRPLClient.is_valid_address(address) is False, f"Expected {address} to be invalid"
     
+    def test_malformed_address_rejected_before_decoding(self):
+        """Test that badly shaped input never reaches the checksum validator."""
+        with patch('xrpl_utils._is_valid_classic_address') as mock_validate:
+            assert XRPLClient.is_valid_address("r" + "0" * 30) is False
+            assert XRPLClient.is_valid_address("rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh!") is False
+            assert XRPLClient.is_valid_address(b"rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh") is False
+        
+        mock_validate.assert_not_called()
+    
     def test_address_case_sensitivity(self):
         """Test that address validation is case-sensitive."""
         valid = "rN7n3473SaZBCG4dFL83w7a1RXtXtbk2D9"
@@ -105,6 +115,15 @@ class TestConversions:
         assert XRPLClient.drops_to_xrp("500000") == Decimal("0.5")
         assert XRPLClient.drops_to_xrp("123456789") == Decimal("123.456789")
     
+    def test_drops_to_xrp_matches_xrpl_py(self):
+        """Test the direct Decimal path gives xrpl-py's exact results."""
+        from xrpl.utils import drops_to_xrp
+        
+        for drops in ("1", "10000000", "25500000", "99999999999999999", "100000000000000000"):
+            converted = XRPLClient.drops_to_xrp(drops)
+            assert converted == drops_to_xrp(drops)
+            assert str(converted) == str(drops_to_xrp(drops))
+    
     def test_xrp_to_drops(self):
         """Test XRP to drops conversion."""
         assert XRPLClient.xrp_to_drops(1) == "1000000"
@@ -112,6 +131,18 @@ class TestConversions:
         assert XRPLClient.xrp_to_drops(0.5) == "500000"
         assert XRPLClient.xrp_to_drops(Decimal("123.456789")) == "123456789"
     
+    def test_xrp_to_drops_matches_xrpl_py(self):
+        """Test the integer fast path gives xrpl-py's exact results."""
+        from xrpl.utils import XRPRangeException, xrp_to_drops
+        
+        for xrp in (0, 1, 100_000_000_000, "0", "007", "0.000001", "12.5", "99999999999.999999"):
+            assert XRPLClient.xrp_to_drops(xrp) == xrp_to_drops(Decimal(str(xrp)))
+        
+        # Out of range amounts are still rejected
+        for xrp in (-1, 100_000_000_001, "100000000000.000001"):
+            with pytest.raises(XRPRangeException):
+                XRPLClient.xrp_to_drops(xrp)
+    
     def test_format_xrp(self):
         """Test XRP formatting for display."""
         assert "1.000000 XRP" == XRPLClient.format_xrp("1000000")
@@ -120,6 +151,20 @@ class TestConversions:
         # Test with different decimal places
         result = XRPLClient.format_xrp("1234567", decimal_places=2)
         assert "1.23 XRP" == result
+    
+    def test_format_xrp_integer_drops(self):
+        """Test full-precision formatting of integer drop amounts."""
+        assert "0.000001 XRP" == XRPLClient.format_xrp(1)
+        assert "0.000000 XRP" == XRPLClient.format_xrp(0)
+        assert "12345.678901 XRP" == XRPLClient.format_xrp(12345678901)
+    
+    def test_format_currency(self):
+        """Test display names for standard and hex currency codes."""
+        assert XRPLClient.format_currency("USD") == "USD"
+        assert XRPLClient.format_currency("534F4C4F00000000000000000000000000000000") == "SOLO"
+        # Binary codes and malformed input are shortened, not decoded
+        assert XRPLClient.format_currency("03" + "FF" * 19) == "03FFFFFF..."
+        assert XRPLClient.format_currency("NOTHEXNOTHEX") == "NOTHEXNO..."
 
 
 # =============================================================================
@@ -157,6 +202,120 @@ class TestClientInitialization:
         """Test network name is case insensitive."""
         client = XRPLClient(network="MAINNET")
         assert client.network == "mainnet"
+    
+    @pytest.mark.asyncio
+    async def test_requests_reuse_pooled_connection(self):
+        """Test that successive JSON-RPC requests share one keep-alive connection."""
+        web = pytest.importorskip("aiohttp.web")
+        from xrpl.models.requests import ServerInfo
+        
+        client_ports = []
+        
+        async def handle(request):
+            client_ports.append(request.transport.get_extra_info("peername")[1])
+            return web.json_response({"result": {"status": "success", "info": {}}})
+        
+        app = web.Application()
+        app.router.add_post("/", handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        
+        try:
+            async with XRPLClient(rpc_url=f"http://127.0.0.1:{port}/") as client:
+                for _ in range(3):
+                    response = await client.client.request(ServerInfo())
+                    assert response.is_successful()
+        finally:
+            await runner.cleanup()
+        
+        assert len(client_ports) == 3
+        assert len(set(client_ports)) == 1
+    
+    @pytest.mark.asyncio
+    async def test_requests_per_node_limited(self):
+        """Test that no more than max_requests_per_node requests reach a node at once."""
+        web = pytest.importorskip("aiohttp.web")
+        from xrpl.models.requests import ServerInfo
+        
+        running = 0
+        peak = 0
+        
+        async def handle(request):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return web.json_response({"result": {"status": "success", "info": {}}})
+        
+        app = web.Application()
+        app.router.add_post("/", handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        
+        try:
+            async with XRPLClient(rpc_url=f"http://127.0.0.1:{port}/", max_requests_per_node=2) as client:
+                responses = await asyncio.gather(*(client.client.request(ServerInfo()) for _ in range(6)))
+        finally:
+            await runner.cleanup()
+        
+        assert all(response.is_successful() for response in responses)
+        assert peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_dropped_keepalive_connection_retried(self, xrpl_client):
+        """Test that a server-closed pooled connection is retried like other network errors."""
+        aiohttp = pytest.importorskip("aiohttp")
+        
+        dropped = MagicMock()
+        dropped.__aenter__ = AsyncMock(side_effect=aiohttp.ServerDisconnectedError())
+        dropped.__aexit__ = AsyncMock(return_value=None)
+        
+        answer = MagicMock()
+        answer.json = AsyncMock(return_value={
+            "result": {"status": "success", "drops": {"minimum_fee": "10"}}
+        })
+        answered = MagicMock()
+        answered.__aenter__ = AsyncMock(return_value=answer)
+        answered.__aexit__ = AsyncMock(return_value=None)
+        
+        session = MagicMock()
+        session.post = MagicMock(side_effect=[dropped, answered])
+        xrpl_client.client._get_session = lambda: session
+        
+        with patch('utils.retry.asyncio.sleep', new_callable=AsyncMock):
+            fee = await xrpl_client.get_current_fee()
+        
+        assert fee["minimum_fee"] == "10"
+        assert session.post.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_websocket_url_uses_persistent_connection(self):
+        """Test that websocket_url selects a websocket client that close() shuts."""
+        from xrpl_utils import AsyncWebsocketClient
+        
+        client = XRPLClient(websocket_url="wss://xrplcluster.com")
+        assert client.rpc_url == "wss://xrplcluster.com"
+        assert isinstance(client.client, AsyncWebsocketClient)
+        
+        with patch.object(client.client, 'is_open', return_value=True), \
+                patch.object(client.client, 'close', new_callable=AsyncMock) as mock_close:
+            await client.close()
+        
+        mock_close.assert_awaited_once()
+    
+    def test_node_clients_reused(self, mainnet_client):
+        """Test that each node URL gets a single client for the client's lifetime."""
+        other_url = XRPL_NETWORKS["mainnet"][1]
+        
+        assert mainnet_client._get_client(mainnet_client.rpc_url) is mainnet_client.client
+        assert mainnet_client._get_client(other_url) is mainnet_client._get_client(other_url)
 
 
 # =============================================================================
@@ -273,6 +432,138 @@ class TestMockedAPIRequests:
             assert lines[0]["currency"] == "USD"
             assert lines[0]["balance"] == "100.50"
     
+    @pytest.mark.asyncio
+    async def test_iter_trust_lines_follows_marker(self, xrpl_client):
+        """Test that trust line iteration pages through the result marker."""
+        first_page = MagicMock()
+        first_page.is_successful.return_value = True
+        first_page.result = {"lines": [{"currency": "USD"}, {"currency": "EUR"}], "marker": "m1"}
+        
+        last_page = MagicMock()
+        last_page.is_successful.return_value = True
+        last_page.result = {"lines": [{"currency": "BTC"}]}
+        
+        with patch.object(xrpl_client.client, 'request', new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = [first_page, last_page]
+            
+            lines = [
+                line async for line in
+                xrpl_client.iter_account_trust_lines("rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh")
+            ]
+        
+        assert [line["currency"] for line in lines] == ["USD", "EUR", "BTC"]
+        assert mock_request.call_args.args[0].marker == "m1"
+    
+    @pytest.mark.asyncio
+    async def test_get_all_transactions_fetches_slices(self, xrpl_client):
+        """Test that the history after the first page is fetched in ledger slices."""
+        def tx(ledger, name):
+            return {"tx": {"ledger_index": ledger, "hash": name}}
+        
+        async def fake_request(request):
+            response = MagicMock()
+            response.is_successful.return_value = True
+            if request.ledger_index_min == -1:
+                response.result = {
+                    "transactions": [tx(100, "a"), tx(99, "b"), tx(90, "c")],
+                    "ledger_index_min": 1,
+                    "ledger_index_max": 100,
+                    "marker": "m1",
+                }
+            elif request.ledger_index_min <= 90 <= request.ledger_index_max:
+                response.result = {"transactions": [tx(90, "c"), tx(90, "d"), tx(80, "e")]}
+            else:
+                response.result = {"transactions": []}
+            ranges.append((request.ledger_index_min, request.ledger_index_max))
+            return response
+        
+        ranges = []
+        with patch.object(xrpl_client.client, 'request', side_effect=fake_request):
+            transactions = await xrpl_client.get_all_account_transactions(
+                "rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh"
+            )
+        
+        assert [t["tx"]["hash"] for t in transactions] == ["a", "b", "c", "d", "e"]
+        assert len(ranges) == 1 + HISTORY_FETCH_SLICES
+        assert min(low for low, high in ranges[1:]) == 1
+        assert max(high for low, high in ranges[1:]) == 90
+    
+    @pytest.mark.asyncio
+    async def test_get_account_reserve(self, xrpl_client):
+        """Test reserve and available balance calculation."""
+        account_info = {"Balance": "25500000", "OwnerCount": 3}
+        server_info = {"validated_ledger": {"reserve_base_xrp": 10, "reserve_inc_xrp": 2}}
+        
+        with patch.object(xrpl_client, 'get_account_info', new_callable=AsyncMock) as mock_info, \
+                patch.object(xrpl_client, 'get_server_info', new_callable=AsyncMock) as mock_server:
+            mock_info.return_value = account_info
+            mock_server.return_value = server_info
+            
+            reserve = await xrpl_client.get_account_reserve("rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh")
+        
+        assert reserve["base_reserve"] == Decimal("10")
+        assert reserve["owner_reserve"] == Decimal("6")
+        assert reserve["total_reserve"] == Decimal("16")
+        assert reserve["total_balance"] == Decimal("25.5")
+        assert reserve["available_balance"] == Decimal("9.5")
+    
+    @pytest.mark.asyncio
+    async def test_get_token_balances_skips_zero_lines(self, xrpl_client):
+        """Test that only trust lines with a non-zero balance are returned."""
+        mock_response = MagicMock()
+        mock_response.is_successful.return_value = True
+        mock_response.result = {
+            "lines": [
+                {"account": "rIssuerA", "currency": "USD", "balance": "0"},
+                {"account": "rIssuerB", "currency": "EUR", "balance": "0.00"},
+                {"account": "rIssuerD", "currency": "JPY", "balance": "0E-15"},
+                {"account": "rIssuerE", "currency": "GBP", "balance": "-0e5"},
+                {"account": "rIssuerC", "currency": "BTC", "balance": "-1.5"},
+            ]
+        }
+        
+        with patch.object(xrpl_client.client, 'request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = mock_response
+            
+            balances = await xrpl_client.get_token_balances("rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh")
+        
+        assert balances == [{"currency": "BTC", "issuer": "rIssuerC", "balance": "-1.5"}]
+    
+    @pytest.mark.asyncio
+    async def test_reserve_from_known_account_info(self, xrpl_client):
+        """Test that passing account_info skips the account lookup."""
+        account_info = {"Balance": "25500000", "OwnerCount": 3}
+        server_info = {"validated_ledger": {"reserve_base_xrp": 10, "reserve_inc_xrp": 2}}
+        
+        with patch.object(xrpl_client, 'get_account_info', new_callable=AsyncMock) as mock_info, \
+                patch.object(xrpl_client, 'get_server_info', new_callable=AsyncMock) as mock_server:
+            mock_server.return_value = server_info
+            
+            reserve = await xrpl_client.get_account_reserve(
+                "rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh", account_info=account_info
+            )
+        
+        assert reserve["available_balance"] == Decimal("9.5")
+        mock_info.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_reserve_settings_reused(self, xrpl_client):
+        """Test that reserve settings are fetched once and may be fractional."""
+        account_info = {"Balance": "5000000", "OwnerCount": 3}
+        server_info = {"validated_ledger": {"reserve_base_xrp": 1, "reserve_inc_xrp": 0.2}}
+        
+        with patch.object(xrpl_client, 'get_account_info', new_callable=AsyncMock) as mock_info, \
+                patch.object(xrpl_client, 'get_server_info', new_callable=AsyncMock) as mock_server:
+            mock_info.return_value = account_info
+            mock_server.return_value = server_info
+            
+            await xrpl_client.get_account_reserve("rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh")
+            reserve = await xrpl_client.get_account_reserve("rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh")
+        
+        assert reserve["owner_reserve"] == Decimal("0.6")
+        assert reserve["available_balance"] == Decimal("3.4")
+        mock_server.assert_awaited_once()
+    
     @pytest.mark.asyncio
     async def test_get_server_info(self, xrpl_client):
         """Test server info fetch."""
@@ -298,6 +589,97 @@ class TestMockedAPIRequests:
             assert info is not None
             assert info["build_version"] == "1.9.4"
             assert info["server_state"] == "full"
+    
+    @pytest.mark.asyncio
+    async def test_repeated_query_served_from_cache(self, xrpl_client):
+        """Test that a repeat query within the TTL skips the network."""
+        mock_response = MagicMock()
+        mock_response.is_successful.return_value = True
+        mock_response.result = {"info": {"build_version": "1.9.4"}}
+        
+        with patch.object(xrpl_client.client, 'request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = mock_response
+            
+            first = await xrpl_client.get_server_info()
+            second = await xrpl_client.get_server_info()
+            
+            assert first is second
+            mock_request.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_background_refresh_serves_from_memory(self, xrpl_client):
+        """Test that start() keeps fee, server and ledger info warm until close()."""
+        mock_response = MagicMock()
+        mock_response.is_successful.return_value = True
+        mock_response.result = {
+            "drops": {"minimum_fee": "10", "median_fee": "5000", "open_ledger_fee": "10"},
+            "info": {"build_version": "1.9.4"},
+            "ledger": {"ledger_index": "80000000"},
+        }
+        
+        with patch.object(xrpl_client.client, 'request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = mock_response
+            
+            await xrpl_client.start()
+            await asyncio.sleep(0.01)
+            assert mock_request.await_count == 3
+            
+            # Past the fee TTL, but still fresh for the background refresher
+            with patch('xrpl_utils.time.monotonic', return_value=time.monotonic() + 2.0):
+                fee = await xrpl_client.get_current_fee()
+            ledger = await xrpl_client.get_ledger_info()
+            
+            await xrpl_client.close()
+        
+        assert fee["median_fee"] == "5000"
+        assert ledger["ledger_index"] == "80000000"
+        assert mock_request.await_count == 3
+        assert xrpl_client._refresh_task is None
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_share_one_request(self, xrpl_client):
+        """Test that identical concurrent queries are coalesced into one call."""
+        mock_response = MagicMock()
+        mock_response.is_successful.return_value = True
+        mock_response.result = {"info": {"build_version": "1.9.4"}}
+        
+        async def slow_request(_):
+            await asyncio.sleep(0.01)
+            return mock_response
+        
+        with patch.object(xrpl_client.client, 'request', new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = slow_request
+            
+            results = await asyncio.gather(*(xrpl_client.get_server_info() for _ in range(5)))
+        
+        assert all(info == {"build_version": "1.9.4"} for info in results)
+        mock_request.assert_awaited_once()
+        assert not xrpl_client._inflight
+    
+    @pytest.mark.asyncio
+    async def test_expired_result_served_on_failure(self, xrpl_client):
+        """Test that an expired cached result is returned if the refresh fails."""
+        from xrpl_utils import ACCOUNT_CACHE_TTL
+        
+        ok = MagicMock()
+        ok.is_successful.return_value = True
+        ok.result = {"info": {"build_version": "1.9.4"}}
+        
+        with patch.object(xrpl_client.client, 'request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = ok
+            await xrpl_client.get_server_info()
+            
+            # Age the entry past its TTL, then make the refresh fail
+            for key, (fetched_at, value) in list(xrpl_client._cache.items()):
+                xrpl_client._cache[key] = (fetched_at - ACCOUNT_CACHE_TTL - 1, value)
+            mock_request.side_effect = ConnectionError("down")
+            
+            with patch('asyncio.sleep', new_callable=AsyncMock):
+                info = await xrpl_client.get_server_info()
+            
+            assert info == {"build_version": "1.9.4"}
+            # The first fetch, then the failed refresh and its two retries
+            assert mock_request.await_count == 4
 
 
 # =============================================================================
@@ -322,6 +704,32 @@ class TestNetworkConfiguration:
         for network, urls in XRPL_NETWORKS.items():
             for url in urls:
                 assert url.startswith("https://"), f"Endpoint {url} should use HTTPS"
+    
+    @pytest.mark.asyncio
+    async def test_connectivity_probes_nodes_concurrently(self, xrpl_client):
+        """Test that a slow node times out without holding up the others."""
+        slow_url, fast_url = XRPL_NETWORKS["testnet"][:2]
+        
+        ok = MagicMock()
+        ok.is_successful.return_value = True
+        ok.result = {"info": {"build_version": "1.9.4"}}
+        
+        def make_client(url, get_session, max_requests):
+            async def request(_):
+                if url == slow_url:
+                    await asyncio.sleep(10)
+                return ok
+            
+            client = MagicMock()
+            client.request = request
+            return client
+        
+        with patch('xrpl_utils._PooledJsonRpcClient', side_effect=make_client), \
+                patch('xrpl_utils.CONNECTIVITY_TIMEOUT', 0.05):
+            results = await xrpl_client.test_connectivity()
+        
+        assert results[slow_url]["success"] is False
+        assert results[fast_url]["success"] is True
 
 
 # =============================================================================
@@ -354,6 +762,149 @@ class TestRetryLogic:
             # Should have retried and eventually succeeded
             assert call_count == 3
             assert balance == Decimal("1")
+    
+    @pytest.mark.asyncio
+    async def test_transient_error_retried_on_same_node(self, xrpl_client):
+        """Test that a transient network error is retried before failing over."""
+        ok = MagicMock()
+        ok.is_successful.return_value = True
+        ok.result = {"account_data": {"Balance": "2000000"}}
+        
+        with patch.object(xrpl_client.client, 'request', new_callable=AsyncMock) as mock_request, \
+                patch('xrpl_utils.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            mock_request.side_effect = [ConnectionError("blip"), ok]
+            
+            info = await xrpl_client.get_account_info("rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh")
+        
+        assert info == {"Balance": "2000000"}
+        assert mock_request.await_count == 2
+        mock_sleep.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_query_retries_transient_error(self, xrpl_client):
+        """Test that a network blip in a query is retried instead of returning None."""
+        ok = MagicMock()
+        ok.is_successful.return_value = True
+        ok.result = {"drops": {"minimum_fee": "10", "median_fee": "5000", "open_ledger_fee": "10"}}
+        
+        with patch.object(xrpl_client.client, 'request', new_callable=AsyncMock) as mock_request, \
+                patch('xrpl_utils.asyncio.sleep', new_callable=AsyncMock):
+            mock_request.side_effect = [TimeoutError("blip"), ok]
+            
+            fee = await xrpl_client.get_current_fee()
+        
+        assert fee["median_fee"] == "5000"
+        assert mock_request.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_failover_uses_fastest_node(self, mainnet_client):
+        """Test that failover races the other nodes and keeps the first to answer."""
+        primary = mainnet_client.client
+        slow_url, fast_url = XRPL_NETWORKS["mainnet"][1:3]
+        
+        def make_client(url, get_session, max_requests):
+            client = MagicMock()
+            client.url = url
+            return client
+        
+        async def try_node(address, strict, client):
+            if client is primary:
+                return None
+            if client.url == slow_url:
+                await asyncio.sleep(10)
+            if client.url == fast_url:
+                return {"Balance": "1000000"}
+            return None
+        
+        with patch('xrpl_utils._PooledJsonRpcClient', side_effect=make_client), \
+                patch.object(mainnet_client, '_try_get_account_info', side_effect=try_node):
+            info = await mainnet_client.get_account_info("rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh")
+        
+        assert info == {"Balance": "1000000"}
+        assert mainnet_client.rpc_url == fast_url
+        assert mainnet_client.client.url == fast_url
+    
+    @pytest.mark.asyncio
+    async def test_failover_race_waits_for_cancelled_nodes(self, mainnet_client):
+        """Test that the losing lookups have unwound by the time the race returns."""
+        slow_url, fast_url = XRPL_NETWORKS["mainnet"][1:3]
+        cancelled = []
+        
+        async def timed_lookup(address, strict, url):
+            if url == fast_url:
+                return {"Balance": "1000000"}
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(url)
+                raise
+        
+        with patch('xrpl_utils._PooledJsonRpcClient'), \
+                patch.object(mainnet_client, '_timed_account_info', side_effect=timed_lookup):
+            winner = await mainnet_client._race_account_info(
+                "rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh", False, [slow_url, fast_url]
+            )
+        
+        assert winner[0] == fast_url
+        assert cancelled == [slow_url]
+    
+    @pytest.mark.asyncio
+    async def test_failover_prefers_low_latency_nodes(self, mainnet_client):
+        """Test that failover tries the nodes with the best latency first."""
+        primary = mainnet_client.client
+        best_url = XRPL_NETWORKS["mainnet"][-1]
+        mainnet_client._node_latency[best_url] = 0.01
+        tried = []
+        
+        def make_client(url, get_session, max_requests):
+            client = MagicMock()
+            client.url = url
+            return client
+        
+        async def try_node(address, strict, client):
+            if client is not primary:
+                tried.append(client.url)
+            return None
+        
+        with patch('xrpl_utils._PooledJsonRpcClient', side_effect=make_client), \
+                patch.object(mainnet_client, '_try_get_account_info', side_effect=try_node):
+            info = await mainnet_client.get_account_info("rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh")
+        
+        assert info is None
+        assert best_url in tried[:2]
+        assert len(tried) == len(XRPL_NETWORKS["mainnet"]) - 1
+    
+    @pytest.mark.asyncio
+    async def test_not_found_not_retried_without_strict(self, mainnet_client):
+        """Test that each node gets a single lookup using the caller's strict flag."""
+        primary = mainnet_client.client
+        calls = []
+        
+        async def try_node(address, strict, client):
+            calls.append((client is primary, strict))
+            return None
+        
+        with patch('xrpl_utils._PooledJsonRpcClient', side_effect=lambda *args: MagicMock()), \
+                patch.object(mainnet_client, '_try_get_account_info', side_effect=try_node):
+            await mainnet_client.get_account_info("rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh")
+        
+        assert calls[0] == (True, True)
+        assert all(strict is True for is_primary, strict in calls)
+        assert len(calls) == len(XRPL_NETWORKS["mainnet"])
+    
+    @pytest.mark.asyncio
+    async def test_unreachable_node_skipped_while_circuit_open(self, xrpl_client):
+        """Test that a node that failed to answer is not asked again right away."""
+        from xrpl_utils import _NodeUnavailable
+        
+        with patch.object(xrpl_client, '_try_get_account_info', new_callable=AsyncMock) as mock_try:
+            mock_try.side_effect = _NodeUnavailable("down")
+            
+            await xrpl_client._timed_account_info("rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh", True, xrpl_client.rpc_url)
+            result = await xrpl_client._timed_account_info("rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh", True, xrpl_client.rpc_url)
+        
+        assert result is None
+        assert mock_try.await_count == 1
 
 
 # =============================================================================
@@ -382,6 +933,222 @@ class TestWalletSummary:
             summary = await xrpl_client.get_wallet_summary("rN7n3473SaZBCG4dFL83w7a1RXtXtbk2D9")
             
             assert "not found" in summary.lower() or "not activated" in summary.lower()
+    
+    @pytest.mark.asyncio
+    async def test_wallet_summary_includes_reserves(self, xrpl_client):
+        """Test that the summary shows reserves from a single server_info fetch."""
+        account_info = {"Balance": "25500000", "Sequence": 7, "OwnerCount": 3}
+        server_info = {"validated_ledger": {"reserve_base_xrp": 10, "reserve_inc_xrp": 2}}
+        
+        with patch.object(xrpl_client, 'get_account_info', new_callable=AsyncMock) as mock_info, \
+                patch.object(xrpl_client, 'get_server_info', new_callable=AsyncMock) as mock_server:
+            mock_info.return_value = account_info
+            mock_server.return_value = server_info
+            
+            summary = await xrpl_client.get_wallet_summary("rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh")
+        
+        assert "**Available:** 9.500000 XRP" in summary
+        mock_server.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_wallet_summaries_fetched_together(self, xrpl_client):
+        """Test that several summaries share one accounts lookup and reserve fetch."""
+        server_info = {"validated_ledger": {"reserve_base_xrp": 10, "reserve_inc_xrp": 2}}
+        accounts = {
+            "rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh": {"Balance": "25500000", "Sequence": 7, "OwnerCount": 3},
+            "rPT1Sjq2YGrBMTttX4GZHjKu9dyfzbpAYe": None,
+        }
+        
+        with patch.object(xrpl_client, 'get_accounts_info', new_callable=AsyncMock) as mock_accounts, \
+                patch.object(xrpl_client, 'get_server_info', new_callable=AsyncMock) as mock_server:
+            mock_accounts.return_value = accounts
+            mock_server.return_value = server_info
+            
+            summaries = await xrpl_client.get_wallet_summaries(
+                ["rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh", "invalid", "rPT1Sjq2YGrBMTttX4GZHjKu9dyfzbpAYe"]
+            )
+        
+        assert "**Available:** 9.500000 XRP" in summaries["rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh"]
+        assert "Invalid XRP address" in summaries["invalid"]
+        assert "not found" in summaries["rPT1Sjq2YGrBMTttX4GZHjKu9dyfzbpAYe"]
+        mock_accounts.assert_awaited_once_with(list(accounts))
+        mock_server.assert_awaited_once()
+
+
+# =============================================================================
+# BATCH QUERY TESTS
+# =============================================================================
+
+class TestBatchQueries:
+    """Tests for batched multi-account lookups."""
+    
+    @pytest.mark.asyncio
+    async def test_accounts_info_sent_as_one_batch(self, xrpl_client):
+        """Test that uncached accounts are fetched in one batch and then cached."""
+        found = MagicMock()
+        found.is_successful.return_value = True
+        found.result = {"account_data": {"Balance": "1000000"}}
+        not_found = MagicMock()
+        not_found.is_successful.return_value = False
+        not_found.result = {"error": "actNotFound"}
+        
+        addresses = [
+            "rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh",
+            "invalid",
+            "rPT1Sjq2YGrBMTttX4GZHjKu9dyfzbpAYe",
+        ]
+        
+        with patch.object(xrpl_client, 'batch_request', new_callable=AsyncMock) as mock_batch:
+            mock_batch.return_value = [found, not_found]
+            
+            exists = await xrpl_client.check_accounts_exist(addresses)
+            cached = await xrpl_client.get_account_info("rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh")
+        
+        assert exists == {
+            "rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh": True,
+            "invalid": False,
+            "rPT1Sjq2YGrBMTttX4GZHjKu9dyfzbpAYe": False,
+        }
+        assert cached == {"Balance": "1000000"}
+        mock_batch.assert_awaited_once()
+        assert len(mock_batch.call_args.args[0]) == 2
+    
+    @pytest.mark.asyncio
+    async def test_rejected_batch_sent_individually(self, xrpl_client):
+        """Test that a batch the node rejects falls back to single requests."""
+        requests = [MagicMock(name=f"request{i}") for i in range(3)]
+        
+        with patch.object(xrpl_client, '_post_batch', new_callable=AsyncMock) as mock_post, \
+                patch.object(xrpl_client.client, 'request', new_callable=AsyncMock) as mock_request:
+            mock_post.side_effect = ValueError("expected a JSON array, got dict")
+            mock_request.side_effect = lambda request: f"response to {request}"
+            
+            responses = await xrpl_client.batch_request(requests)
+            await xrpl_client.batch_request(requests)
+        
+        assert responses == [f"response to {request}" for request in requests]
+        # The node is not sent another batch once it has rejected one
+        mock_post.assert_awaited_once()
+        assert mock_request.await_count == 2 * len(requests)
+    
+    @pytest.mark.asyncio
+    async def test_batch_client_error_status_is_a_rejection(self, xrpl_client):
+        """Test that a 4xx answer to a batch stops further batches to the node."""
+        aiohttp = pytest.importorskip("aiohttp")
+        requests = [MagicMock(name=f"request{i}") for i in range(2)]
+        
+        with patch.object(xrpl_client, '_post_batch', new_callable=AsyncMock) as mock_post, \
+                patch.object(xrpl_client.client, 'request', new_callable=AsyncMock) as mock_request:
+            mock_post.side_effect = aiohttp.ClientResponseError(MagicMock(), (), status=400)
+            mock_request.side_effect = lambda request: f"response to {request}"
+            
+            await xrpl_client.batch_request(requests)
+            await xrpl_client.batch_request(requests)
+        
+        mock_post.assert_awaited_once()
+        assert xrpl_client.rpc_url in xrpl_client._batch_unsupported
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status", [None, 429, 503])
+    async def test_batch_network_error_not_a_rejection(self, xrpl_client, status):
+        """Test that a transient failure doesn't stop later batches."""
+        aiohttp = pytest.importorskip("aiohttp")
+        if status is None:
+            error = aiohttp.ServerDisconnectedError()
+        else:
+            error = aiohttp.ClientResponseError(MagicMock(), (), status=status)
+        requests = [MagicMock(name=f"request{i}") for i in range(2)]
+        
+        with patch.object(xrpl_client, '_post_batch', new_callable=AsyncMock) as mock_post, \
+                patch.object(xrpl_client.client, 'request', new_callable=AsyncMock) as mock_request:
+            mock_post.side_effect = [error, ["a", "b"]]
+            mock_request.side_effect = lambda request: f"response to {request}"
+            
+            await xrpl_client.batch_request(requests)
+            responses = await xrpl_client.batch_request(requests)
+        
+        assert responses == ["a", "b"]
+        assert mock_post.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_account_info_with_ledger(self, xrpl_client):
+        """Test that the ledger index comes from the same AccountInfo response."""
+        mock_response = MagicMock()
+        mock_response.is_successful.return_value = True
+        mock_response.result = {
+            "account_data": {"Balance": "1000000"},
+            "ledger_index": 80000000,
+            "validated": True,
+        }
+        
+        with patch.object(xrpl_client.client, 'request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = mock_response
+            
+            result = await xrpl_client.get_account_info_with_ledger("rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh")
+        
+        assert result == ({"Balance": "1000000"}, 80000000)
+        mock_request.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_account_exists_fails_over_on_busy_node(self, mainnet_client):
+        """Test that an error from the current node doesn't read as a missing account."""
+        primary = mainnet_client.client
+        busy = MagicMock()
+        busy.is_successful.return_value = False
+        busy.result = {"error": "tooBusy"}
+        found = MagicMock()
+        found.is_successful.return_value = True
+        found.result = {"account_data": {"Balance": "1000000"}}
+        
+        def make_client(url, get_session, max_requests):
+            client = MagicMock()
+            client.request = AsyncMock(return_value=found)
+            return client
+        
+        with patch('xrpl_utils._PooledJsonRpcClient', side_effect=make_client), \
+                patch.object(primary, 'request', new_callable=AsyncMock) as mock_primary:
+            mock_primary.return_value = busy
+            
+            exists = await mainnet_client.check_account_exists("rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh")
+        
+        assert exists is True
+        mock_primary.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_gather_with_concurrency_limits_in_flight(self):
+        """Test that at most n awaitables run at once and order is kept."""
+        from xrpl_utils import gather_with_concurrency
+        
+        running = 0
+        peak = 0
+        
+        async def job(i):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return i
+        
+        results = await gather_with_concurrency(3, *(job(i) for i in range(10)))
+        
+        assert results == list(range(10))
+        assert peak == 3
+    
+    @pytest.mark.asyncio
+    async def test_long_batches_split(self, xrpl_client):
+        """Test that more than BATCH_MAX_REQUESTS requests go out in chunks."""
+        from xrpl_utils import BATCH_MAX_REQUESTS
+        
+        requests = list(range(BATCH_MAX_REQUESTS + 1))
+        
+        with patch.object(xrpl_client, '_post_batch', new_callable=AsyncMock) as mock_post:
+            mock_post.side_effect = lambda chunk: list(chunk)
+            
+            responses = await xrpl_client.batch_request(requests)
+        
+        assert responses == requests
+        assert [len(call.args[0]) for call in mock_post.call_args_list] == [BATCH_MAX_REQUESTS, 1]
 
 
 if __name__ == "__main__":
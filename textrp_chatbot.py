@@ -264,7 +264,7 @@ class TextRPChatbot:
         try:
             # Extract just the localpart (everything between @ and :)
             localpart = self.username.split('@')[1].split(':')[0]
-            logger.debug(f"Registering with localpart: {localpart}")
+            logger.debug("Registering with localpart: %s", localpart)
             
             # Try to register the user - register() doesn't take user parameter
             # We need to create a new client for registration
@@ -380,7 +380,7 @@ class TextRPChatbot:
             self.client.access_token = self.access_token
             
             # Verify token is set
-            logger.debug(f"Token set on client: {self.client.access_token[:20] if self.client.access_token else 'None'}...")
+            logger.debug("Token set on client: %s...", self.client.access_token[:20] if self.client.access_token else None)
             
             # Validate the token by checking who we are
             logger.info("Validating token with /whoami...")
@@ -806,7 +806,7 @@ class TextRPChatbot:
                 logger.error(f"Failed to send message: {response.message}")
                 return None
             
-            logger.debug(f"Message sent to {room_id}: {message[:50]}...")
+            logger.debug("Message sent to %s: %s...", room_id, message[:50])
             return response.event_id
         
         return await _send()
@@ -1715,7 +1715,7 @@ class TextRPChatbot:
                     return False
             
             # Perform sync
-            logger.debug(f"Syncing with token: {self.client.access_token[:20]}...")
+            logger.debug("Syncing with token: %s...", self.client.access_token[:20])
             response = await self.client.sync(timeout=timeout)
             
             if isinstance(response, SyncError):
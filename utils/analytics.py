@@ -526,8 +526,11 @@ def log_api_request(
     params: Optional[Dict[str, Any]] = None,
 ) -> None:
     """Log outgoing API request."""
+    # Skip serializing params when nobody will see them
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     params_str = json.dumps(params)[:200] if params else ""
-    logger.debug(f"API_REQ | api={api} | endpoint={endpoint} | params={params_str}")
+    logger.debug("API_REQ | api=%s | endpoint=%s | params=%s", api, endpoint, params_str)
 
 
 def log_api_response(
@@ -539,6 +542,6 @@ def log_api_response(
 ) -> None:
     """Log API response."""
     logger.debug(
-        f"API_RESP | api={api} | endpoint={endpoint} | success={success} | "
-        f"status={status_code} | duration={duration_ms:.2f}ms"
+        "API_RESP | api=%s | endpoint=%s | success=%s | status=%s | duration=%.2fms",
+        api, endpoint, success, status_code, duration_ms,
     )
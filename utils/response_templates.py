@@ -11,10 +11,11 @@ Usage:
     msg = template.success("Operation completed", details={"key": "value"})
 """
 
+import functools
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +62,84 @@ class Emoji:
     STAR = "⭐"
 
 
+# Transaction status (lowercased) -> status emoji; anything else is pending
+_STATUS_EMOJI: Dict[str, str] = {
+    "success": Emoji.SUCCESS,
+    "failed": Emoji.ERROR,
+    "pending": Emoji.PENDING,
+    "submitted": Emoji.PENDING,
+}
+
+
+def _short_id(value: str) -> str:
+    """Abbreviate a hash/token ID to its first 16 and last 8 characters."""
+    # Abbreviating 24 characters or fewer wouldn't save anything
+    if len(value) <= 24:
+        return value
+    return value[:16] + "..." + value[-8:]
+
+
+# snake_case -> "Title Case" key formatting for detail lines
+_KEY_TRANS = str.maketrans("_", " ")
+
+
+@functools.lru_cache(maxsize=256)
+def _format_key(key: str) -> str:
+    """Format a snake_case key as a display label (e.g. owner_count -> Owner Count)."""
+    return key.translate(_KEY_TRANS).title()
+
+
+def _format_details(details: Dict[str, Any]) -> str:
+    """Render key/value pairs as `**Key Name:** value` lines, each prefixed by a newline."""
+    return "".join(
+        f"\n**{_format_key(key)}:** {value}"
+        for key, value in details.items()
+    )
+
+
+# Loading, info and help responses are rebuilt with the same arguments over
+# and over (a fixed command set, a handful of status messages), so the
+# rendered strings are memoized at module level.
+
+@functools.lru_cache(maxsize=256)
+def _render_loading(message: str) -> str:
+    """Render (and cache) a loading message."""
+    return f"{Emoji.LOADING} {message}"
+
+
+@functools.lru_cache(maxsize=256)
+def _render_info(message: str, title: Optional[str]) -> str:
+    """Render (and cache) an informational message."""
+    if title:
+        return f"{Emoji.INFO} **{title}**\n\n{message}"
+    return f"{Emoji.INFO} {message}"
+
+
+@functools.lru_cache(maxsize=128)
+def _render_help(
+    separator: str,
+    command: str,
+    description: str,
+    usage: str,
+    examples: Tuple[str, ...],
+) -> str:
+    """Render (and cache) command help text."""
+    parts = [
+        f"**{Emoji.INFO} Command: {command}**",
+        separator,
+        "",
+        f"**Description:** {description}",
+        f"**Usage:** `{usage}`",
+    ]
+    
+    if examples:
+        parts.append("\n**Examples:**")
+        for example in examples:
+            parts.append(f"  • `{example}`")
+    
+    return "\n".join(parts)
+
+
 # =============================================================================
 # RESPONSE TEMPLATES
 # =============================================================================
@@ -108,13 +187,11 @@ class ResponseTemplate:
         
         parts.append(message)
         
+        text = "\n".join(parts)
         if details:
-            parts.append("")
-            for key, value in details.items():
-                formatted_key = key.replace("_", " ").title()
-                parts.append(f"**{formatted_key}:** {value}")
+            text += "\n" + _format_details(details)
         
-        return "\n".join(parts)
+        return text
     
     def error(
         self,
@@ -185,13 +262,11 @@ class ResponseTemplate:
         Returns:
             Formatted info message
         """
-        if title:
-            return f"{Emoji.INFO} **{title}**\n\n{message}"
-        return f"{Emoji.INFO} {message}"
+        return _render_info(message, title)
     
     def loading(self, message: str = "Processing...") -> str:
         """Generate a loading/processing message."""
-        return f"{Emoji.LOADING} {message}"
+        return _render_loading(message)
     
     def wallet_info(
         self,
@@ -221,11 +296,7 @@ class ResponseTemplate:
             f"**Balance:** {balance}",
         ]
         
-        for key, value in extra.items():
-            formatted_key = key.replace("_", " ").title()
-            parts.append(f"**{formatted_key}:** {value}")
-        
-        return "\n".join(parts)
+        return "\n".join(parts) + _format_details(extra)
     
     def transaction_info(
         self,
@@ -250,13 +321,13 @@ class ResponseTemplate:
         Returns:
             Formatted transaction info
         """
-        status_emoji = Emoji.SUCCESS if status.lower() == "success" else Emoji.PENDING
+        status_emoji = _STATUS_EMOJI.get(status.lower(), Emoji.PENDING)
         
         parts = [
             f"**{status_emoji} Transaction Details**",
             self.separator,
             "",
-            f"**Hash:** `{tx_hash[:16]}...{tx_hash[-8:]}`",
+            f"**Hash:** `{_short_id(tx_hash)}`",
             f"**Status:** {status}",
         ]
         
@@ -267,11 +338,7 @@ class ResponseTemplate:
         if to_address:
             parts.append(f"**To:** `{to_address}`")
         
-        for key, value in extra.items():
-            formatted_key = key.replace("_", " ").title()
-            parts.append(f"**{formatted_key}:** {value}")
-        
-        return "\n".join(parts)
+        return "\n".join(parts) + _format_details(extra)
     
     def list_items(
         self,
@@ -321,20 +388,13 @@ class ResponseTemplate:
         Returns:
             Formatted help text
         """
-        parts = [
-            f"**{Emoji.INFO} Command: {command}**",
+        return _render_help(
             self.separator,
-            "",
-            f"**Description:** {description}",
-            f"**Usage:** `{usage}`",
-        ]
-        
-        if examples:
-            parts.append("\n**Examples:**")
-            for example in examples:
-                parts.append(f"  • `{example}`")
-        
-        return "\n".join(parts)
+            command,
+            description,
+            usage,
+            tuple(examples) if examples else (),
+        )
     
     def nft_info(
         self,
@@ -365,7 +425,7 @@ class ResponseTemplate:
             f"**🖼️ NFT Details**",
             self.separator,
             "",
-            f"**Token ID:** `{nft_id[:16]}...{nft_id[-8:]}`",
+            f"**Token ID:** `{_short_id(nft_id)}`",
             f"**Issuer:** `{issuer}`",
             f"**Taxon:** {taxon}",
             f"**Serial:** {serial}",
@@ -376,11 +436,7 @@ class ResponseTemplate:
         if flags is not None:
             parts.append(f"**Flags:** {flags}")
         
-        for key, value in extra.items():
-            formatted_key = key.replace("_", " ").title()
-            parts.append(f"**{formatted_key}:** {value}")
-        
-        return "\n".join(parts)
+        return "\n".join(parts) + _format_details(extra)
     
     def trust_line_info(
         self,
@@ -413,11 +469,7 @@ class ResponseTemplate:
             f"**Limit:** {limit}",
         ]
         
-        for key, value in extra.items():
-            formatted_key = key.replace("_", " ").title()
-            parts.append(f"**{formatted_key}:** {value}")
-        
-        return "\n".join(parts)
+        return "\n".join(parts) + _format_details(extra)
 
 
 # =============================================================================
@@ -427,10 +479,15 @@ class ResponseTemplate:
 # Default template instance
 _default_template = ResponseTemplate()
 
-
-def format_success(message: str, **details: Any) -> str:
-    """Quick success message formatting."""
-    return _default_template.success(message, **details)
+# Helpers whose signature matches the template method are bound directly,
+# so a call goes straight to the method without an extra wrapper frame.
+format_success = _default_template.success          # Quick success message formatting
+format_warning = _default_template.warning          # Quick warning message formatting
+format_info = _default_template.info                # Quick info message formatting
+format_loading = _default_template.loading          # Quick loading message formatting
+format_wallet = _default_template.wallet_info       # Quick wallet info formatting
+format_nft = _default_template.nft_info             # Quick NFT info formatting
+format_trust_line = _default_template.trust_line_info  # Quick trust line info formatting
 
 
 def format_error(
@@ -438,56 +495,11 @@ def format_error(
     suggestion: Optional[str] = None,
 ) -> str:
     """Quick error message formatting."""
+    # Kept as a function: the second positional argument is the suggestion
+    # here but the error code on ResponseTemplate.error.
     return _default_template.error(message, suggestion=suggestion)
 
 
-def format_warning(message: str) -> str:
-    """Quick warning message formatting."""
-    return _default_template.warning(message)
-
-
-def format_info(message: str, title: Optional[str] = None) -> str:
-    """Quick info message formatting."""
-    return _default_template.info(message, title=title)
-
-
-def format_loading(message: str = "Processing...") -> str:
-    """Quick loading message formatting."""
-    return _default_template.loading(message)
-
-
-def format_wallet(
-    address: str,
-    balance: str,
-    network: str = "mainnet",
-    **extra: Any,
-) -> str:
-    """Quick wallet info formatting."""
-    return _default_template.wallet_info(address, balance, network, **extra)
-
-
-def format_nft(
-    nft_id: str,
-    issuer: str,
-    taxon: int,
-    serial: int,
-    **extra: Any,
-) -> str:
-    """Quick NFT info formatting."""
-    return _default_template.nft_info(nft_id, issuer, taxon, serial, **extra)
-
-
-def format_trust_line(
-    currency: str,
-    issuer: str,
-    balance: str,
-    limit: str,
-    **extra: Any,
-) -> str:
-    """Quick trust line info formatting."""
-    return _default_template.trust_line_info(currency, issuer, balance, limit, **extra)
-
-
 # =============================================================================
 # ARGUMENT PARSING UTILITIES
 # =============================================================================
@@ -499,12 +511,16 @@ class ParsedArgs:
     
     Attributes:
         positional: List of positional arguments
-        flags: Set of flag arguments (e.g., --verbose)
+        flags: Frozen set of flag names without dashes (e.g., --verbose -> 'verbose')
         options: Dict of option arguments (e.g., --limit=10)
         raw: Original raw argument string
     """
+    # One of these is built per incoming command; slots drop the per-instance
+    # __dict__. Safe to declare by hand since no field has a default.
+    __slots__ = ("positional", "flags", "options", "raw")
+    
     positional: List[str]
-    flags: set
+    flags: FrozenSet[str]
     options: Dict[str, str]
     raw: str
     
@@ -515,8 +531,9 @@ class ParsedArgs:
         return self.options.get(key, default)
     
     def has_flag(self, flag: str) -> bool:
-        """Check if a flag is present."""
-        return flag.lstrip('-') in self.flags
+        """Check if a flag is present (accepts 'verbose', '--verbose' or '-v')."""
+        # Callers usually pass the bare name, which needs no stripping
+        return flag in self.flags or flag.lstrip('-') in self.flags
     
     @property
     def first(self) -> Optional[str]:
@@ -548,40 +565,48 @@ def parse_command_args(args_string: str) -> ParsedArgs:
     Example:
         args = parse_command_args('New York --detailed --days=5')
         # args.positional = ['New', 'York']
-        # args.flags = {'detailed'}
+        # args.flags = frozenset({'detailed'})
         # args.options = {'days': '5'}
     """
     positional = []
-    flags = set()
+    flags: List[str] = []
     options = {}
     
-    # Handle quoted strings
+    # Handle quoted strings. Tokens are sliced out of args_string rather
+    # than built up character by character; `pieces` holds the text before
+    # an open quote (e.g. the `a` in `a"b c"`) and is joined and cleared
+    # when the quote closes, so it is always empty outside quotes.
     tokens = []
-    current_token = ""
+    pieces: List[str] = []
+    start = 0
     in_quotes = False
     quote_char = None
     
-    for char in args_string:
+    for i, char in enumerate(args_string):
         if char in '"\'':
             if not in_quotes:
                 in_quotes = True
                 quote_char = char
+                pieces.append(args_string[start:i])
+                start = i + 1
             elif char == quote_char:
                 in_quotes = False
-                if current_token:
-                    tokens.append(current_token)
-                    current_token = ""
-            else:
-                current_token += char
+                pieces.append(args_string[start:i])
+                start = i + 1
+                token = "".join(pieces)
+                pieces.clear()
+                if token:
+                    tokens.append(token)
         elif char == ' ' and not in_quotes:
-            if current_token:
-                tokens.append(current_token)
-                current_token = ""
-        else:
-            current_token += char
+            token = args_string[start:i]
+            start = i + 1
+            if token:
+                tokens.append(token)
     
-    if current_token:
-        tokens.append(current_token)
+    pieces.append(args_string[start:])
+    token = "".join(pieces)
+    if token:
+        tokens.append(token)
     
     # Process tokens
     i = 0
@@ -589,16 +614,17 @@ def parse_command_args(args_string: str) -> ParsedArgs:
         token = tokens[i]
         
         if token.startswith('--'):
-            if '=' in token:
-                key, value = token[2:].split('=', 1)
+            name = token[2:]
+            key, sep, value = name.partition('=')
+            if sep:
                 options[key] = value
             elif i + 1 < len(tokens) and not tokens[i + 1].startswith('-'):
-                options[token[2:]] = tokens[i + 1]
+                options[name] = tokens[i + 1]
                 i += 1
             else:
-                flags.add(token[2:])
+                flags.append(name)
         elif token.startswith('-') and len(token) == 2:
-            flags.add(token[1:])
+            flags.append(token[1:])
         else:
             positional.append(token)
         
@@ -606,7 +632,7 @@ def parse_command_args(args_string: str) -> ParsedArgs:
     
     return ParsedArgs(
         positional=positional,
-        flags=flags,
+        flags=frozenset(flags),
         options=options,
         raw=args_string,
     )
@@ -16,9 +16,10 @@ import asyncio
 import functools
 import logging
 import random
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import (
     Any,
+    AsyncIterator,
     Callable,
     Optional,
     Tuple,
@@ -32,6 +33,21 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+# Common exception sets for different APIs. They are currently identical,
+# so every name refers to the same tuple; give an API its own tuple only
+# when its retry policy actually diverges.
+NETWORK_EXCEPTIONS: Tuple[Type[Exception], ...] = (
+    ConnectionError,
+    TimeoutError,
+    asyncio.TimeoutError,
+    OSError,
+)
+
+XRPL_RETRY_EXCEPTIONS: Tuple[Type[Exception], ...] = NETWORK_EXCEPTIONS
+WEATHER_RETRY_EXCEPTIONS: Tuple[Type[Exception], ...] = NETWORK_EXCEPTIONS
+TEXTRP_RETRY_EXCEPTIONS: Tuple[Type[Exception], ...] = NETWORK_EXCEPTIONS
+
+
 @dataclass
 class RetryConfig:
     """
@@ -53,45 +69,30 @@ class RetryConfig:
     exponential_base: float = 2.0
     jitter: bool = True
     jitter_range: float = 0.25
-    retry_exceptions: Tuple[Type[Exception], ...] = field(
-        default_factory=lambda: (
-            ConnectionError,
-            TimeoutError,
-            asyncio.TimeoutError,
-            OSError,
-        )
-    )
+    retry_exceptions: Tuple[Type[Exception], ...] = NETWORK_EXCEPTIONS
     on_retry: Optional[Callable[[Exception, int, float], None]] = None
 
 
-# Common exception sets for different APIs
-NETWORK_EXCEPTIONS: Tuple[Type[Exception], ...] = (
-    ConnectionError,
-    TimeoutError,
-    asyncio.TimeoutError,
-    OSError,
-)
+def _backoff_schedule(config: RetryConfig) -> Tuple[float, ...]:
+    """
+    Precompute the capped (un-jittered) delay for every retry attempt.
+    
+    Args:
+        config: Retry configuration
+        
+    Returns:
+        Tuple of delays in seconds, indexed by attempt number (0-indexed)
+    """
+    return tuple(
+        min(config.base_delay * (config.exponential_base ** attempt), config.max_delay)
+        for attempt in range(config.max_attempts)
+    )
 
-XRPL_RETRY_EXCEPTIONS: Tuple[Type[Exception], ...] = (
-    ConnectionError,
-    TimeoutError,
-    asyncio.TimeoutError,
-    OSError,
-)
 
-WEATHER_RETRY_EXCEPTIONS: Tuple[Type[Exception], ...] = (
-    ConnectionError,
-    TimeoutError,
-    asyncio.TimeoutError,
-    OSError,
-)
-
-TEXTRP_RETRY_EXCEPTIONS: Tuple[Type[Exception], ...] = (
-    ConnectionError,
-    TimeoutError,
-    asyncio.TimeoutError,
-    OSError,
-)
+def _apply_jitter(delay: float, jitter_range: float) -> float:
+    """Spread a delay by +/- jitter_range of itself, never below 0.1s."""
+    delay += (random.random() * 2.0 - 1.0) * delay * jitter_range
+    return delay if delay > 0.1 else 0.1
 
 
 def calculate_delay(
@@ -108,17 +109,12 @@ def calculate_delay(
     Returns:
         float: Delay in seconds
     """
-    # Exponential backoff: base_delay * (exponential_base ^ attempt)
-    delay = config.base_delay * (config.exponential_base ** attempt)
-    
-    # Cap at max delay
-    delay = min(delay, config.max_delay)
+    # Exponential backoff: base_delay * (exponential_base ^ attempt), capped
+    delay = min(config.base_delay * (config.exponential_base ** attempt), config.max_delay)
     
     # Add jitter if enabled
     if config.jitter:
-        jitter_amount = delay * config.jitter_range
-        delay = delay + random.uniform(-jitter_amount, jitter_amount)
-        delay = max(0.1, delay)  # Ensure minimum delay
+        delay = _apply_jitter(delay, config.jitter_range)
     
     return delay
 
@@ -147,11 +143,18 @@ def retry_async(
     Returns:
         Decorated async function with retry logic
         
+    Raises:
+        ValueError: If max_attempts is less than 1
+        
     Example:
         @retry_async(max_attempts=3, base_delay=1.0)
         async def fetch_from_api():
             return await api.get_data()
     """
+    # The wrapper always makes a first attempt, so fewer than one can't be honored
+    if max_attempts < 1:
+        raise ValueError(f"max_attempts must be at least 1, got {max_attempts}")
+    
     if retry_exceptions is None:
         retry_exceptions = NETWORK_EXCEPTIONS
     
@@ -165,55 +168,108 @@ def retry_async(
         on_retry=on_retry,
     )
     
+    # The schedule only depends on the config, so compute it once here
+    # instead of on every retry.
+    delays = _backoff_schedule(config)
+    
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        # Bind everything the wrapper reads into closure locals once,
+        # rather than looking them up on config/func for every call.
+        retry_excs = config.retry_exceptions
+        max_attempts = config.max_attempts
+        on_retry_cb = config.on_retry
+        jitter_range = config.jitter_range if config.jitter else None
+        func_name = func.__name__
+        
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> T:
-            last_exception: Optional[Exception] = None
+            # Fast path: most calls succeed on the first attempt, so try
+            # once before setting up any of the retry machinery.
+            try:
+                return await func(*args, **kwargs)
+            except retry_excs as e:
+                last_exception: Exception = e
             
-            for attempt in range(config.max_attempts):
+            # Slow path: back off and retry the remaining attempts
+            for attempt in range(1, max_attempts):
+                delay = delays[attempt - 1]
+                if jitter_range is not None:
+                    delay = _apply_jitter(delay, jitter_range)
+                
+                logger.warning(
+                    "Retry %d/%d for %s: %s: %s. Waiting %.2fs...",
+                    attempt, max_attempts, func_name,
+                    type(last_exception).__name__, last_exception, delay,
+                )
+                
+                # Call retry callback if provided
+                if on_retry_cb:
+                    on_retry_cb(last_exception, attempt, delay)
+                
+                await asyncio.sleep(delay)
+                
                 try:
                     return await func(*args, **kwargs)
-                    
-                except config.retry_exceptions as e:
+                except retry_excs as e:
                     last_exception = e
-                    
-                    # Check if we have retries left
-                    if attempt < config.max_attempts - 1:
-                        delay = calculate_delay(attempt, config)
-                        
-                        logger.warning(
-                            f"Retry {attempt + 1}/{config.max_attempts} for "
-                            f"{func.__name__}: {type(e).__name__}: {e}. "
-                            f"Waiting {delay:.2f}s..."
-                        )
-                        
-                        # Call retry callback if provided
-                        if config.on_retry:
-                            config.on_retry(e, attempt + 1, delay)
-                        
-                        await asyncio.sleep(delay)
-                    else:
-                        logger.error(
-                            f"All {config.max_attempts} attempts failed for "
-                            f"{func.__name__}: {type(e).__name__}: {e}"
-                        )
             
-            # Re-raise the last exception if all retries failed
-            if last_exception:
-                raise last_exception
+            logger.error(
+                "All %d attempts failed for %s: %s: %s",
+                max_attempts, func_name, type(last_exception).__name__, last_exception,
+            )
             
-            # Should never reach here, but for type safety
-            raise RuntimeError(f"Unexpected state in retry logic for {func.__name__}")
+            # Re-raise the last exception since all retries failed
+            raise last_exception
         
         return wrapper
     
     return decorator
 
 
+async def retry_iter(config: RetryConfig) -> AsyncIterator[int]:
+    """
+    Yield attempt numbers (0-indexed), backing off between attempts.
+    
+    A lighter alternative to RetryableOperation: no context manager and
+    no per-attempt bookkeeping object. The caller decides what to retry
+    and must re-raise once the final attempt fails.
+    
+    Args:
+        config: Retry configuration
+        
+    Yields:
+        int: Current attempt number
+        
+    Example:
+        config = RetryConfig(max_attempts=3)
+        async for attempt in retry_iter(config):
+            try:
+                return await some_operation()
+            except config.retry_exceptions:
+                if attempt == config.max_attempts - 1:
+                    raise
+    """
+    delays = _backoff_schedule(config)
+    last_attempt = config.max_attempts - 1
+    
+    for attempt in range(config.max_attempts):
+        yield attempt
+        
+        # Only reached when the caller asked for another attempt
+        if attempt < last_attempt:
+            delay = delays[attempt]
+            if config.jitter:
+                delay = _apply_jitter(delay, config.jitter_range)
+            await asyncio.sleep(delay)
+
+
 class RetryableOperation:
     """
     Context manager for retryable operations with state tracking.
     
+    Prefer retry_iter() for new code; this class is kept for existing
+    callers.
+    
     Example:
         async with RetryableOperation(max_attempts=3) as op:
             while op.should_retry:
@@ -275,14 +331,15 @@ class RetryableOperation:
         if self.should_retry:
             delay = calculate_delay(self._attempt - 1, self.config)
             logger.warning(
-                f"Attempt {self._attempt}/{self.config.max_attempts} failed: "
-                f"{type(exception).__name__}: {exception}. Waiting {delay:.2f}s..."
+                "Attempt %d/%d failed: %s: %s. Waiting %.2fs...",
+                self._attempt, self.config.max_attempts,
+                type(exception).__name__, exception, delay,
             )
             await asyncio.sleep(delay)
         else:
             logger.error(
-                f"All {self.config.max_attempts} attempts exhausted. "
-                f"Last error: {type(exception).__name__}: {exception}"
+                "All %d attempts exhausted. Last error: %s: %s",
+                self.config.max_attempts, type(exception).__name__, exception,
             )
             raise exception
 
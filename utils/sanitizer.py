@@ -11,6 +11,7 @@ Usage:
     clean_input = sanitizer.sanitize(user_input)
 """
 
+import functools
 import html
 import logging
 import re
@@ -37,6 +38,7 @@ TEXTRP_ROOM_PATTERN = re.compile(r'^![a-zA-Z0-9]+:[a-zA-Z0-9.\-]+$')
 
 # Transaction hash pattern (64 hex characters)
 TX_HASH_PATTERN = re.compile(r'^[A-Fa-f0-9]{64}$')
+_NORMALIZED_TX_HASH_PATTERN = re.compile(r'[A-F0-9]{64}')
 
 # Command name pattern (alphanumeric + underscore)
 COMMAND_NAME_PATTERN = re.compile(r'^[a-zA-Z][a-zA-Z0-9_]{0,31}$')
@@ -54,10 +56,88 @@ DANGEROUS_PATTERNS = [
     re.compile(r'[\x01-\x08\x0b\x0c\x0e-\x1f]'),  # Control characters
 ]
 
+# All of DANGEROUS_PATTERNS as one alternation, so a single regex pass tells
+# which of them occur (each alternative is a named group p<index>).
+_DANGEROUS_SCAN = re.compile(
+    '|'.join(f'(?P<p{i}>{p.pattern})' for i, p in enumerate(DANGEROUS_PATTERNS)),
+    re.IGNORECASE,
+)
+
+# The same scan for text that has already had control characters removed,
+# where only the first three patterns can still match. Each entry of
+# _DANGEROUS_ISSUES pairs a group name with the issue reported for it,
+# in DANGEROUS_PATTERNS order.
+_DANGEROUS_TEXT_SCAN = re.compile(
+    '|'.join(f'(?P<p{i}>{p.pattern})' for i, p in enumerate(DANGEROUS_PATTERNS[:3])),
+    re.IGNORECASE,
+)
+_DANGEROUS_ISSUES = tuple(
+    (f'p{i}', f"Detected potentially dangerous pattern: {p.pattern}")
+    for i, p in enumerate(DANGEROUS_PATTERNS)
+)
+
+# Optional RE2 backend (google-re2) for the yes/no dangerous-pattern check on
+# ASCII input. RE2 runs in linear time and overtakes ``re`` once input is a
+# few dozen characters long. Its \w and \s classes are ASCII-only, which
+# only differs from ``re`` on control characters that the scan flags anyway.
+try:
+    import re2
+    _DANGEROUS_SCAN_RE2 = re2.compile('(?i)' + _DANGEROUS_SCAN.pattern)
+    RE2_AVAILABLE = True
+except ImportError:
+    _DANGEROUS_SCAN_RE2 = None
+    RE2_AVAILABLE = False
+
+# Below this length the stdlib engine is faster than the RE2 call overhead
+_RE2_MIN_LENGTH = 32
+
+# Control characters stripped by InputSanitizer (everything below 0x20 except
+# tab/newline/carriage return, plus DEL). The translate table does the
+# removal in C; the regexes detect whether there is anything to remove and
+# itemize what was removed.
+_CONTROL_CHAR_TABLE = dict.fromkeys(
+    [c for c in range(32) if c not in (0x09, 0x0A, 0x0D)] + [0x7F]
+)
+_CONTROL_CHAR_RE = re.compile(r'[\x01-\x08\x0b\x0c\x0e-\x1f\x7f]')
+_ANY_CONTROL_CHAR_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+
+# Escapes applied by sanitize_for_logging: control characters (except tab)
+# and DEL become visible \xNN sequences, newline/carriage return become \n/\r
+_LOG_ESCAPE_TABLE = {c: f'\\x{c:02x}' for c in range(32) if c != 0x09}
+_LOG_ESCAPE_TABLE[0x0A] = '\\n'
+_LOG_ESCAPE_TABLE[0x0D] = '\\r'
+_LOG_ESCAPE_TABLE[0x7F] = '\\x7f'
+
+# Everything that can't appear in an address, removed in runs
+_ADDRESS_STRIP_RE = re.compile(r'[^a-zA-Z0-9]+')
+
+# Everything that can't appear in a city name, removed in runs
+_CITY_STRIP_RE = re.compile(r'[^\w\s,.\-]+')
+
+# URL scheme prefixes checked by is_safe_url
+_DANGEROUS_URL_SCHEMES = ('javascript:', 'data:', 'vbscript:', 'file:')
+_SAFE_URL_SCHEMES = ('http://', 'https://')
+_URL_PREFIX_LENGTH = max(map(len, _DANGEROUS_URL_SCHEMES + _SAFE_URL_SCHEMES))
+
 # Characters that should be escaped or removed in different contexts
 SHELL_DANGEROUS_CHARS = set(';&|`$(){}[]<>\\\'\"')
 SQL_DANGEROUS_CHARS = set('\'"\\;')
 HTML_DANGEROUS_CHARS = set('<>&"\'')
+CITY_DANGEROUS_CHARS = frozenset('<>&;|`$')
+
+# Deletion table for SHELL_DANGEROUS_CHARS, so removal runs in C. The regex
+# is a much cheaper check for whether there is anything to delete.
+_SHELL_DELETE_TABLE = dict.fromkeys(map(ord, SHELL_DANGEROUS_CHARS))
+_SHELL_CHAR_RE = re.compile(
+    '[' + re.escape(''.join(sorted(SHELL_DANGEROUS_CHARS))) + ']'
+)
+
+
+def _has_dangerous_ascii(text: str) -> bool:
+    """Check ASCII text for any of DANGEROUS_PATTERNS, via RE2 when available."""
+    if _DANGEROUS_SCAN_RE2 is not None and len(text) >= _RE2_MIN_LENGTH:
+        return _DANGEROUS_SCAN_RE2.search(text) is not None
+    return _DANGEROUS_SCAN.search(text) is not None
 
 
 class SanitizationLevel(Enum):
@@ -79,6 +159,9 @@ class SanitizationResult:
         issues_found: List of detected issues
         is_safe: Whether input passes safety checks
     """
+    # No field has a default, so slots can be declared by hand
+    __slots__ = ("original", "sanitized", "was_modified", "issues_found", "is_safe")
+    
     original: str
     sanitized: str
     was_modified: bool
@@ -99,6 +182,8 @@ class ValidationResult:
         value: The validated/normalized value
         errors: List of validation error messages
     """
+    __slots__ = ("is_valid", "value", "errors")
+    
     is_valid: bool
     value: Optional[str]
     errors: List[str]
@@ -117,6 +202,14 @@ class InputSanitizer:
         if result.is_safe:
             process(result.sanitized)
     """
+    __slots__ = (
+        "level",
+        "max_length",
+        "allowed_chars",
+        "_strict",
+        "_minimal",
+        "_disallowed_re",
+    )
     
     def __init__(
         self,
@@ -135,6 +228,17 @@ class InputSanitizer:
         self.level = level
         self.max_length = max_length
         self.allowed_chars = allowed_chars
+        
+        # The level is checked several times per call; resolve it once
+        self._strict = level == SanitizationLevel.STRICT
+        self._minimal = level == SanitizationLevel.MINIMAL
+        
+        # Matches anything outside the whitelist (whitespace is always kept),
+        # so filtering is a single regex substitution
+        self._disallowed_re: Optional[Pattern[str]] = None
+        if allowed_chars:
+            kept = ''.join(sorted(c for c in allowed_chars if len(c) == 1))
+            self._disallowed_re = re.compile(f'[^{re.escape(kept)}\\s]')
     
     def sanitize(
         self,
@@ -157,30 +261,40 @@ class InputSanitizer:
         original = text
         issues: List[str] = []
         
-        # Check length
-        if len(text) > self.max_length:
-            text = text[:self.max_length]
-            issues.append(f"Input truncated to {self.max_length} characters")
-        
-        # Normalize unicode
-        text = unicodedata.normalize('NFKC', text)
-        
-        # Remove null bytes and control characters
-        text, ctrl_issues = self._remove_control_chars(text)
-        issues.extend(ctrl_issues)
+        # Fast path: most input is short, plain ASCII with nothing to strip
+        # or report. NFKC leaves ASCII unchanged, so normalization and the
+        # control character pass can be skipped and only the context-specific
+        # cleanup below applies.
+        is_clean = (
+            len(text) <= self.max_length
+            and text.isascii()
+            and '\x7f' not in text
+            and not _has_dangerous_ascii(text)
+        )
         
-        # Check for dangerous patterns
-        pattern_issues = self._check_dangerous_patterns(text)
-        if pattern_issues:
-            issues.extend(pattern_issues)
-            if self.level == SanitizationLevel.STRICT:
-                return SanitizationResult(
-                    original=original,
-                    sanitized="",
-                    was_modified=True,
-                    issues_found=issues,
-                    is_safe=False,
-                )
+        if not is_clean:
+            # Check length
+            if len(text) > self.max_length:
+                text = text[:self.max_length]
+                issues.append(f"Input truncated to {self.max_length} characters")
+            
+            # Normalize unicode (ASCII is already in NFKC form)
+            if not text.isascii():
+                text = unicodedata.normalize('NFKC', text)
+            
+            # Remove null bytes and control characters, then check for
+            # dangerous patterns
+            text, scan_issues, dangerous = self._clean_and_scan(text)
+            if scan_issues:
+                issues.extend(scan_issues)
+                if dangerous and self._strict:
+                    return SanitizationResult(
+                        original=original,
+                        sanitized="",
+                        was_modified=True,
+                        issues_found=issues,
+                        is_safe=False,
+                    )
         
         # Context-specific sanitization
         if context == "command":
@@ -193,8 +307,8 @@ class InputSanitizer:
             text = self._sanitize_general(text)
         
         # Apply character whitelist if provided
-        if self.allowed_chars:
-            text = ''.join(c for c in text if c in self.allowed_chars or c.isspace())
+        if self._disallowed_re is not None:
+            text = self._disallowed_re.sub('', text)
         
         # Strip whitespace
         text = text.strip()
@@ -204,41 +318,45 @@ class InputSanitizer:
             sanitized=text,
             was_modified=text != original,
             issues_found=issues,
-            is_safe=len(issues) == 0 or self.level == SanitizationLevel.MINIMAL,
+            is_safe=not issues or self._minimal,
         )
     
-    def _remove_control_chars(self, text: str) -> Tuple[str, List[str]]:
-        """Remove control characters from text."""
-        issues = []
+    def _clean_and_scan(self, text: str) -> Tuple[str, List[str], bool]:
+        """
+        Remove control characters and check for dangerous patterns.
         
-        # Remove null bytes
-        if '\x00' in text:
-            text = text.replace('\x00', '')
-            issues.append("Removed null bytes")
+        Returns:
+            Tuple of (cleaned text, issues found, whether a dangerous
+            pattern was detected)
+        """
+        issues = []
+        cleaned = text
         
-        # Remove other control characters (except newline, tab, carriage return)
-        cleaned = []
-        for char in text:
-            if ord(char) < 32 and char not in '\n\r\t':
+        # A character-class search is far cheaper than a translate pass, so
+        # only build a new string (and itemize removals) when needed
+        if _ANY_CONTROL_CHAR_RE.search(text) is not None:
+            cleaned = text.translate(_CONTROL_CHAR_TABLE)
+            
+            if '\x00' in text:
+                issues.append("Removed null bytes")
+            
+            # Other control characters (newline, tab and carriage return are kept)
+            for char in _CONTROL_CHAR_RE.findall(text):
                 issues.append(f"Removed control character: U+{ord(char):04X}")
-            else:
-                cleaned.append(char)
         
-        return ''.join(cleaned), issues
-    
-    def _check_dangerous_patterns(self, text: str) -> List[str]:
-        """Check for potentially dangerous patterns."""
-        issues = []
+        # One pass over the cleaned text; report hits in DANGEROUS_PATTERNS
+        # order. Scanning after removal catches patterns split by control
+        # characters (e.g. "<scr\x01ipt").
+        hits = {m.lastgroup for m in _DANGEROUS_TEXT_SCAN.finditer(cleaned)}
+        dangerous = bool(hits)
+        if dangerous:
+            issues.extend(issue for group, issue in _DANGEROUS_ISSUES if group in hits)
         
-        for pattern in DANGEROUS_PATTERNS:
-            if pattern.search(text):
-                issues.append(f"Detected potentially dangerous pattern: {pattern.pattern}")
-        
-        return issues
+        return cleaned, issues, dangerous
     
     def _sanitize_general(self, text: str) -> str:
         """General-purpose sanitization."""
-        if self.level == SanitizationLevel.STRICT:
+        if self._strict:
             # Escape HTML entities
             text = html.escape(text)
         
@@ -247,8 +365,8 @@ class InputSanitizer:
     def _sanitize_command(self, text: str) -> str:
         """Sanitize command input (arguments)."""
         # Remove shell-dangerous characters in strict mode
-        if self.level == SanitizationLevel.STRICT:
-            text = ''.join(c for c in text if c not in SHELL_DANGEROUS_CHARS)
+        if self._strict and _SHELL_CHAR_RE.search(text):
+            text = text.translate(_SHELL_DELETE_TABLE)
         
         # Collapse multiple spaces
         text = ' '.join(text.split())
@@ -257,48 +375,39 @@ class InputSanitizer:
     
     def _sanitize_address(self, text: str) -> str:
         """Sanitize cryptocurrency address input."""
-        # Remove all whitespace
-        text = ''.join(text.split())
-        
-        # Remove any non-alphanumeric characters except those valid in addresses
-        text = re.sub(r'[^a-zA-Z0-9]', '', text)
-        
-        return text
+        # Remove whitespace and anything else that is not alphanumeric
+        return _ADDRESS_STRIP_RE.sub('', text)
     
     def _sanitize_city_name(self, text: str) -> str:
         """Sanitize city name input for weather queries."""
-        # Allow letters, spaces, commas, periods, hyphens
-        text = re.sub(r'[^\w\s,.\-]', '', text, flags=re.UNICODE)
-        
-        # Collapse multiple spaces
-        text = ' '.join(text.split())
-        
-        # Limit to reasonable city name length
-        if len(text) > 100:
-            text = text[:100]
-        
-        return text
+        # Allow letters, spaces, commas, periods, hyphens; collapse multiple
+        # spaces and limit to a reasonable city name length. Truncation has
+        # to come last, otherwise stripped junk would eat into the limit.
+        return ' '.join(_CITY_STRIP_RE.sub('', text).split())[:100]
 
 
 # =============================================================================
 # VALIDATION FUNCTIONS
 # =============================================================================
 
-def validate_xrp_address(address: str) -> ValidationResult:
-    """
-    Validate an XRP wallet address.
-    
-    Args:
-        address: The address to validate
-        
-    Returns:
-        ValidationResult with validation status
-        
-    Example:
-        result = validate_xrp_address("rN7n3473SaZBCG4dFL83w7a1RXtXtbk2D9")
-        if result.is_valid:
-            process(result.value)
-    """
+# Users keep referring to the same few addresses, hashes and user IDs, so the
+# validators below memoize their results on the raw input. The cache is
+# bounded so a stream of unique inputs can't grow it without limit.
+_VALIDATION_CACHE_SIZE = 1024
+
+
+def _copy_result(result: ValidationResult) -> ValidationResult:
+    """Copy a cached result so callers can't mutate the cached errors list."""
+    return ValidationResult(
+        is_valid=result.is_valid,
+        value=result.value,
+        errors=list(result.errors),
+    )
+
+
+@functools.lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
+def _validate_xrp_address(address: str) -> ValidationResult:
+    """Cached implementation of validate_xrp_address()."""
     errors = []
     
     # Remove whitespace
@@ -309,6 +418,10 @@ def validate_xrp_address(address: str) -> ValidationResult:
         errors.append("Address is empty")
         return ValidationResult(is_valid=False, value=None, errors=errors)
     
+    # The pattern implies every check below, so a match is valid outright
+    if XRP_ADDRESS_PATTERN.match(address):
+        return ValidationResult(is_valid=True, value=address, errors=errors)
+    
     if not address.startswith('r'):
         errors.append("XRP addresses must start with 'r'")
     
@@ -318,27 +431,33 @@ def validate_xrp_address(address: str) -> ValidationResult:
     if len(address) > 35:
         errors.append("Address is too long (maximum 35 characters)")
     
-    # Pattern check
-    if not XRP_ADDRESS_PATTERN.match(address):
-        errors.append("Invalid address format (must be base58 encoded)")
+    # Pattern check (already known to have failed)
+    errors.append("Invalid address format (must be base58 encoded)")
     
-    return ValidationResult(
-        is_valid=len(errors) == 0,
-        value=address if len(errors) == 0 else None,
-        errors=errors,
-    )
+    return ValidationResult(is_valid=False, value=None, errors=errors)
 
 
-def validate_tx_hash(tx_hash: str) -> ValidationResult:
+def validate_xrp_address(address: str) -> ValidationResult:
     """
-    Validate a transaction hash.
+    Validate an XRP wallet address.
     
     Args:
-        tx_hash: The transaction hash to validate
+        address: The address to validate
         
     Returns:
         ValidationResult with validation status
+        
+    Example:
+        result = validate_xrp_address("rN7n3473SaZBCG4dFL83w7a1RXtXtbk2D9")
+        if result.is_valid:
+            process(result.value)
     """
+    return _copy_result(_validate_xrp_address(address))
+
+
+@functools.lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
+def _validate_tx_hash(tx_hash: str) -> ValidationResult:
+    """Cached implementation of validate_tx_hash()."""
     errors = []
     
     # Remove whitespace and standardize to uppercase
@@ -348,29 +467,38 @@ def validate_tx_hash(tx_hash: str) -> ValidationResult:
         errors.append("Transaction hash is empty")
         return ValidationResult(is_valid=False, value=None, errors=errors)
     
+    # A pattern match implies the length check
+    if TX_HASH_PATTERN.match(tx_hash):
+        return ValidationResult(is_valid=True, value=tx_hash, errors=errors)
+    
     if len(tx_hash) != 64:
         errors.append(f"Invalid hash length: {len(tx_hash)} (expected 64)")
     
-    if not TX_HASH_PATTERN.match(tx_hash):
-        errors.append("Invalid hash format (must be 64 hexadecimal characters)")
+    errors.append("Invalid hash format (must be 64 hexadecimal characters)")
     
-    return ValidationResult(
-        is_valid=len(errors) == 0,
-        value=tx_hash if len(errors) == 0 else None,
-        errors=errors,
-    )
+    return ValidationResult(is_valid=False, value=None, errors=errors)
 
 
-def validate_textrp_user_id(user_id: str) -> ValidationResult:
+def validate_tx_hash(tx_hash: str) -> ValidationResult:
     """
-    Validate a TextRP user ID.
+    Validate a transaction hash.
     
     Args:
-        user_id: The TextRP user ID to validate
+        tx_hash: The transaction hash to validate
         
     Returns:
         ValidationResult with validation status
     """
+    # Hashes usually arrive already normalized; those need no strip/upper
+    if _NORMALIZED_TX_HASH_PATTERN.fullmatch(tx_hash):
+        return ValidationResult(is_valid=True, value=tx_hash, errors=[])
+    
+    return _copy_result(_validate_tx_hash(tx_hash))
+
+
+@functools.lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
+def _validate_textrp_user_id(user_id: str) -> ValidationResult:
+    """Cached implementation of validate_textrp_user_id()."""
     errors = []
     
     user_id = user_id.strip()
@@ -379,20 +507,82 @@ def validate_textrp_user_id(user_id: str) -> ValidationResult:
         errors.append("User ID is empty")
         return ValidationResult(is_valid=False, value=None, errors=errors)
     
+    # A pattern match implies the prefix and separator checks
+    if TEXTRP_USER_PATTERN.match(user_id):
+        return ValidationResult(is_valid=True, value=user_id, errors=errors)
+    
     if not user_id.startswith('@'):
         errors.append("TextRP user IDs must start with '@'")
     
     if ':' not in user_id:
         errors.append("TextRP user IDs must contain ':' separator")
     
-    if not TEXTRP_USER_PATTERN.match(user_id):
-        errors.append("Invalid TextRP user ID format")
+    errors.append("Invalid TextRP user ID format")
     
-    return ValidationResult(
-        is_valid=len(errors) == 0,
-        value=user_id if len(errors) == 0 else None,
-        errors=errors,
-    )
+    return ValidationResult(is_valid=False, value=None, errors=errors)
+
+
+def validate_xrp_address_batch(addresses: List[str]) -> List[ValidationResult]:
+    """
+    Validate several XRP wallet addresses at once.
+    
+    Valid addresses are accepted with a single pattern match each,
+    bypassing the per-call cache; only invalid ones go through
+    validate_xrp_address() for their error messages.
+    
+    Args:
+        addresses: The addresses to validate
+        
+    Returns:
+        List of ValidationResult, one per address, in input order
+    """
+    match = XRP_ADDRESS_PATTERN.match
+    results = []
+    
+    for address in addresses:
+        stripped = address.strip()
+        if match(stripped):
+            results.append(ValidationResult(is_valid=True, value=stripped, errors=[]))
+        else:
+            results.append(validate_xrp_address(address))
+    
+    return results
+
+
+def validate_tx_hash_batch(tx_hashes: List[str]) -> List[ValidationResult]:
+    """
+    Validate several transaction hashes at once.
+    
+    Args:
+        tx_hashes: The transaction hashes to validate
+        
+    Returns:
+        List of ValidationResult, one per hash, in input order
+    """
+    match = TX_HASH_PATTERN.match
+    results = []
+    
+    for tx_hash in tx_hashes:
+        normalized = tx_hash.strip().upper()
+        if match(normalized):
+            results.append(ValidationResult(is_valid=True, value=normalized, errors=[]))
+        else:
+            results.append(validate_tx_hash(tx_hash))
+    
+    return results
+
+
+def validate_textrp_user_id(user_id: str) -> ValidationResult:
+    """
+    Validate a TextRP user ID.
+    
+    Args:
+        user_id: The TextRP user ID to validate
+        
+    Returns:
+        ValidationResult with validation status
+    """
+    return _copy_result(_validate_textrp_user_id(user_id))
 
 
 def validate_command_name(name: str) -> ValidationResult:
@@ -413,14 +603,12 @@ def validate_command_name(name: str) -> ValidationResult:
         errors.append("Command name is empty")
         return ValidationResult(is_valid=False, value=None, errors=errors)
     
-    if not COMMAND_NAME_PATTERN.match(name):
-        errors.append("Invalid command name (alphanumeric and underscore only, max 32 chars)")
+    if COMMAND_NAME_PATTERN.match(name):
+        return ValidationResult(is_valid=True, value=name, errors=errors)
     
-    return ValidationResult(
-        is_valid=len(errors) == 0,
-        value=name if len(errors) == 0 else None,
-        errors=errors,
-    )
+    errors.append("Invalid command name (alphanumeric and underscore only, max 32 chars)")
+    
+    return ValidationResult(is_valid=False, value=None, errors=errors)
 
 
 def validate_city_name(city: str) -> ValidationResult:
@@ -448,7 +636,7 @@ def validate_city_name(city: str) -> ValidationResult:
         errors.append("City name is too long")
     
     # Check for suspicious patterns
-    if re.search(r'[<>&;|`$]', city):
+    if not CITY_DANGEROUS_CHARS.isdisjoint(city):
         errors.append("City name contains invalid characters")
     
     return ValidationResult(
@@ -462,6 +650,15 @@ def validate_city_name(city: str) -> ValidationResult:
 # CONVENIENCE FUNCTIONS
 # =============================================================================
 
+@functools.lru_cache(maxsize=8)
+def _get_command_sanitizer(max_length: int) -> InputSanitizer:
+    """Shared STANDARD-level sanitizer per max_length (sanitizers are stateless)."""
+    return InputSanitizer(
+        level=SanitizationLevel.STANDARD,
+        max_length=max_length,
+    )
+
+
 def sanitize_command_input(
     text: str,
     max_length: int = 500,
@@ -476,11 +673,7 @@ def sanitize_command_input(
     Returns:
         Sanitized string
     """
-    sanitizer = InputSanitizer(
-        level=SanitizationLevel.STANDARD,
-        max_length=max_length,
-    )
-    result = sanitizer.sanitize(text, context="command")
+    result = _get_command_sanitizer(max_length).sanitize(text, context="command")
     return result.sanitized
 
 
@@ -498,15 +691,12 @@ def sanitize_for_logging(text: str, max_length: int = 200) -> str:
     if not text:
         return ""
     
-    # Truncate
+    # Escape newlines and control chars (prevent log injection), then
+    # mark truncation
     if len(text) > max_length:
-        text = text[:max_length] + "..."
+        return text[:max_length].translate(_LOG_ESCAPE_TABLE) + "..."
     
-    # Remove newlines and control chars (prevent log injection)
-    text = text.replace('\n', '\\n').replace('\r', '\\r')
-    text = ''.join(c if ord(c) >= 32 or c == '\t' else f'\\x{ord(c):02x}' for c in text)
-    
-    return text
+    return text.translate(_LOG_ESCAPE_TABLE)
 
 
 def is_safe_url(url: str) -> bool:
@@ -519,16 +709,12 @@ def is_safe_url(url: str) -> bool:
     Returns:
         bool: True if URL appears safe
     """
-    url_lower = url.lower().strip()
+    # Only the scheme matters, so lowercase just the leading characters
+    prefix = url.strip()[:_URL_PREFIX_LENGTH].lower()
     
     # Block dangerous schemes
-    dangerous_schemes = ['javascript:', 'data:', 'vbscript:', 'file:']
-    for scheme in dangerous_schemes:
-        if url_lower.startswith(scheme):
-            return False
-    
-    # Only allow http/https
-    if not (url_lower.startswith('http://') or url_lower.startswith('https://')):
+    if prefix.startswith(_DANGEROUS_URL_SCHEMES):
         return False
     
-    return True
+    # Only allow http/https
+    return prefix.startswith(_SAFE_URL_SCHEMES)
@@ -15,13 +15,30 @@ Usage:
 """
 
 import asyncio
+import functools
+import json
 import logging
+import random
 import re
-from typing import Optional, Dict, Any, Union
-from datetime import datetime
+import time
+from typing import TYPE_CHECKING, ClassVar, Optional, Dict, Any, Tuple, Union
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from enum import Enum
+from types import MappingProxyType
 
-import aiohttp
+if TYPE_CHECKING:
+    import aiohttp
+
+# Use orjson for decoding API responses when installed; it is several times
+# faster than the stdlib on multi-KB forecast payloads
+try:
+    import orjson
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
 
 # Import retry utilities
 try:
@@ -31,14 +48,26 @@ except ImportError:
     RETRY_AVAILABLE = False
     WEATHER_RETRY_EXCEPTIONS = (ConnectionError, TimeoutError, asyncio.TimeoutError, OSError)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
+# Logging is configured on first client creation rather than at import time,
+# so importing this module doesn't touch the application's logging setup.
+_LOGGING_CONFIGURED = False
+
+
+def _configure_logging() -> None:
+    """Apply the default logging configuration once."""
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    _LOGGING_CONFIGURED = True
+
 
 # =============================================================================
 # CONSTANTS AND CONFIGURATION
@@ -48,8 +77,35 @@ logger = logging.getLogger(__name__)
 OPENWEATHERMAP_BASE_URL = "https://api.openweathermap.org/data/2.5"
 OPENWEATHERMAP_GEO_URL = "https://api.openweathermap.org/geo/1.0"
 
-# Weather condition emoji mappings for chat display
-WEATHER_EMOJIS = {
+# ZIP/postal code patterns used to auto-detect query type; the UK and
+# Canadian patterns expect upper-cased input
+US_ZIP_PATTERN = re.compile(r'^\d{5}(-\d{4})?$')
+UK_POSTAL_PATTERN = re.compile(r'^[A-Z]{1,2}\d[A-Z\d]?\s*\d[A-Z]{2}$')
+CA_POSTAL_PATTERN = re.compile(r'^[A-Z]\d[A-Z]\s*\d[A-Z]\d$')
+
+# Shared read-only defaults for missing sections of an API response, so
+# parsing doesn't allocate a fresh {} / [{}] for every .get() fallback
+_NO_DATA = MappingProxyType({})
+_NO_WEATHER = (_NO_DATA,)
+
+# Divider line under message headings (same as ResponseTemplate.separator)
+MESSAGE_DIVIDER = "━━━━━━━━━━━━━━━━━━━━━\n"
+
+# Meters in a mile, for converting visibility
+METERS_PER_MILE = 1609.34
+
+# Longest wait honored from a Retry-After header (seconds)
+MAX_RETRY_AFTER = 30.0
+
+# Upper bound on cached API responses per client (see WeatherClient.cache_ttl)
+RESPONSE_CACHE_MAX_ENTRIES = 256
+
+# Longest time requests are short-circuited after repeated failures (seconds)
+MAX_CIRCUIT_OPEN = 30.0
+
+# Weather condition emoji mappings for chat display. Read-only, since the
+# lookup tables further down are precomputed from it at import.
+WEATHER_EMOJIS = MappingProxyType({
     # Thunderstorm group (2xx)
     "thunderstorm": "⛈️",
     
@@ -81,13 +137,113 @@ WEATHER_EMOJIS = {
     "scattered clouds": "⛅",
     "broken clouds": "🌥️",
     "overcast clouds": "☁️",
-}
+})
+
+# OpenWeatherMap condition vocabulary, see
+# https://openweathermap.org/weather-conditions
+# "main" groups, spelled as the API returns them
+OWM_MAIN_CONDITIONS = (
+    "Thunderstorm", "Drizzle", "Rain", "Snow", "Mist", "Smoke", "Haze",
+    "Dust", "Fog", "Sand", "Ash", "Squall", "Tornado", "Clear", "Clouds",
+)
+
+# All groups and descriptions, lower-cased
+OWM_CONDITIONS = tuple(main.lower() for main in OWM_MAIN_CONDITIONS) + (
+    "thunderstorm with light rain", "thunderstorm with rain",
+    "thunderstorm with heavy rain", "light thunderstorm", "heavy thunderstorm",
+    "ragged thunderstorm", "thunderstorm with light drizzle",
+    "thunderstorm with drizzle", "thunderstorm with heavy drizzle",
+    "light intensity drizzle", "heavy intensity drizzle",
+    "light intensity drizzle rain", "drizzle rain",
+    "heavy intensity drizzle rain", "shower rain and drizzle",
+    "heavy shower rain and drizzle", "shower drizzle",
+    "light rain", "moderate rain", "heavy intensity rain", "very heavy rain",
+    "extreme rain", "freezing rain", "light intensity shower rain",
+    "shower rain", "heavy intensity shower rain", "ragged shower rain",
+    "light snow", "heavy snow", "sleet", "light shower sleet", "shower sleet",
+    "light rain and snow", "rain and snow", "light shower snow",
+    "shower snow", "heavy shower snow",
+    "sand/dust whirls", "volcanic ash", "squalls",
+    "clear sky", "few clouds", "scattered clouds", "broken clouds",
+    "overcast clouds",
+)
 
 # Wind direction mappings
-WIND_DIRECTIONS = [
+WIND_DIRECTIONS = (
     "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
     "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"
-]
+)
+
+
+def _match_weather_emoji(condition_lower: str) -> str:
+    """Find the emoji for a lower-cased condition by exact, then partial match."""
+    # Try exact match first
+    if condition_lower in WEATHER_EMOJIS:
+        return WEATHER_EMOJIS[condition_lower]
+    
+    # Try partial match
+    for key, emoji in WEATHER_EMOJIS.items():
+        if key in condition_lower or condition_lower in key:
+            return emoji
+    
+    # Default emoji
+    return "🌡️"
+
+
+# Emoji for every condition the API can report, resolved once at import so
+# lookups skip the partial-match scan
+_CONDITION_EMOJIS = {
+    condition: _match_weather_emoji(condition) for condition in OWM_CONDITIONS
+}
+
+
+# Emoji by "main" group exactly as the API spells it, so parsing a response
+# needs a single dict hit and no case folding
+_MAIN_EMOJIS = {
+    main: _CONDITION_EMOJIS[main.lower()] for main in OWM_MAIN_CONDITIONS
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _weather_emoji(condition: str) -> str:
+    """Cached emoji lookup keyed on the condition as given (any case)."""
+    condition_lower = condition.lower()
+    
+    emoji = _CONDITION_EMOJIS.get(condition_lower)
+    if emoji is None:
+        emoji = _match_weather_emoji(condition_lower)
+    return emoji
+
+
+@functools.lru_cache(maxsize=64)
+def _title_case(description: str) -> str:
+    """Title-case a condition description (a small, fixed vocabulary)."""
+    return description.title()
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header into seconds to wait.
+    
+    Accepts both delay-seconds and HTTP-date forms; returns None when the
+    header is missing or malformed. The result is capped at MAX_RETRY_AFTER.
+    """
+    if not value:
+        return None
+    
+    value = value.strip()
+    if value.isdigit():
+        seconds = float(value)
+    else:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
 
 
 class TemperatureUnit(Enum):
@@ -115,11 +271,18 @@ class WeatherClient:
         >>> print(f"Temperature: {data['temperature']}°C")
     """
     
+    # HTTP session shared by every client created with share_pool=True
+    _shared_session: ClassVar[Optional["aiohttp.ClientSession"]] = None
+    
     def __init__(
         self,
         api_key: str,
         units: TemperatureUnit = TemperatureUnit.FAHRENHEIT,
-        lang: str = "en"
+        lang: str = "en",
+        max_concurrency: int = 32,
+        cache_ttl: float = 120.0,
+        requests_per_minute: int = 60,
+        share_pool: bool = False,
     ):
         """
         Initialize the weather client.
@@ -129,10 +292,44 @@ class WeatherClient:
                     (Get one free at https://openweathermap.org/api)
             units: Temperature unit preference
             lang: Language code for descriptions (en, es, fr, etc.)
+            max_concurrency: Maximum simultaneous connections to the API;
+                    further requests wait for a free connection
+            cache_ttl: Seconds to reuse a successful API response for an
+                    identical request (0 disables caching)
+            requests_per_minute: Client-side limit on API calls, matching
+                    the free tier by default (0 disables limiting)
+            share_pool: Use one HTTP session for every client created with
+                    share_pool=True instead of a session per client; close
+                    it with WeatherClient.close_shared()
         """
+        _configure_logging()
+        
         self.api_key = api_key
         self.units = units
         self.lang = lang
+        self.max_concurrency = max_concurrency
+        self.cache_ttl = cache_ttl
+        self.requests_per_minute = requests_per_minute
+        self.share_pool = share_pool
+        
+        # Successful responses keyed by (endpoint, sorted params), stored
+        # with the monotonic time they were fetched
+        self._cache: Dict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]] = {}
+        
+        # HTTP session, created on first request and reused so repeated
+        # calls share pooled keep-alive connections
+        self._session: Optional["aiohttp.ClientSession"] = None
+        
+        # Token bucket for requests_per_minute, starting full so a burst
+        # up to the limit goes out immediately
+        self._rate_tokens = float(requests_per_minute)
+        self._rate_updated = time.monotonic()
+        self._rate_lock = asyncio.Lock()
+        
+        # Circuit breaker: after a request exhausts its retries, further
+        # requests fail fast until _cb_fail_until, backing off each time
+        self._cb_fail_until = 0.0
+        self._cb_fail_count = 0
         
         # Validate API key is provided
         if not api_key or api_key == "your_openweathermap_api_key":
@@ -143,6 +340,68 @@ class WeatherClient:
         
         logger.info(f"WeatherClient initialized with units={units.name}")
     
+    async def __aenter__(self) -> "WeatherClient":
+        return self
+    
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        """
+        Close the HTTP session.
+        
+        Should be called when shutting down; the client can still be used
+        afterwards and will open a new session on the next request.
+        A shared session is left open for other clients; see close_shared().
+        """
+        if self.share_pool:
+            self._session = None
+            return
+        
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    @classmethod
+    async def close_shared(cls) -> None:
+        """Close the session shared by clients created with share_pool=True."""
+        session = cls._shared_session
+        cls._shared_session = None
+        if session is not None and not session.closed:
+            await session.close()
+    
+    def _new_session(self) -> "aiohttp.ClientSession":
+        """Create an HTTP session with this client's connection limits."""
+        # aiohttp is only imported once a request is actually made
+        import aiohttp
+        
+        return aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=10),
+            # Weather and geocoding endpoints share one host, so the
+            # per-host limit is the effective concurrency cap
+            connector=aiohttp.TCPConnector(
+                limit=0,
+                limit_per_host=self.max_concurrency,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+            ),
+        )
+    
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the HTTP session, creating it on first use."""
+        if self.share_pool:
+            # No await between the check and the assignment, so concurrent
+            # callers cannot create two sessions
+            session = WeatherClient._shared_session
+            if session is None or session.closed:
+                session = WeatherClient._shared_session = self._new_session()
+            self._session = session
+            return session
+        
+        if self._session is None or self._session.closed:
+            self._session = self._new_session()
+        return self._session
+    
     # =========================================================================
     # UTILITY METHODS
     # =========================================================================
@@ -177,19 +436,7 @@ class WeatherClient:
         Returns:
             str: Appropriate weather emoji
         """
-        condition_lower = condition.lower()
-        
-        # Try exact match first
-        if condition_lower in WEATHER_EMOJIS:
-            return WEATHER_EMOJIS[condition_lower]
-        
-        # Try partial match
-        for key, emoji in WEATHER_EMOJIS.items():
-            if key in condition_lower or condition_lower in key:
-                return emoji
-        
-        # Default emoji
-        return "🌡️"
+        return _weather_emoji(condition)
     
     @staticmethod
     def is_zip_code(query: str) -> bool:
@@ -205,43 +452,97 @@ class WeatherClient:
         Returns:
             bool: True if query appears to be a ZIP/postal code
         """
-        # US ZIP code patterns
-        us_zip = re.match(r'^\d{5}(-\d{4})?$', query.strip())
+        query = query.strip()
         
-        # UK postal code pattern
-        uk_postal = re.match(
-            r'^[A-Z]{1,2}\d[A-Z\d]?\s*\d[A-Z]{2}$',
-            query.strip().upper()
-        )
+        # US ZIP code patterns
+        if US_ZIP_PATTERN.match(query):
+            return True
         
-        # Canadian postal code pattern
-        ca_postal = re.match(
-            r'^[A-Z]\d[A-Z]\s*\d[A-Z]\d$',
-            query.strip().upper()
-        )
+        # UK and Canadian postal code patterns
+        query = query.upper()
+        return bool(UK_POSTAL_PATTERN.match(query) or CA_POSTAL_PATTERN.match(query))
+    
+    @property
+    def units(self) -> TemperatureUnit:
+        """Temperature unit preference."""
+        return self._units
+    
+    @units.setter
+    def units(self, units: TemperatureUnit) -> None:
+        # Every parsed response carries the unit labels, so resolve them
+        # once here rather than per response
+        self._units = units
+        
+        if units == TemperatureUnit.CELSIUS:
+            self._unit_symbol = "°C"
+        elif units == TemperatureUnit.FAHRENHEIT:
+            self._unit_symbol = "°F"
+        else:
+            self._unit_symbol = "K"
         
-        return bool(us_zip or uk_postal or ca_postal)
+        self._speed_unit = "mph" if units == TemperatureUnit.FAHRENHEIT else "m/s"
     
     def _get_unit_symbol(self) -> str:
         """Get the temperature unit symbol based on current settings."""
-        if self.units == TemperatureUnit.CELSIUS:
-            return "°C"
-        elif self.units == TemperatureUnit.FAHRENHEIT:
-            return "°F"
-        else:
-            return "K"
+        return self._unit_symbol
     
     def _get_speed_unit(self) -> str:
         """Get the wind speed unit based on current settings."""
-        if self.units == TemperatureUnit.FAHRENHEIT:
-            return "mph"
-        else:
-            return "m/s"
+        return self._speed_unit
     
     # =========================================================================
     # API REQUEST METHODS
     # =========================================================================
     
+    def _cache_get(self, key: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+        """Return a cached response that is still fresh, else None."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        
+        fetched_at, data = entry
+        if time.monotonic() - fetched_at < self.cache_ttl:
+            return data
+        
+        del self._cache[key]
+        return None
+    
+    def _cache_put(self, key: Tuple[Any, ...], data: Dict[str, Any]) -> None:
+        """Cache a response, evicting the oldest entry when full."""
+        self._cache.pop(key, None)
+        if len(self._cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (time.monotonic(), data)
+    
+    async def _acquire_rate_token(self) -> None:
+        """Wait until the client-side rate limit allows another API call."""
+        if self.requests_per_minute <= 0:
+            return
+        
+        async with self._rate_lock:
+            rate = self.requests_per_minute / 60.0
+            now = time.monotonic()
+            self._rate_tokens = min(
+                float(self.requests_per_minute),
+                self._rate_tokens + (now - self._rate_updated) * rate,
+            )
+            self._rate_updated = now
+            
+            if self._rate_tokens < 1.0:
+                # Waiters queue on the lock, so they are released in order
+                await asyncio.sleep((1.0 - self._rate_tokens) / rate)
+                self._rate_tokens = 0.0
+                self._rate_updated = time.monotonic()
+            else:
+                self._rate_tokens -= 1.0
+    
+    def _trip_circuit(self) -> None:
+        """Fail fast for a while after a request ran out of retries."""
+        self._cb_fail_until = time.monotonic() + min(
+            MAX_CIRCUIT_OPEN, 2.0 ** self._cb_fail_count
+        )
+        self._cb_fail_count += 1
+    
     async def _make_request(
         self,
         endpoint: str,
@@ -259,35 +560,63 @@ class WeatherClient:
             base_delay: Initial delay between retries (seconds)
             
         Returns:
-            Dict: JSON response data, None on failure
+            Dict: JSON response data, None on failure. Responses may be
+            served from the client's cache and must not be modified.
+            Cached responses are still served while the circuit breaker is
+            open after repeated failures; cache misses then return None
+            without calling the API.
         """
+        import aiohttp
+        
         # Add common parameters
         params["appid"] = self.api_key
         params["units"] = self.units.value
         params["lang"] = self.lang
         
+        cache_key = None
+        if self.cache_ttl > 0:
+            cache_key = (endpoint, tuple(sorted(params.items())))
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+        
+        if time.monotonic() < self._cb_fail_until:
+            logger.warning("Weather API unavailable, skipping request")
+            return None
+        
         last_exception = None
         
         for attempt in range(max_retries):
+            retry_after: Optional[float] = None
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(endpoint, params=params, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                        if response.status == 200:
-                            return await response.json()
-                        elif response.status == 401:
-                            logger.error("Invalid API key. Please check your OpenWeatherMap API key.")
-                            return None  # Don't retry auth errors
-                        elif response.status == 404:
-                            logger.warning("Location not found")
-                            return None  # Don't retry not found
-                        elif response.status >= 500:
-                            # Server errors - retry
-                            raise aiohttp.ClientError(f"Server error: {response.status}")
-                        else:
-                            error_data = await response.json()
-                            logger.error(f"API error: {error_data.get('message', 'Unknown error')}")
-                            return None
-                            
+                session = await self._get_session()
+                await self._acquire_rate_token()
+                async with session.get(endpoint, params=params) as response:
+                    if response.status == 200:
+                        data = await response.json(loads=_json_loads)
+                        self._cb_fail_count = 0
+                        if cache_key is not None:
+                            self._cache_put(cache_key, data)
+                        return data
+                    elif response.status == 401:
+                        logger.error("Invalid API key. Please check your OpenWeatherMap API key.")
+                        return None  # Don't retry auth errors
+                    elif response.status == 404:
+                        logger.warning("Location not found")
+                        return None  # Don't retry not found
+                    elif response.status in (429, 503):
+                        # Rate limited / temporarily unavailable - retry,
+                        # waiting as long as the server asks if it says
+                        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                        raise aiohttp.ClientError(f"Server busy: {response.status}")
+                    elif response.status >= 500:
+                        # Server errors - retry
+                        raise aiohttp.ClientError(f"Server error: {response.status}")
+                    else:
+                        error_data = await response.json(loads=_json_loads)
+                        logger.error(f"API error: {error_data.get('message', 'Unknown error')}")
+                        return None
+                        
             except WEATHER_RETRY_EXCEPTIONS as e:
                 last_exception = e
                 if attempt < max_retries - 1:
@@ -303,7 +632,11 @@ class WeatherClient:
             except aiohttp.ClientError as e:
                 last_exception = e
                 if attempt < max_retries - 1:
-                    delay = base_delay * (2 ** attempt)
+                    if retry_after is not None:
+                        # Spread out clients that were all told the same time
+                        delay = retry_after + random.uniform(0, 0.25 * retry_after)
+                    else:
+                        delay = base_delay * (2 ** attempt)
                     logger.warning(
                         f"HTTP request failed (attempt {attempt + 1}/{max_retries}): {e}. "
                         f"Retrying in {delay:.1f}s..."
@@ -316,6 +649,7 @@ class WeatherClient:
                 logger.error(f"Unexpected error: {e}")
                 return None
         
+        self._trip_circuit()
         return None
     
     def _parse_weather_response(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -329,16 +663,17 @@ class WeatherClient:
             Dict: Parsed weather data
         """
         # Extract main weather condition
-        weather_info = data.get("weather", [{}])[0]
-        main_data = data.get("main", {})
-        wind_data = data.get("wind", {})
-        clouds_data = data.get("clouds", {})
-        sys_data = data.get("sys", {})
+        weather_info = data.get("weather", _NO_WEATHER)[0]
+        main_data = data.get("main", _NO_DATA)
+        wind_data = data.get("wind", _NO_DATA)
+        clouds_data = data.get("clouds", _NO_DATA)
+        sys_data = data.get("sys", _NO_DATA)
+        coord_data = data.get("coord", _NO_DATA)
         
         # Get condition and emoji
-        condition = weather_info.get("description", "Unknown").title()
+        condition = _title_case(weather_info.get("description", "Unknown"))
         condition_main = weather_info.get("main", "Unknown")
-        emoji = self.get_weather_emoji(condition_main)
+        emoji = _MAIN_EMOJIS.get(condition_main) or self.get_weather_emoji(condition_main)
         
         # Calculate wind direction
         wind_deg = wind_data.get("deg", 0)
@@ -353,8 +688,8 @@ class WeatherClient:
             "city": data.get("name", "Unknown"),
             "country": sys_data.get("country", ""),
             "coordinates": {
-                "lat": data.get("coord", {}).get("lat"),
-                "lon": data.get("coord", {}).get("lon"),
+                "lat": coord_data.get("lat"),
+                "lon": coord_data.get("lon"),
             },
             
             # Current conditions
@@ -369,7 +704,7 @@ class WeatherClient:
             "feels_like": main_data.get("feels_like"),
             "temp_min": main_data.get("temp_min"),
             "temp_max": main_data.get("temp_max"),
-            "unit_symbol": self._get_unit_symbol(),
+            "unit_symbol": self._unit_symbol,
             
             # Atmosphere
             "humidity": main_data.get("humidity"),
@@ -382,7 +717,7 @@ class WeatherClient:
             "wind_deg": wind_deg,
             "wind_direction": wind_direction,
             "wind_gust": wind_data.get("gust"),
-            "speed_unit": self._get_speed_unit(),
+            "speed_unit": self._speed_unit,
             
             # Sun times
             "sunrise": datetime.fromtimestamp(sunrise) if sunrise else None,
@@ -552,12 +887,29 @@ class WeatherClient:
         if country_code:
             query = f"{city},{country_code}"
         
+        return await self._fetch_forecast({"q": query}, days)
+    
+    async def _fetch_forecast(
+        self,
+        location: Dict[str, Any],
+        days: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch and parse a forecast for any location the API accepts.
+        
+        Args:
+            location: Location query parameters ("q", "zip" or "lat"/"lon")
+            days: Number of days (1-5)
+            
+        Returns:
+            Dict: Forecast data with list of forecast periods
+        """
         # API returns 8 forecasts per day (3-hour intervals)
         cnt = min(days * 8, 40)
         
         data = await self._make_request(
             f"{OPENWEATHERMAP_BASE_URL}/forecast",
-            {"q": query, "cnt": cnt}
+            {**location, "cnt": cnt}
         )
         
         if data is None:
@@ -566,21 +918,26 @@ class WeatherClient:
         # Parse city info
         city_info = data.get("city", {})
         
-        # Parse forecast list
+        # Parse forecast list (up to 40 entries), looking each section up
+        # once per entry
+        get_emoji = self.get_weather_emoji
+        fromtimestamp = datetime.fromtimestamp
         forecasts = []
-        for item in data.get("list", []):
+        for item in data.get("list", ()):
+            main_data = item.get("main", _NO_DATA)
+            weather_info = item.get("weather", _NO_WEATHER)[0]
+            condition_main = weather_info.get("main", "")
+            
             forecasts.append({
-                "timestamp": datetime.fromtimestamp(item.get("dt", 0)),
-                "temperature": item.get("main", {}).get("temp"),
-                "feels_like": item.get("main", {}).get("feels_like"),
-                "humidity": item.get("main", {}).get("humidity"),
-                "condition": item.get("weather", [{}])[0].get("description", "").title(),
-                "condition_main": item.get("weather", [{}])[0].get("main", ""),
-                "emoji": self.get_weather_emoji(
-                    item.get("weather", [{}])[0].get("main", "")
-                ),
-                "wind_speed": item.get("wind", {}).get("speed"),
-                "clouds": item.get("clouds", {}).get("all"),
+                "timestamp": fromtimestamp(item.get("dt", 0)),
+                "temperature": main_data.get("temp"),
+                "feels_like": main_data.get("feels_like"),
+                "humidity": main_data.get("humidity"),
+                "condition": _title_case(weather_info.get("description", "")),
+                "condition_main": condition_main,
+                "emoji": _MAIN_EMOJIS.get(condition_main) or get_emoji(condition_main),
+                "wind_speed": item.get("wind", _NO_DATA).get("speed"),
+                "clouds": item.get("clouds", _NO_DATA).get("all"),
                 "precipitation_probability": item.get("pop", 0) * 100,
             })
         
@@ -589,10 +946,59 @@ class WeatherClient:
             "country": city_info.get("country"),
             "timezone_offset": city_info.get("timezone"),
             "forecasts": forecasts,
-            "unit_symbol": self._get_unit_symbol(),
-            "speed_unit": self._get_speed_unit(),
+            "unit_symbol": self._unit_symbol,
+            "speed_unit": self._speed_unit,
         }
     
+    async def get_weather_bundle(
+        self,
+        query: str,
+        country_code: str = "US",
+        days: int = 5
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get current weather and forecast together.
+        
+        Both requests are made concurrently, so this takes about as long
+        as the slower of the two. A failure in one does not affect the
+        other.
+        
+        Args:
+            query: City name or ZIP code
+            country_code: Country code (used for ZIP code queries)
+            days: Number of forecast days (1-5)
+            
+        Returns:
+            Dict with "current" and "forecast" entries, each None on failure
+            
+        Example:
+            >>> bundle = await client.get_weather_bundle("London")
+            >>> print(client.format_weather_message(bundle["current"]))
+        """
+        query = query.strip()
+        
+        if self.is_zip_code(query):
+            location = {"zip": f"{query},{country_code}"}
+        else:
+            location = {"q": query}
+        
+        results = await asyncio.gather(
+            self.get_weather(query, country_code),
+            self._fetch_forecast(location, days),
+            return_exceptions=True,
+        )
+        
+        bundle: Dict[str, Optional[Dict[str, Any]]] = {}
+        for name, result in zip(("current", "forecast"), results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result  # e.g. cancellation
+                logger.error(f"Failed to fetch {name} weather for {query}: {result}")
+                result = None
+            bundle[name] = result
+        
+        return bundle
+    
     # =========================================================================
     # GEOCODING METHODS
     # =========================================================================
@@ -617,19 +1023,19 @@ class WeatherClient:
         logger.info(f"Geocoding city: {city}")
         
         try:
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "q": city,
-                    "limit": limit,
-                    "appid": self.api_key,
-                }
-                async with session.get(
-                    f"{OPENWEATHERMAP_GEO_URL}/direct",
-                    params=params
-                ) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    return None
+            session = await self._get_session()
+            params = {
+                "q": city,
+                "limit": limit,
+                "appid": self.api_key,
+            }
+            async with session.get(
+                f"{OPENWEATHERMAP_GEO_URL}/direct",
+                params=params
+            ) as response:
+                if response.status == 200:
+                    return await response.json(loads=_json_loads)
+                return None
         except Exception as e:
             logger.error(f"Geocoding error: {e}")
             return None
@@ -652,20 +1058,20 @@ class WeatherClient:
         logger.info(f"Reverse geocoding: {lat}, {lon}")
         
         try:
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "lat": lat,
-                    "lon": lon,
-                    "limit": 1,
-                    "appid": self.api_key,
-                }
-                async with session.get(
-                    f"{OPENWEATHERMAP_GEO_URL}/reverse",
-                    params=params
-                ) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    return None
+            session = await self._get_session()
+            params = {
+                "lat": lat,
+                "lon": lon,
+                "limit": 1,
+                "appid": self.api_key,
+            }
+            async with session.get(
+                f"{OPENWEATHERMAP_GEO_URL}/reverse",
+                params=params
+            ) as response:
+                if response.status == 200:
+                    return await response.json(loads=_json_loads)
+                return None
         except Exception as e:
             logger.error(f"Reverse geocoding error: {e}")
             return None
@@ -706,13 +1112,13 @@ class WeatherClient:
         unit = weather.get("unit_symbol", "°F")
         
         # Build message
-        message = f"""**{emoji} Weather for {location}**
-━━━━━━━━━━━━━━━━━━━━━
-
-**Condition:** {condition}
-**Temperature:** {temp:.1f}{unit}
-**Feels Like:** {feels_like:.1f}{unit}
-"""
+        parts = [
+            f"**{emoji} Weather for {location}**\n",
+            MESSAGE_DIVIDER,
+            f"\n**Condition:** {condition}\n",
+            f"**Temperature:** {temp:.1f}{unit}\n",
+            f"**Feels Like:** {feels_like:.1f}{unit}\n",
+        ]
         
         if include_details:
             humidity = weather.get("humidity")
@@ -722,26 +1128,22 @@ class WeatherClient:
             clouds = weather.get("clouds")
             visibility = weather.get("visibility")
             
-            message += f"""
-**Humidity:** {humidity}%
-**Wind:** {wind_speed:.1f} {speed_unit} {wind_dir}
-**Clouds:** {clouds}%
-"""
+            parts.append(f"\n**Humidity:** {humidity}%\n")
+            parts.append(f"**Wind:** {wind_speed:.1f} {speed_unit} {wind_dir}\n")
+            parts.append(f"**Clouds:** {clouds}%\n")
             
             if visibility:
-                vis_miles = visibility / 1609.34  # Convert meters to miles
-                message += f"**Visibility:** {vis_miles:.1f} miles\n"
+                vis_miles = visibility / METERS_PER_MILE
+                parts.append(f"**Visibility:** {vis_miles:.1f} miles\n")
             
             # Sun times
             sunrise = weather.get("sunrise")
             sunset = weather.get("sunset")
             if sunrise and sunset:
-                message += f"""
-**Sunrise:** {sunrise.strftime('%I:%M %p')}
-**Sunset:** {sunset.strftime('%I:%M %p')}
-"""
+                parts.append(f"\n**Sunrise:** {sunrise.strftime('%I:%M %p')}\n")
+                parts.append(f"**Sunset:** {sunset.strftime('%I:%M %p')}\n")
         
-        return message
+        return "".join(parts)
     
     def format_forecast_message(
         self,
@@ -766,9 +1168,7 @@ class WeatherClient:
         location = f"{city}, {country}" if country else city
         unit = forecast.get("unit_symbol", "°F")
         
-        message = f"""**📅 Forecast for {location}**
-━━━━━━━━━━━━━━━━━━━━━
-"""
+        parts = [f"**📅 Forecast for {location}**\n", MESSAGE_DIVIDER]
         
         forecasts = forecast.get("forecasts", [])[:periods]
         
@@ -782,19 +1182,19 @@ class WeatherClient:
                 # Add date header when date changes
                 if date_str != current_date:
                     current_date = date_str
-                    message += f"\n**{date_str}**\n"
+                    parts.append(f"\n**{date_str}**\n")
                 
                 emoji = fc.get("emoji", "🌡️")
                 temp = fc.get("temperature", 0)
                 condition = fc.get("condition", "")
                 pop = fc.get("precipitation_probability", 0)
                 
-                message += f"  {time_str}: {emoji} {temp:.0f}{unit}"
+                parts.append(f"  {time_str}: {emoji} {temp:.0f}{unit}")
                 if pop > 0:
-                    message += f" 💧{pop:.0f}%"
-                message += f" - {condition}\n"
+                    parts.append(f" 💧{pop:.0f}%")
+                parts.append(f" - {condition}\n")
         
-        return message
+        return "".join(parts)
 
 
 # =============================================================================
@@ -857,6 +1257,8 @@ async def main():
     if forecast:
         print(client.format_forecast_message(forecast, periods=4))
     
+    await client.close()
+    
     print("\n" + "=" * 50)
     print("Demo complete!")
 
@@ -16,12 +16,23 @@ Usage:
 """
 
 import asyncio
+import functools
+import json
 import logging
-from typing import Optional, Dict, Any, List, Union
+import random
+import re
+import time
+from typing import TYPE_CHECKING, Optional, Dict, Any, AsyncIterator, Awaitable, Callable, List, Set, Tuple, Union
 from decimal import Decimal
-from datetime import datetime
+from types import MappingProxyType
 
-from xrpl.asyncio.clients import AsyncJsonRpcClient
+if TYPE_CHECKING:
+    import aiohttp
+
+from xrpl.asyncio.clients import AsyncJsonRpcClient, AsyncWebsocketClient
+from xrpl.asyncio.clients.exceptions import XRPLRequestFailureException
+from xrpl.asyncio.clients.json_rpc_base import request_to_json_rpc
+from xrpl.asyncio.clients.utils import json_to_response
 from xrpl.models.requests import (
     AccountInfo,
     AccountLines,
@@ -34,11 +45,22 @@ from xrpl.models.requests import (
     ServerInfo,
     Fee,
     Ledger,
+    Request,
 )
 from xrpl.models.response import Response
 from xrpl.utils import drops_to_xrp, xrp_to_drops
 from xrpl.core.addresscodec import is_valid_classic_address
 
+# Use orjson for decoding node responses when installed; account_tx and
+# account_objects pages often run to hundreds of KB
+try:
+    import orjson
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
 # Import retry utilities
 try:
     from utils.retry import retry_async, XRPL_RETRY_EXCEPTIONS
@@ -47,6 +69,18 @@ except ImportError:
     RETRY_AVAILABLE = False
     XRPL_RETRY_EXCEPTIONS = (ConnectionError, TimeoutError, asyncio.TimeoutError, OSError)
 
+# Transient network errors in single-node queries are retried a couple of
+# times, quickly, before the query gives up and returns None
+if RETRY_AVAILABLE:
+    _retry_transient = retry_async(
+        max_attempts=3,
+        base_delay=0.2,
+        retry_exceptions=XRPL_RETRY_EXCEPTIONS,
+    )
+else:
+    def _retry_transient(func: Callable[..., Any]) -> Callable[..., Any]:
+        return func
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -60,31 +94,350 @@ logger = logging.getLogger(__name__)
 # XRPL NETWORK ENDPOINTS
 # =============================================================================
 
-# Official XRPL network endpoints
-XRPL_NETWORKS = {
+# Official XRPL network endpoints (read-only)
+XRPL_NETWORKS = MappingProxyType({
     # Mainnet - Production network with real XRP
-    "mainnet": [
+    "mainnet": (
         "https://xrplcluster.com",           # Community-run cluster (HTTP)
         "https://s1.ripple.com:51234/",      # Ripple's public server
         "https://s2.ripple.com:51234/",      # Ripple's backup server
         "https://xrpl.link",                 # Alternative public endpoint
         "https://ripple.com:51234/",          # Official Ripple endpoint
-    ],
+    ),
     
     # Testnet - For testing with free test XRP
-    "testnet": [
+    "testnet": (
         "https://s.altnet.rippletest.net:51234",
         "https://testnet.xrpl-labs.com",
-    ],
+    ),
     
     # Devnet - For development with free dev XRP
-    "devnet": [
+    "devnet": (
         "https://s.devnet.rippletest.net:51234",
-    ],
-}
+    ),
+})
 
 # XRP decimal places (1 XRP = 1,000,000 drops)
 XRP_DECIMAL_PLACES = 6
+DROPS_PER_XRP = 1_000_000
+
+# Total XRP supply in drops; larger amounts are rejected by xrpl-py
+MAX_DROPS = 100_000_000_000 * DROPS_PER_XRP
+
+# Plain decimal XRP amount with at most drop precision, e.g. "12.5"
+_XRP_AMOUNT_RE = re.compile(r"([0-9]+)(?:\.([0-9]{1,6}))?")
+
+# How long read-only query results are reused (seconds). Account state can
+# only change once per validated ledger (~4s); fees move faster.
+ACCOUNT_CACHE_TTL = 4.0
+FEE_CACHE_TTL = 1.0
+
+# How long reserve settings from server_info are reused (seconds). They
+# only change when validators vote on new ones.
+RESERVE_CACHE_TTL = 300.0
+
+# How long past its TTL a cached result may still be served when the
+# network call fails (seconds)
+STALE_CACHE_TTL = 60.0
+
+# Node latency tracking for failover: every node starts at the same
+# estimate, each answer moves it by LATENCY_EMA_WEIGHT, and a failure
+# multiplies it by LATENCY_FAILURE_PENALTY
+INITIAL_NODE_LATENCY = 0.1
+LATENCY_EMA_WEIGHT = 0.2
+LATENCY_FAILURE_PENALTY = 5.0
+
+# Requests with fixed parameters, built once; xrpl-py request models are
+# frozen
+_SERVER_INFO_REQUEST = ServerInfo()
+_FEE_REQUEST = Fee()
+_VALIDATED_LEDGER_REQUEST = Ledger(ledger_index="validated", transactions=False, expand=False)
+
+# Cap on the backoff between account_info retries (seconds), before jitter
+MAX_RETRY_BACKOFF = 4.0
+
+# Longest time a node that failed to answer is skipped (seconds)
+MAX_NODE_CIRCUIT_OPEN = 30.0
+
+# How many of the fastest fallback nodes are raced at once on failover
+FAILOVER_RACE_WIDTH = 2
+
+# Per-node time limit for test_connectivity (seconds)
+CONNECTIVITY_TIMEOUT = 3.0
+
+# Upper bounds on cached query results and validated transactions
+QUERY_CACHE_MAX_ENTRIES = 512
+TX_CACHE_MAX_ENTRIES = 1024
+
+# Most requests sent in one JSON-RPC batch; longer lists are split into
+# several batches
+BATCH_MAX_REQUESTS = 50
+
+# Time limit for one batch round trip (seconds)
+BATCH_TIMEOUT = 10.0
+
+# Ledger-range slices get_all_account_transactions pages through at once
+HISTORY_FETCH_SLICES = 4
+
+# How often XRPLClient.start()'s background task refreshes fee, server and
+# ledger info (seconds, about one ledger close). While it runs, those
+# results are served for up to BACKGROUND_CACHE_TTL, so one slow refresh
+# doesn't send callers to the network.
+BACKGROUND_REFRESH_INTERVAL = 4.0
+BACKGROUND_CACHE_TTL = 2 * BACKGROUND_REFRESH_INTERVAL
+
+
+# get_wallet_summary output, with the reserves part appended when known
+_WALLET_SUMMARY_TEMPLATE = """💰 **Wallet Summary**
+━━━━━━━━━━━━━━━━━━━━━
+**Address:** `{address}`
+**Network:** {network}
+
+**Balance:** {balance:,.6f} XRP
+**Sequence:** {sequence}
+**Objects Owned:** {owner_count}
+"""
+
+_WALLET_RESERVES_TEMPLATE = """
+**Reserves:**
+  • Base Reserve: {base_reserve} XRP
+  • Owner Reserve: {owner_reserve} XRP
+  • **Available:** {available_balance:,.6f} XRP
+"""
+
+
+class _PooledJsonRpcClient(AsyncJsonRpcClient):
+    """
+    JSON-RPC client that sends requests over a shared aiohttp session.
+    
+    xrpl-py's AsyncJsonRpcClient opens a fresh HTTP connection (and TLS
+    handshake) for every request; this one reuses the owning XRPLClient's
+    pooled keep-alive connections instead. At most max_requests requests
+    are in flight at once; the rest wait their turn before their timeout
+    starts.
+    
+    Overrides xrpl-py's private _request_impl, which is why requirements.txt
+    caps the xrpl-py version.
+    """
+    
+    def __init__(
+        self,
+        url: str,
+        get_session: Callable[[], "aiohttp.ClientSession"],
+        max_requests: int,
+    ):
+        super().__init__(url)
+        self._get_session = get_session
+        self._semaphore = asyncio.Semaphore(max_requests)
+    
+    async def _request_impl(self, request: Request, *, timeout: float = 10.0) -> Response:
+        import aiohttp
+        
+        try:
+            async with self._semaphore, self._get_session().post(
+                self.url,
+                json=request_to_json_rpc(request),
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as http_response:
+                try:
+                    return json_to_response(await http_response.json(content_type=None, loads=_json_loads))
+                except ValueError:
+                    raise XRPLRequestFailureException({
+                        "error": http_response.status,
+                        "error_message": await http_response.text(),
+                    })
+        except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError) as e:
+            # A keep-alive socket the server already closed, or a body cut
+            # short, is transient, but several of these aiohttp errors are
+            # not OSErrors; re-raise so XRPL_RETRY_EXCEPTIONS covers them
+            raise ConnectionError(f"{type(e).__name__}: {e}") from e
+
+
+class _PersistentWebsocketClient(AsyncWebsocketClient):
+    """
+    Websocket client that connects on first use and reconnects after drops.
+    
+    Drop-in for AsyncJsonRpcClient: requests share one open socket instead
+    of a new HTTPS connection each, and callers never need to open() it.
+    """
+    
+    def __init__(self, url: str):
+        super().__init__(url)
+        self._open_lock = asyncio.Lock()
+    
+    async def _request_impl(self, *args: Any, **kwargs: Any) -> Response:
+        if not self.is_open():
+            async with self._open_lock:
+                if not self.is_open():
+                    await self.open()
+        return await super()._request_impl(*args, **kwargs)
+
+
+class _NodeUnavailable(Exception):
+    """An XRPL node could not be reached, as opposed to answering 'no'."""
+
+
+def _whole_drops(drops: Union[str, int]) -> Optional[int]:
+    """Return drops as an int if it is a whole amount within the XRP supply."""
+    if isinstance(drops, str) and drops.isascii() and drops.isdigit():
+        drops = int(drops)
+    if type(drops) is int and 0 <= drops <= MAX_DROPS:
+        return drops
+    return None
+
+
+# Shape of a classic address: 'r' plus 24-34 characters of the XRPL
+# base58 alphabet. Anything else can be rejected without decoding it.
+_CLASSIC_ADDRESS_RE = re.compile(r"r[1-9A-HJ-NP-Za-km-z]{24,34}")
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_valid_classic_address(address: str) -> bool:
+    """Memoized address check; the bot validates the same users repeatedly."""
+    try:
+        return is_valid_classic_address(address)
+    except Exception:
+        return False
+
+
+# Non-standard currency codes: 160 bits as 40 hex digits
+_HEX_CURRENCY_RE = re.compile(r"[0-9A-Fa-f]{40}")
+
+
+@functools.lru_cache(maxsize=4096)
+def _decode_currency(code: str) -> str:
+    """Memoized XRPLClient.format_currency; chats show the same tokens repeatedly."""
+    if len(code) <= 3:
+        return code
+    if _HEX_CURRENCY_RE.fullmatch(code):
+        try:
+            name = bytes.fromhex(code).decode("utf-8").rstrip("\x00")
+        except UnicodeDecodeError:
+            name = ""  # Binary code, e.g. an AMM LP token
+        if name:
+            return name
+    return code[:8] + "..."
+
+
+def _is_batch_rejection(error: Exception) -> bool:
+    """Whether a failed batch POST means the node doesn't take batches at all."""
+    import aiohttp
+    
+    if isinstance(error, aiohttp.ClientResponseError):
+        return 400 <= error.status < 500 and error.status != 429
+    # _post_batch's checks for a JSON array answering every request id
+    return isinstance(error, ValueError)
+
+
+@functools.lru_cache(maxsize=1024)
+def _account_info_request(address: str, strict: bool) -> AccountInfo:
+    """
+    AccountInfo request for an address on the validated ledger.
+    
+    Memoized so retries, failover and repeat lookups of the same user reuse
+    one (frozen) request model instead of validating a new one each time.
+    """
+    return AccountInfo(
+        account=address,
+        ledger_index="validated",  # Use validated ledger for accuracy
+        strict=strict,               # Require exact account match
+    )
+
+
+def _tx_ledger_index(transaction: Dict[str, Any]) -> int:
+    """Ledger index of an account_tx entry (API v1 nests it under "tx")."""
+    if "ledger_index" in transaction:
+        return transaction["ledger_index"]
+    return transaction["tx"]["ledger_index"]
+
+
+def _ttl_cached(
+    ttl: float,
+    background_ttl: Optional[float] = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Cache a read-only XRPLClient query for ttl seconds.
+    
+    Results are keyed by method name and arguments. None (failure) is never
+    cached; instead a recently expired result is served if there is one.
+    Concurrent misses for the same key share a single upstream call.
+    Cached results are shared between callers and must not be modified.
+    
+    While the client's background refresh (XRPLClient.start) is running,
+    results are reused for background_ttl instead, if given. The decorated
+    method's .refresh(self, ...) fetches and caches a new result regardless.
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        name = func.__name__
+        
+        async def refresh(self: "XRPLClient", key: Tuple[Any, ...], args: Any, kwargs: Any) -> Any:
+            result = await func(self, *args, **kwargs)
+            if result is not None:
+                self._cache_put(key, result)
+                return result
+            
+            entry = self._cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < ttl + STALE_CACHE_TTL:
+                logger.warning(f"{name} failed, serving cached result")
+                return entry[1]
+            return None
+        
+        @functools.wraps(func)
+        async def wrapper(self: "XRPLClient", *args: Any, **kwargs: Any) -> Any:
+            key = (name, args, tuple(sorted(kwargs.items())))
+            entry = self._cache.get(key)
+            if entry is not None:
+                max_age = ttl
+                if background_ttl is not None and self._refresh_task is not None:
+                    max_age = background_ttl
+                if time.monotonic() - entry[0] < max_age:
+                    return entry[1]
+            
+            task = self._inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(refresh(self, key, args, kwargs))
+                self._inflight[key] = task
+                
+                def forget(done: "asyncio.Future[Any]") -> None:
+                    if self._inflight.get(key) is done:
+                        del self._inflight[key]
+                
+                task.add_done_callback(forget)
+            
+            # Shielded so one caller giving up doesn't cancel the others
+            return await asyncio.shield(task)
+        
+        async def force_refresh(self: "XRPLClient", *args: Any, **kwargs: Any) -> Any:
+            key = (name, args, tuple(sorted(kwargs.items())))
+            return await refresh(self, key, args, kwargs)
+        
+        wrapper.refresh = force_refresh  # type: ignore[attr-defined]
+        return wrapper
+    
+    return decorator
+
+
+async def gather_with_concurrency(n: int, *aws: Awaitable[Any]) -> List[Any]:
+    """
+    Like asyncio.gather, but with at most n of the awaitables running at once.
+    
+    Use for bulk queries so a long list of addresses doesn't flood the
+    node with simultaneous requests and get rate limited.
+    
+    Args:
+        n: Maximum number of awaitables in flight
+        *aws: Coroutines to run
+        
+    Returns:
+        List of results, in the same order as aws
+    """
+    semaphore = asyncio.Semaphore(n)
+    
+    async def limited(aw: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await aw
+    
+    return await asyncio.gather(*(limited(aw) for aw in aws))
 
 
 class XRPLClient:
@@ -92,12 +445,15 @@ class XRPLClient:
     Asynchronous XRPL client for querying the XRP Ledger.
     
     This class provides methods to query account information, balances,
-    trust lines, transactions, and other XRPL data.
+    trust lines, transactions, and other XRPL data. Read-only queries are
+    cached for about one ledger (see ACCOUNT_CACHE_TTL), so results may
+    lag the network by a few seconds.
     
     Attributes:
         network (str): The network to connect to (mainnet/testnet/devnet)
-        rpc_url (str): The JSON-RPC endpoint URL
-        client (AsyncJsonRpcClient): The underlying xrpl-py client
+        rpc_url (str): The JSON-RPC (or websocket) endpoint URL
+        client (AsyncJsonRpcClient): The underlying xrpl-py client, an
+            AsyncWebsocketClient when created with websocket_url
         
     Example:
         >>> xrpl = XRPLClient(network="mainnet")
@@ -108,7 +464,10 @@ class XRPLClient:
     def __init__(
         self,
         network: str = "mainnet",
-        rpc_url: Optional[str] = None
+        rpc_url: Optional[str] = None,
+        websocket_url: Optional[str] = None,
+        max_concurrency: int = 16,
+        max_requests_per_node: int = 20,
     ):
         """
         Initialize the XRPL client.
@@ -116,21 +475,149 @@ class XRPLClient:
         Args:
             network: Network to connect to - "mainnet", "testnet", or "devnet"
             rpc_url: Optional custom RPC URL (overrides network selection)
+            websocket_url: Optional wss:// URL; if given, requests go over one
+                    persistent websocket instead of per-request HTTPS, and
+                    the client should be closed with close() when done.
+                    Failover still uses the network's JSON-RPC nodes.
+            max_concurrency: Most requests bulk queries (several addresses
+                    at once) keep in flight when sent individually
+            max_requests_per_node: Most JSON-RPC requests in flight to any
+                    one node; further requests queue, so bursts back off
+                    locally instead of being rate limited by the node
         """
         self.network = network.lower()
+        self.max_concurrency = max_concurrency
+        self.max_requests_per_node = max_requests_per_node
+        
+        # Nodes of the selected network, for failover and connectivity tests
+        self._node_urls: Tuple[str, ...] = XRPL_NETWORKS.get(self.network, ())
         
-        # Use custom URL or first URL from network list
-        if rpc_url:
+        # Use websocket URL, custom URL or first URL from network list
+        if websocket_url:
+            self.rpc_url = websocket_url
+        elif rpc_url:
             self.rpc_url = rpc_url
         else:
             network_urls = XRPL_NETWORKS.get(self.network, XRPL_NETWORKS["mainnet"])
             self.rpc_url = network_urls[0]
         
         # Initialize the async client
-        self.client = AsyncJsonRpcClient(self.rpc_url)
+        if websocket_url:
+            self.client = _PersistentWebsocketClient(websocket_url)
+        else:
+            self.client = _PooledJsonRpcClient(
+                self.rpc_url, self._get_session, max_requests_per_node
+            )
+        
+        # One client per node URL, reused by failover and connectivity tests
+        self._clients: Dict[str, Union[AsyncJsonRpcClient, AsyncWebsocketClient]] = {
+            self.rpc_url: self.client
+        }
+        
+        # Moving-average account_info latency per node URL (seconds), used
+        # to try the fastest nodes first on failover
+        self._node_latency: Dict[str, float] = {}
+        
+        # Node URLs that rejected a JSON-RPC array batch (rippled doesn't
+        # support them); batch_request sends to these individually
+        self._batch_unsupported: Set[str] = set()
+        
+        # Per-node circuit breaker: URL -> (consecutive failures, monotonic
+        # time until which the node is skipped)
+        self._node_circuit: Dict[str, Tuple[int, float]] = {}
+        
+        # Read-only query results keyed by (method, args, kwargs), stored
+        # with the monotonic time they were fetched (see _ttl_cached)
+        self._cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        
+        # Cache refreshes in progress, by the same key, so concurrent
+        # identical queries wait for one request instead of each sending one
+        self._inflight: Dict[Tuple[Any, ...], "asyncio.Future[Any]"] = {}
+        
+        # Validated transactions by hash; these never change, so they are
+        # only evicted (least recently used first) when the cache is full
+        self._tx_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # Background refresh of fee, server and ledger info; see start()
+        self._refresh_task: Optional["asyncio.Task[None]"] = None
+        
+        # HTTP session shared by every JSON-RPC node client and
+        # batch_request, created on first request
+        self._session: Optional["aiohttp.ClientSession"] = None
         
         logger.info(f"XRPLClient initialized for {self.network} at {self.rpc_url}")
     
+    async def __aenter__(self) -> "XRPLClient":
+        return self
+    
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.close()
+    
+    async def start(self) -> None:
+        """
+        Start refreshing fee, server and ledger info in the background.
+        
+        Every BACKGROUND_REFRESH_INTERVAL seconds the latest get_current_fee(),
+        get_server_info() and get_ledger_info() results are fetched
+        together, so calls to those methods (and the reserve settings
+        derived from server info) answer from memory. Costs three requests
+        per interval whether or not anyone asks; stopped by close().
+        """
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+    
+    async def _refresh_loop(self) -> None:
+        """Keep the background-refreshed results current until cancelled."""
+        cls = type(self)
+        while True:
+            await asyncio.gather(
+                cls.get_current_fee.refresh(self),
+                cls.get_server_info.refresh(self),
+                cls.get_ledger_info.refresh(self),
+            )
+            await asyncio.sleep(BACKGROUND_REFRESH_INTERVAL)
+    
+    async def close(self) -> None:
+        """
+        Stop the background refresh and close open connections.
+        
+        Closes the HTTP session and any open websocket connection.
+        Should be called when shutting down; the client can still be
+        used afterwards and reopens connections on next use.
+        """
+        task = self._refresh_task
+        self._refresh_task = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        
+        for client in self._clients.values():
+            if isinstance(client, AsyncWebsocketClient) and client.is_open():
+                await client.close()
+        
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            # aiohttp is only imported once a request is actually made
+            import aiohttp
+            
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=BATCH_TIMEOUT),
+                connector=aiohttp.TCPConnector(
+                    limit=0,
+                    limit_per_host=self.max_requests_per_node,
+                    ttl_dns_cache=300,
+                ),
+            )
+        return self._session
+    
     # =========================================================================
     # UTILITY METHODS
     # =========================================================================
@@ -155,9 +642,13 @@ class XRPLClient:
             False
         """
         try:
-            return is_valid_classic_address(address)
-        except Exception:
-            return False
+            # Cheap shape check first, which also keeps junk out of the
+            # memoized checksum validation
+            if not _CLASSIC_ADDRESS_RE.fullmatch(address):
+                return False
+            return _is_valid_classic_address(address)
+        except TypeError:
+            return False  # Not a string
     
     @staticmethod
     def drops_to_xrp(drops: Union[str, int]) -> Decimal:
@@ -172,6 +663,12 @@ class XRPLClient:
         Returns:
             Decimal: Amount in XRP
         """
+        # Whole drops within the XRP supply need no validation beyond
+        # _whole_drops, so shift the decimal point directly (giving the
+        # same six-place Decimal as xrpl-py); xrpl-py handles the rest
+        whole_drops = _whole_drops(drops)
+        if whole_drops is not None:
+            return Decimal(whole_drops).scaleb(-XRP_DECIMAL_PLACES)
         return drops_to_xrp(str(drops))
     
     @staticmethod
@@ -185,6 +682,20 @@ class XRPLClient:
         Returns:
             str: Amount in drops
         """
+        # Whole XRP and plain decimal strings convert exactly with integer
+        # arithmetic; anything else (floats, Decimals, exponents, too many
+        # places, out of range) goes through xrpl-py's checks
+        drops = None
+        if type(xrp) is int:
+            drops = xrp * DROPS_PER_XRP
+        elif isinstance(xrp, str):
+            match = _XRP_AMOUNT_RE.fullmatch(xrp)
+            if match:
+                whole, fraction = match.groups()
+                drops = int(whole) * DROPS_PER_XRP + int((fraction or "").ljust(6, "0"))
+        if drops is not None and 0 <= drops <= MAX_DROPS:
+            return str(drops)
+        
         return xrp_to_drops(Decimal(str(xrp)))
     
     @staticmethod
@@ -203,9 +714,136 @@ class XRPLClient:
             >>> XRPLClient.format_xrp("1000000")
             '1.000000 XRP'
         """
-        xrp_amount = drops_to_xrp(str(drops))
+        # Whole drops within the XRP supply format exactly at full
+        # precision with integer arithmetic, no Decimal needed
+        if decimal_places == XRP_DECIMAL_PLACES:
+            whole_drops = _whole_drops(drops)
+            if whole_drops is not None:
+                whole, fraction = divmod(whole_drops, DROPS_PER_XRP)
+                return f"{whole}.{fraction:06d} XRP"
+        
+        xrp_amount = XRPLClient.drops_to_xrp(drops)
         return f"{xrp_amount:.{decimal_places}f} XRP"
     
+    @staticmethod
+    def format_currency(code: str) -> str:
+        """
+        Format a currency code for display.
+        
+        Standard codes are three characters. Longer codes are 40 hex
+        digits, usually an ASCII name padded with zero bytes; those that
+        don't decode to text are shown shortened.
+        
+        Args:
+            code: Currency code from a trust line or amount
+            
+        Returns:
+            str: Display name of the currency
+            
+        Example:
+            >>> XRPLClient.format_currency("534F4C4F00000000000000000000000000000000")
+            'SOLO'
+        """
+        return _decode_currency(code)
+    
+    def _get_client(self, url: str) -> AsyncJsonRpcClient:
+        """Return the client for a node URL, creating it on first use."""
+        client = self._clients.get(url)
+        if client is None:
+            client = self._clients[url] = _PooledJsonRpcClient(
+                url, self._get_session, self.max_requests_per_node
+            )
+        return client
+    
+    def _record_latency(self, url: str, elapsed: float, succeeded: bool) -> None:
+        """Fold one request's outcome into the node's latency estimate."""
+        latency = self._node_latency.get(url, INITIAL_NODE_LATENCY)
+        if succeeded:
+            latency += LATENCY_EMA_WEIGHT * (elapsed - latency)
+        else:
+            latency *= LATENCY_FAILURE_PENALTY
+        self._node_latency[url] = latency
+    
+    async def _timed_account_info(
+        self,
+        address: str,
+        strict: bool,
+        url: str,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch account info from one node, recording its latency.
+        
+        Nodes that recently failed to answer are skipped (returning None)
+        for a window that doubles with each consecutive failure.
+        """
+        failures, skip_until = self._node_circuit.get(url, (0, 0.0))
+        if time.monotonic() < skip_until:
+            logger.debug("Skipping node %s after %d failures", url, failures)
+            return None
+        
+        started = time.monotonic()
+        try:
+            result = await self._try_get_account_info(address, strict, self._get_client(url))
+        except _NodeUnavailable as e:
+            logger.debug("Node %s unavailable: %s", url, e)
+            self._record_latency(url, time.monotonic() - started, False)
+            failures += 1
+            self._node_circuit[url] = (
+                failures,
+                time.monotonic() + min(MAX_NODE_CIRCUIT_OPEN, 2.0 ** failures),
+            )
+            return None
+        
+        self._record_latency(url, time.monotonic() - started, True)
+        self._node_circuit.pop(url, None)
+        return result
+    
+    @_retry_transient
+    async def _request(self, request: Request) -> Response:
+        """
+        Send a request to the current node, retrying transient network errors.
+        
+        Error responses are returned as usual. Network errors are raised
+        once the retries run out, and anything else immediately.
+        """
+        return await self.client.request(request)
+    
+    async def _call(self, request: Request, what: str) -> Optional[Dict[str, Any]]:
+        """
+        Send a request and return its result, None on failure.
+        
+        Error responses and exceptions are logged here, so the query
+        methods only pick their data out of a successful result.
+        
+        Args:
+            request: xrpl-py request model
+            what: What is being fetched, for the error log (e.g. "offers")
+        """
+        try:
+            response = await self._request(request)
+        except Exception as e:
+            logger.error("Error getting %s: %s", what, e, exc_info=True)
+            return None
+        
+        if not response.is_successful():
+            logger.error("%s failed: %s", request.method.value, response.result.get("error_message"))
+            return None
+        return response.result
+    
+    def _cache_put(self, key: Tuple[Any, ...], value: Any) -> None:
+        """Cache a query result, evicting the oldest entry when full."""
+        self._cache.pop(key, None)
+        if len(self._cache) >= QUERY_CACHE_MAX_ENTRIES:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (time.monotonic(), value)
+    
+    def _cached_account_info(self, address: str) -> Optional[Dict[str, Any]]:
+        """Return get_account_info(address)'s cached result if still fresh."""
+        entry = self._cache.get(("get_account_info", (address,), ()))
+        if entry is not None and time.monotonic() - entry[0] < ACCOUNT_CACHE_TTL:
+            return entry[1]
+        return None
+    
     # =========================================================================
     # ACCOUNT INFORMATION METHODS
     # =========================================================================
@@ -214,50 +852,60 @@ class XRPLClient:
         """
         Test connectivity to all available XRPL nodes.
         
+        Nodes are probed concurrently, each bounded by
+        CONNECTIVITY_TIMEOUT, so the test takes as long as the slowest
+        node rather than the sum of all of them.
+        
         Returns:
             Dict: Connectivity test results for each node
         """
-        results = {}
+        urls = self._node_urls
+        results = await asyncio.gather(*(self._probe_node(url) for url in urls))
+        return dict(zip(urls, results))
+    
+    async def _probe_node(self, url: str) -> Dict[str, Any]:
+        """Send server_info to one node and summarize the outcome."""
+        logger.info(f"Testing connectivity to {url}")
         
-        for url in XRPL_NETWORKS.get(self.network, []):
-            logger.info(f"Testing connectivity to {url}")
+        try:
+            test_client = self._get_client(url)
             
-            try:
-                # Create a temporary client for this URL
-                test_client = AsyncJsonRpcClient(url)
-                
-                # Try a simple server_info request
-                response = await test_client.request(ServerInfo())
-                
-                if response.is_successful():
-                    server_info = response.result.get("info", {})
-                    results[url] = {
-                        "success": True,
-                        "ledger_index": server_info.get("validated_ledger", {}).get("seq", "N/A"),
-                        "build_version": server_info.get("build_version", "N/A"),
-                        "node": server_info.get("node", "N/A"),
-                        "network": server_info.get("network_id", "N/A")
-                    }
-                    logger.info(f"Successfully connected to {url}")
-                else:
-                    results[url] = {
-                        "success": False,
-                        "error": response.result.get("error", "Unknown error")
-                    }
-                    logger.error(f"Failed to connect to {url}: {response.result}")
-                
-                # Close the test client (AsyncJsonRpcClient doesn't have explicit close)
-                # It will be cleaned up by garbage collection
-                
-            except Exception as e:
-                results[url] = {
-                    "success": False,
-                    "error": str(e)
+            # Try a simple server_info request
+            response = await asyncio.wait_for(
+                test_client.request(_SERVER_INFO_REQUEST), timeout=CONNECTIVITY_TIMEOUT
+            )
+            
+            if response.is_successful():
+                server_info = response.result.get("info", {})
+                logger.info(f"Successfully connected to {url}")
+                return {
+                    "success": True,
+                    "ledger_index": server_info.get("validated_ledger", {}).get("seq", "N/A"),
+                    "build_version": server_info.get("build_version", "N/A"),
+                    "node": server_info.get("node", "N/A"),
+                    "network": server_info.get("network_id", "N/A")
                 }
-                logger.error(f"Error testing {url}: {e}")
-        
-        return results
+            
+            logger.error(f"Failed to connect to {url}: {response.result}")
+            return {
+                "success": False,
+                "error": response.result.get("error", "Unknown error")
+            }
+            
+        except asyncio.TimeoutError:
+            logger.error(f"Timed out testing {url}")
+            return {
+                "success": False,
+                "error": f"Timed out after {CONNECTIVITY_TIMEOUT:.0f}s"
+            }
+        except Exception as e:
+            logger.error("Error testing %s: %s", url, e, exc_info=True)
+            return {
+                "success": False,
+                "error": str(e)
+            }
 
+    @_ttl_cached(ACCOUNT_CACHE_TTL)
     async def get_account_info(self, address: str, strict: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get detailed account information from the XRPL.
@@ -281,41 +929,80 @@ class XRPLClient:
             logger.error(f"Invalid XRP address: {address}")
             return None
         
-        # Try the current node first
-        result = await self._try_get_account_info(address, strict, self.client)
+        # Try the current node first. The address is already validated as
+        # a classic address, for which strict and non-strict lookups find
+        # the same accounts, so a miss is not retried with strict=False.
+        result = await self._timed_account_info(address, strict, self.rpc_url)
         if result is not None:
             return result
         
-        # If current node failed, try other nodes
+        # If current node failed, race the historically fastest other
+        # nodes, then the rest, and keep the first one that answers.
         logger.warning(f"Current node {self.rpc_url} failed, trying other nodes")
-        for url in XRPL_NETWORKS.get(self.network, []):
-            if url == self.rpc_url:
-                continue  # Skip the one we already tried
-            
+        other_urls = sorted(
+            (url for url in self._node_urls if url != self.rpc_url),
+            key=lambda url: self._node_latency.get(url, INITIAL_NODE_LATENCY),
+        )
+        winner = await self._race_account_info(address, strict, other_urls[:FAILOVER_RACE_WIDTH])
+        if winner is None and len(other_urls) > FAILOVER_RACE_WIDTH:
+            winner = await self._race_account_info(address, strict, other_urls[FAILOVER_RACE_WIDTH:])
+        if winner is not None:
+            url, client, result = winner
+            logger.info(f"Successfully fetched account info from {url}")
+            # Update to use this node for future requests
+            self.client = client
+            self.rpc_url = url
+            return result
+        
+        logger.error(f"All nodes failed to get account info for {address}")
+        return None
+    
+    async def _race_account_info(
+        self,
+        address: str,
+        strict: bool,
+        urls: List[str],
+    ) -> Optional[Tuple[str, AsyncJsonRpcClient, Dict[str, Any]]]:
+        """
+        Query several nodes at once and return the first successful answer.
+        
+        Only used after the current node has failed, so healthy operation
+        still sends each lookup to a single node.
+        
+        Returns:
+            (url, client, account data) of the winning node, None if all fail
+        """
+        async def attempt(url: str) -> Optional[Tuple[str, AsyncJsonRpcClient, Dict[str, Any]]]:
             logger.info(f"Trying node {url}")
             try:
-                temp_client = AsyncJsonRpcClient(url)
-                result = await self._try_get_account_info(address, strict, temp_client)
-                # No need to close AsyncJsonRpcClient explicitly
-                
-                if result is not None:
-                    logger.info(f"Successfully fetched account info from {url}")
-                    # Update to use this node for future requests
-                    self.client = AsyncJsonRpcClient(url)
-                    self.rpc_url = url
-                    return result
-                    
+                result = await self._timed_account_info(address, strict, url)
             except Exception as e:
-                logger.error(f"Error trying node {url}: {e}")
+                logger.error("Error trying node %s: %s", url, e, exc_info=True)
+                return None
+            return None if result is None else (url, self._get_client(url), result)
         
-        logger.error(f"All nodes failed to get account info for {address}")
-        return None
+        pending = {asyncio.create_task(attempt(url)) for url in urls}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    winner = task.result()
+                    if winner is not None:
+                        return winner
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+            # Let the cancelled lookups unwind before returning so they
+            # don't outlive the caller or warn about unretrieved exceptions
+            await asyncio.gather(*pending, return_exceptions=True)
     
     async def _try_get_account_info(self, address: str, strict: bool, client: AsyncJsonRpcClient) -> Optional[Dict[str, Any]]:
         """
         Try to get account info from a specific client.
         
         This method includes automatic retry logic for transient network failures.
+        Raises _NodeUnavailable if the node could not be asked at all.
         """
         return await self._try_get_account_info_with_retry(address, strict, client)
     
@@ -339,6 +1026,9 @@ class XRPLClient:
             
         Returns:
             Account data dict or None
+            
+        Raises:
+            _NodeUnavailable: If the node could not be reached in any attempt
         """
         last_exception = None
         
@@ -348,16 +1038,23 @@ class XRPLClient:
             except XRPL_RETRY_EXCEPTIONS as e:
                 last_exception = e
                 if attempt < max_retries - 1:
-                    delay = base_delay * (2 ** attempt)  # Exponential backoff
-                    logger.warning(
-                        f"XRPL request failed (attempt {attempt + 1}/{max_retries}): {e}. "
-                        f"Retrying in {delay:.1f}s..."
+                    # Capped exponential backoff, spread by 0.5x-1.5x so
+                    # concurrent callers don't retry in lockstep
+                    delay = min(MAX_RETRY_BACKOFF, base_delay * (2 ** attempt))
+                    delay *= 0.5 + random.random()
+                    # Expected now and then; only the final failure is an error
+                    logger.debug(
+                        "XRPL request failed (attempt %d/%d): %s. Retrying in %.1fs...",
+                        attempt + 1, max_retries, e, delay,
                     )
                     await asyncio.sleep(delay)
                 else:
-                    logger.error(f"XRPL request failed after {max_retries} attempts: {e}")
+                    logger.error(
+                        "XRPL request failed after %d attempts: %s",
+                        max_retries, e, exc_info=True,
+                    )
         
-        return None
+        raise _NodeUnavailable(str(last_exception)) from last_exception
     
     async def _execute_account_info_request(
         self,
@@ -365,44 +1062,64 @@ class XRPLClient:
         strict: bool,
         client: AsyncJsonRpcClient,
     ) -> Optional[Dict[str, Any]]:
-        """Execute the actual account info request."""
+        """
+        Execute the actual account info request.
+        
+        Transient network errors (XRPL_RETRY_EXCEPTIONS) propagate so the
+        caller can retry them; any other error raises _NodeUnavailable.
+        """
         try:
-            # Build the AccountInfo request
-            request = AccountInfo(
-                account=address,
-                ledger_index="validated",  # Use validated ledger for accuracy
-                strict=strict,               # Require exact account match
-            )
-            
             # Send the request
-            response: Response = await client.request(request)
+            response: Response = await client.request(_account_info_request(address, strict))
             
+            result = response.result
             if response.is_successful():
-                return response.result.get("account_data")
+                return result.get("account_data")
             else:
-                error = response.result.get('error')
-                error_message = response.result.get('error_message', response.result.get('error_text', 'Unknown error'))
-                logger.debug(f"AccountInfo failed for {address}: {error} - {error_message}")
-                
-                # If account not found and we're using strict mode, try without strict
-                if error == "actNotFound" and strict:
-                    logger.debug(f"Account not found with strict=True, retrying with strict=False")
-                    request = AccountInfo(
-                        account=address,
-                        ledger_index="validated",
-                        strict=False,  # Try without strict mode
-                    )
-                    
-                    response: Response = await client.request(request)
-                    if response.is_successful():
-                        return response.result.get("account_data")
-                    else:
-                        logger.debug(f"AccountInfo retry failed: {response.result.get('error_message')}")
+                error = result.get('error')
+                error_message = result.get('error_message') or result.get('error_text') or 'Unknown error'
+                logger.debug("AccountInfo failed for %s: %s - %s", address, error, error_message)
+                return None
                 
+        except XRPL_RETRY_EXCEPTIONS:
+            raise  # Transient, retried by _try_get_account_info_with_retry
+        except Exception as e:
+            logger.debug("Error getting account info: %s", e)
+            raise _NodeUnavailable(str(e)) from e
+    
+    async def get_account_info_with_ledger(
+        self,
+        address: str,
+    ) -> Optional[Tuple[Dict[str, Any], int]]:
+        """
+        Get account information together with the ledger it was read from.
+        
+        Callers that need to know which validated ledger an answer reflects
+        get it from the same AccountInfo response instead of a separate
+        get_ledger_info() request.
+        
+        Args:
+            address: The XRP wallet address
+            
+        Returns:
+            (account data, validated ledger index), None if the account
+            was not found or on failure
+        """
+        if not self.is_valid_address(address):
+            logger.error(f"Invalid XRP address: {address}")
+            return None
+        
+        try:
+            response = await self._request(_account_info_request(address, True))
+            
+            if response.is_successful():
+                return response.result["account_data"], response.result["ledger_index"]
+            else:
+                logger.debug("AccountInfo failed for %s: %s", address, response.result.get("error"))
                 return None
                 
         except Exception as e:
-            logger.debug(f"Error getting account info: {e}")
+            logger.error("Error getting account info: %s", e, exc_info=True)
             return None
     
     async def get_account_balance(self, address: str) -> Optional[Decimal]:
@@ -468,55 +1185,42 @@ class XRPLClient:
             "lookup_results": {}
         }
         
-        if not result["valid_address"]:
-            result["error"] = "Invalid address format"
-            return result
-        
-        # Try with strict=True
-        logger.info(f"Testing account lookup for {address} with strict=True")
-        request = AccountInfo(
-            account=address,
-            ledger_index="validated",
-            strict=True,
-        )
-        
-        try:
-            response: Response = await self.client.request(request)
-            result["lookup_results"]["strict"] = {
-                "success": response.is_successful(),
-                "result": response.result if response.is_successful() else response.result.get('error_message'),
-                "full_response": response.result
-            }
-        except Exception as e:
-            result["lookup_results"]["strict"] = {
-                "success": False,
-                "error": str(e)
-            }
+        if not result["valid_address"]:
+            result["error"] = "Invalid address format"
+            return result
         
-        # Try with strict=False
-        logger.info(f"Testing account lookup for {address} with strict=False")
-        request = AccountInfo(
-            account=address,
-            ledger_index="validated",
-            strict=False,
+        # Try with strict=True and strict=False concurrently
+        logger.info(f"Testing account lookup for {address} with strict=True and strict=False")
+        responses = await asyncio.gather(
+            *(
+                self.client.request(_account_info_request(address, strict))
+                for strict in (True, False)
+            ),
+            return_exceptions=True,
         )
         
-        try:
-            response: Response = await self.client.request(request)
-            result["lookup_results"]["not_strict"] = {
-                "success": response.is_successful(),
-                "result": response.result if response.is_successful() else response.result.get('error_message'),
-                "full_response": response.result
-            }
-        except Exception as e:
-            result["lookup_results"]["not_strict"] = {
-                "success": False,
-                "error": str(e)
-            }
+        for name, response in zip(("strict", "not_strict"), responses):
+            if isinstance(response, BaseException) and not isinstance(response, Exception):
+                raise response  # Cancellation and the like are not lookup failures
+            if isinstance(response, Exception):
+                result["lookup_results"][name] = {
+                    "success": False,
+                    "error": str(response)
+                }
+            else:
+                result["lookup_results"][name] = {
+                    "success": response.is_successful(),
+                    "result": response.result if response.is_successful() else response.result.get('error_message'),
+                    "full_response": response.result
+                }
         
         return result
 
-    async def get_account_reserve(self, address: str) -> Optional[Dict[str, Decimal]]:
+    async def get_account_reserve(
+        self,
+        address: str,
+        account_info: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Decimal]]:
         """
         Calculate the account reserve requirements.
         
@@ -525,46 +1229,76 @@ class XRPLClient:
         
         Args:
             address: The XRP wallet address
+            account_info: The account's data if the caller already fetched
+                    it with get_account_info; saves looking it up again
             
         Returns:
             Dict with 'base_reserve', 'owner_reserve', 'total_reserve', 'available'
         """
-        account_info = await self.get_account_info(address)
-        server_info = await self.get_server_info()
+        if account_info is None:
+            # Independent lookups, so fetch them concurrently
+            account_info, reserve_drops = await asyncio.gather(
+                self.get_account_info(address),
+                self._get_reserve_drops(),
+            )
+        else:
+            reserve_drops = await self._get_reserve_drops()
+        
+        if account_info is None or reserve_drops is None:
+            return None
+        
+        return self._calculate_reserve(account_info, reserve_drops)
+    
+    @_ttl_cached(RESERVE_CACHE_TTL)
+    async def _get_reserve_drops(self) -> Optional[Tuple[int, int]]:
+        """
+        Get the network's reserve settings from server_info.
         
-        if account_info is None or server_info is None:
+        Returns:
+            (base reserve, reserve per owned object) in drops, None on failure
+        """
+        server_info = await self.get_server_info()
+        if server_info is None:
             return None
         
-        # Get reserve requirements from server info
+        # Reserves are reported in XRP and may be fractional (e.g. 0.2)
         validated_ledger = server_info.get("validated_ledger", {})
-        base_reserve_drops = int(validated_ledger.get("reserve_base_xrp", 10)) * 1000000
-        owner_reserve_drops = int(validated_ledger.get("reserve_inc_xrp", 2)) * 1000000
+        base_reserve = Decimal(str(validated_ledger.get("reserve_base_xrp", 10)))
+        owner_reserve = Decimal(str(validated_ledger.get("reserve_inc_xrp", 2)))
+        return int(base_reserve * DROPS_PER_XRP), int(owner_reserve * DROPS_PER_XRP)
+    
+    def _calculate_reserve(
+        self,
+        account_info: Dict[str, Any],
+        reserve_drops: Tuple[int, int],
+    ) -> Dict[str, Decimal]:
+        """Work out reserves and available balance (see get_account_reserve)."""
+        base_reserve_drops, owner_reserve_drops = reserve_drops
         
         # Count owner items
         owner_count = account_info.get("OwnerCount", 0)
         
-        # Calculate reserves
-        base_reserve = self.drops_to_xrp(base_reserve_drops)
-        owner_reserve = self.drops_to_xrp(owner_reserve_drops * owner_count)
-        total_reserve = base_reserve + owner_reserve
-        
-        # Calculate available balance
-        balance = self.drops_to_xrp(account_info.get("Balance", "0"))
-        available = max(Decimal("0"), balance - total_reserve)
+        # Calculate reserves and available balance in whole drops, and
+        # only convert the results to XRP
+        owner_reserve_drops *= owner_count
+        total_reserve_drops = base_reserve_drops + owner_reserve_drops
+        balance_drops = int(account_info.get("Balance", "0"))
+        available_drops = max(0, balance_drops - total_reserve_drops)
         
         return {
-            "base_reserve": base_reserve,
-            "owner_reserve": owner_reserve,
+            "base_reserve": self.drops_to_xrp(base_reserve_drops),
+            "owner_reserve": self.drops_to_xrp(owner_reserve_drops),
             "owner_count": owner_count,
-            "total_reserve": total_reserve,
-            "total_balance": balance,
-            "available_balance": available,
+            "total_reserve": self.drops_to_xrp(total_reserve_drops),
+            "total_balance": self.drops_to_xrp(balance_drops),
+            "available_balance": self.drops_to_xrp(available_drops),
         }
     
     # =========================================================================
     # TRUST LINES AND TOKENS
     # =========================================================================
     
+    @_ttl_cached(ACCOUNT_CACHE_TTL)
     async def get_account_trust_lines(
         self,
         address: str,
@@ -586,24 +1320,51 @@ class XRPLClient:
             logger.error(f"Invalid XRP address: {address}")
             return None
         
-        try:
-            request = AccountLines(
-                account=address,
-                ledger_index="validated",
-                limit=limit,
+        result = await self._call(
+            AccountLines(account=address, ledger_index="validated", limit=limit),
+            "trust lines",
+        )
+        return None if result is None else result.get("lines", [])
+    
+    async def iter_account_trust_lines(
+        self,
+        address: str,
+        page_size: int = 400
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over all trust lines of an account, one page at a time.
+        
+        Unlike get_account_trust_lines this follows the result marker, so
+        it covers accounts with any number of lines; callers can stop
+        early without fetching the remaining pages. Failures are logged
+        and end the iteration.
+        
+        Args:
+            address: The XRP wallet address
+            page_size: Trust lines to request per page (servers cap at 400)
+            
+        Yields:
+            Trust line objects
+        """
+        if not self.is_valid_address(address):
+            logger.error(f"Invalid XRP address: {address}")
+            return
+        
+        marker = None
+        while True:
+            result = await self._call(
+                AccountLines(account=address, ledger_index="validated", limit=page_size, marker=marker),
+                "trust lines",
             )
+            if result is None:
+                return
             
-            response = await self.client.request(request)
+            for line in result.get("lines", []):
+                yield line
             
-            if response.is_successful():
-                return response.result.get("lines", [])
-            else:
-                logger.error(f"AccountLines failed: {response.result.get('error_message')}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error getting trust lines: {e}")
-            return None
+            marker = result.get("marker")
+            if not marker:
+                return
     
     async def get_token_balances(
         self,
@@ -625,10 +1386,14 @@ class XRPLClient:
         if trust_lines is None:
             return None
         
+        # Only include lines with non-zero balance. Most lines hold
+        # exactly "0", so those are skipped without parsing.
         balances = []
         for line in trust_lines:
-            # Only include lines with non-zero balance
-            balance = Decimal(line.get("balance", "0"))
+            raw_balance = line.get("balance", "0")
+            if raw_balance == "0":
+                continue
+            balance = Decimal(raw_balance)
             if balance != 0:
                 balances.append({
                     "currency": line.get("currency"),
@@ -663,26 +1428,147 @@ class XRPLClient:
             logger.error(f"Invalid XRP address: {address}")
             return None
         
-        try:
-            request = AccountTx(
-                account=address,
-                ledger_index_min=-1,  # Earliest available
-                ledger_index_max=-1,  # Latest available
-                limit=limit,
-                forward=forward,
-            )
+        # -1 for both bounds: all available ledgers
+        result = await self._account_tx_page(address, -1, -1, limit, forward, None)
+        return None if result is None else result.get("transactions", [])
+    
+    async def iter_account_transactions(
+        self,
+        address: str,
+        page_size: int = 200,
+        forward: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over an account's transaction history, one page at a time.
+        
+        Follows the result marker like iter_account_trust_lines; callers
+        can stop early without fetching the remaining pages. Failures are
+        logged and end the iteration.
+        
+        Args:
+            address: The XRP wallet address
+            page_size: Transactions to request per page
+            forward: If True, oldest first; if False, newest first
             
-            response = await self.client.request(request)
+        Yields:
+            Transaction objects
+        """
+        if not self.is_valid_address(address):
+            logger.error(f"Invalid XRP address: {address}")
+            return
+        
+        marker = None
+        while True:
+            # -1 for both bounds: all available ledgers
+            result = await self._account_tx_page(address, -1, -1, page_size, forward, marker)
+            if result is None:
+                return
             
-            if response.is_successful():
-                return response.result.get("transactions", [])
-            else:
-                logger.error(f"AccountTx failed: {response.result.get('error_message')}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error getting transactions: {e}")
+            for transaction in result.get("transactions", []):
+                yield transaction
+            
+            marker = result.get("marker")
+            if not marker:
+                return
+    
+    async def get_all_account_transactions(
+        self,
+        address: str,
+        page_size: int = 200,
+        forward: bool = False
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get an account's entire transaction history.
+        
+        Markers only lead from one page to the next, so a single chain of
+        pages costs one round trip per page. After the first page, the
+        rest of the ledger range it reports is split into
+        HISTORY_FETCH_SLICES slices whose pages are fetched concurrently,
+        bounded by the node's request limit.
+        
+        Args:
+            address: The XRP wallet address
+            page_size: Transactions to request per page
+            forward: If True, oldest first; if False, newest first
+            
+        Returns:
+            List of transaction objects, None on failure
+        """
+        if not self.is_valid_address(address):
+            logger.error(f"Invalid XRP address: {address}")
+            return None
+        
+        first = await self._account_tx_page(address, -1, -1, page_size, forward, None)
+        if first is None:
             return None
+        transactions = first.get("transactions", [])
+        if not first.get("marker") or not transactions:
+            return transactions
+        
+        # The first page may stop partway through its last ledger, so that
+        # ledger is fetched again as part of the remaining range
+        boundary = _tx_ledger_index(transactions[-1])
+        transactions = [tx for tx in transactions if _tx_ledger_index(tx) != boundary]
+        if forward:
+            low, high = boundary, first["ledger_index_max"]
+        else:
+            low, high = first["ledger_index_min"], boundary
+        
+        slice_count = min(HISTORY_FETCH_SLICES, high - low + 1)
+        step = -(-(high - low + 1) // slice_count)
+        ranges = [(start, min(start + step - 1, high)) for start in range(low, high + 1, step)]
+        if not forward:
+            ranges.reverse()
+        
+        pages = await asyncio.gather(*(
+            self._account_tx_range(address, start, end, page_size, forward)
+            for start, end in ranges
+        ))
+        if any(page is None for page in pages):
+            return None
+        for page in pages:
+            transactions.extend(page)
+        return transactions
+    
+    async def _account_tx_range(
+        self,
+        address: str,
+        ledger_min: int,
+        ledger_max: int,
+        page_size: int,
+        forward: bool,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Page through one ledger range of account_tx, None on failure."""
+        transactions = []
+        marker = None
+        while True:
+            result = await self._account_tx_page(address, ledger_min, ledger_max, page_size, forward, marker)
+            if result is None:
+                return None
+            transactions.extend(result.get("transactions", []))
+            marker = result.get("marker")
+            if not marker:
+                return transactions
+    
+    async def _account_tx_page(
+        self,
+        address: str,
+        ledger_min: int,
+        ledger_max: int,
+        page_size: int,
+        forward: bool,
+        marker: Any,
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch one account_tx page, returning its result or None on failure."""
+        request = AccountTx(
+            account=address,
+            ledger_index_min=ledger_min,
+            ledger_index_max=ledger_max,
+            limit=page_size,
+            forward=forward,
+            marker=marker,
+        )
+        return await self._call(request, "transactions")
     
     async def get_transaction(self, tx_hash: str) -> Optional[Dict[str, Any]]:
         """
@@ -694,19 +1580,19 @@ class XRPLClient:
         Returns:
             Transaction details, None on failure
         """
-        try:
-            request = Tx(transaction=tx_hash)
-            response = await self.client.request(request)
-            
-            if response.is_successful():
-                return response.result
-            else:
-                logger.error(f"Tx lookup failed: {response.result.get('error_message')}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error getting transaction: {e}")
-            return None
+        cached = self._tx_cache.pop(tx_hash, None)
+        if cached is not None:
+            self._tx_cache[tx_hash] = cached
+            return cached
+        
+        result = await self._call(Tx(transaction=tx_hash), "transaction")
+        
+        # Only validated transactions are final and safe to keep
+        if result is not None and result.get("validated"):
+            if len(self._tx_cache) >= TX_CACHE_MAX_ENTRIES:
+                del self._tx_cache[next(iter(self._tx_cache))]
+            self._tx_cache[tx_hash] = result
+        return result
     
     # =========================================================================
     # ACCOUNT OBJECTS (NFTs, Offers, etc.)
@@ -735,26 +1621,13 @@ class XRPLClient:
             logger.error(f"Invalid XRP address: {address}")
             return None
         
-        try:
-            request = AccountObjects(
-                account=address,
-                ledger_index="validated",
-                limit=limit,
-                type=object_type,
-            )
-            
-            response = await self.client.request(request)
-            
-            if response.is_successful():
-                return response.result.get("account_objects", [])
-            else:
-                logger.error(f"AccountObjects failed: {response.result.get('error_message')}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error getting account objects: {e}")
-            return None
+        result = await self._call(
+            AccountObjects(account=address, ledger_index="validated", limit=limit, type=object_type),
+            "account objects",
+        )
+        return None if result is None else result.get("account_objects", [])
     
+    @_ttl_cached(ACCOUNT_CACHE_TTL)
     async def get_account_offers(self, address: str) -> Optional[List[Dict[str, Any]]]:
         """
         Get open DEX offers for an account.
@@ -769,24 +1642,10 @@ class XRPLClient:
             logger.error(f"Invalid XRP address: {address}")
             return None
         
-        try:
-            request = AccountOffers(
-                account=address,
-                ledger_index="validated",
-            )
-            
-            response = await self.client.request(request)
-            
-            if response.is_successful():
-                return response.result.get("offers", [])
-            else:
-                logger.error(f"AccountOffers failed: {response.result.get('error_message')}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error getting offers: {e}")
-            return None
+        result = await self._call(AccountOffers(account=address, ledger_index="validated"), "offers")
+        return None if result is None else result.get("offers", [])
     
+    @_ttl_cached(ACCOUNT_CACHE_TTL)
     async def get_account_nfts(self, address: str) -> Optional[List[Dict[str, Any]]]:
         """
         Get NFTs owned by an account.
@@ -801,23 +1660,8 @@ class XRPLClient:
             logger.error(f"Invalid XRP address: {address}")
             return None
         
-        try:
-            request = AccountNFTs(
-                account=address,
-                ledger_index="validated",
-            )
-            
-            response = await self.client.request(request)
-            
-            if response.is_successful():
-                return response.result.get("account_nfts", [])
-            else:
-                logger.error(f"AccountNFTs failed: {response.result.get('error_message')}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error getting NFTs: {e}")
-            return None
+        result = await self._call(AccountNFTs(account=address, ledger_index="validated"), "NFTs")
+        return None if result is None else result.get("account_nfts", [])
     
     async def get_account_currencies(self, address: str) -> Optional[Dict[str, List[str]]]:
         """
@@ -833,31 +1677,19 @@ class XRPLClient:
             logger.error(f"Invalid XRP address: {address}")
             return None
         
-        try:
-            request = AccountCurrencies(
-                account=address,
-                ledger_index="validated",
-            )
-            
-            response = await self.client.request(request)
-            
-            if response.is_successful():
-                return {
-                    "send_currencies": response.result.get("send_currencies", []),
-                    "receive_currencies": response.result.get("receive_currencies", []),
-                }
-            else:
-                logger.error(f"AccountCurrencies failed: {response.result.get('error_message')}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error getting currencies: {e}")
+        result = await self._call(AccountCurrencies(account=address, ledger_index="validated"), "currencies")
+        if result is None:
             return None
+        return {
+            "send_currencies": result.get("send_currencies", []),
+            "receive_currencies": result.get("receive_currencies", []),
+        }
     
     # =========================================================================
     # SERVER AND LEDGER INFORMATION
     # =========================================================================
     
+    @_ttl_cached(ACCOUNT_CACHE_TTL, BACKGROUND_CACHE_TTL)
     async def get_server_info(self) -> Optional[Dict[str, Any]]:
         """
         Get information about the connected XRPL server.
@@ -867,20 +1699,10 @@ class XRPLClient:
         Returns:
             Dict: Server information, None on failure
         """
-        try:
-            request = ServerInfo()
-            response = await self.client.request(request)
-            
-            if response.is_successful():
-                return response.result.get("info")
-            else:
-                logger.error(f"ServerInfo failed: {response.result.get('error_message')}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error getting server info: {e}")
-            return None
+        result = await self._call(_SERVER_INFO_REQUEST, "server info")
+        return None if result is None else result.get("info")
     
+    @_ttl_cached(FEE_CACHE_TTL, BACKGROUND_CACHE_TTL)
     async def get_current_fee(self) -> Optional[Dict[str, str]]:
         """
         Get current transaction fee information.
@@ -890,25 +1712,17 @@ class XRPLClient:
         Returns:
             Dict with fee information, None on failure
         """
-        try:
-            request = Fee()
-            response = await self.client.request(request)
-            
-            if response.is_successful():
-                drops = response.result.get("drops", {})
-                return {
-                    "minimum_fee": drops.get("minimum_fee"),
-                    "median_fee": drops.get("median_fee"),
-                    "open_ledger_fee": drops.get("open_ledger_fee"),
-                }
-            else:
-                logger.error(f"Fee request failed: {response.result.get('error_message')}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error getting fee: {e}")
+        result = await self._call(_FEE_REQUEST, "fee")
+        if result is None:
             return None
+        drops = result.get("drops", {})
+        return {
+            "minimum_fee": drops.get("minimum_fee"),
+            "median_fee": drops.get("median_fee"),
+            "open_ledger_fee": drops.get("open_ledger_fee"),
+        }
     
+    @_ttl_cached(ACCOUNT_CACHE_TTL, BACKGROUND_CACHE_TTL)
     async def get_ledger_info(
         self,
         ledger_index: Union[str, int] = "validated"
@@ -922,24 +1736,164 @@ class XRPLClient:
         Returns:
             Dict: Ledger information, None on failure
         """
-        try:
+        if ledger_index == "validated":
+            request = _VALIDATED_LEDGER_REQUEST
+        else:
             request = Ledger(
                 ledger_index=ledger_index,
                 transactions=False,
                 expand=False,
             )
+        
+        result = await self._call(request, "ledger info")
+        return None if result is None else result.get("ledger")
+    
+    # =========================================================================
+    # BATCH QUERIES
+    # =========================================================================
+    
+    async def batch_request(self, requests: List[Request]) -> List[Response]:
+        """
+        Send several requests to the current node in as few round trips as possible.
+        
+        Requests go out as JSON-RPC batches of up to BATCH_MAX_REQUESTS. Not
+        every public server accepts batches (rippled itself doesn't); if one
+        is rejected, its requests are sent individually (and concurrently)
+        instead, and that node is not sent batches again. Only a malformed
+        answer or a 4xx status other than 429 counts as a rejection; network
+        errors, 429 and 5xx just fall back for that call. Over a websocket
+        the requests are always sent individually on the open connection.
+        Individually sent requests are limited to max_concurrency at once.
+        
+        Args:
+            requests: xrpl-py request models
             
-            response = await self.client.request(request)
+        Returns:
+            List[Response]: One response per request, in the same order
             
-            if response.is_successful():
-                return response.result.get("ledger")
+        Raises:
+            Exception: Network errors from individually sent requests
+        """
+        responses: List[Response] = []
+        
+        for start in range(0, len(requests), BATCH_MAX_REQUESTS):
+            chunk = requests[start:start + BATCH_MAX_REQUESTS]
+            
+            url = self.rpc_url
+            if not isinstance(self.client, AsyncWebsocketClient) and url not in self._batch_unsupported:
+                try:
+                    responses.extend(await self._post_batch(chunk))
+                    continue
+                except Exception as e:
+                    if _is_batch_rejection(e):
+                        logger.warning(f"{url} rejected a batch request, sending individually from now on: {e}")
+                        self._batch_unsupported.add(url)
+                    else:
+                        logger.warning(f"Batch request to {url} failed, sending individually: {e}")
+            
+            responses.extend(await gather_with_concurrency(
+                self.max_concurrency, *(self.client.request(r) for r in chunk)
+            ))
+        
+        return responses
+    
+    async def _post_batch(self, requests: List[Request]) -> List[Response]:
+        """POST one JSON-RPC batch and return the responses in request order."""
+        payload = []
+        for request_id, request in enumerate(requests):
+            # Same shape xrpl-py's JSON-RPC client sends, plus a batch id
+            params = request.to_dict()
+            method = params.pop("method")
+            params.pop("id", None)
+            payload.append({
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": method,
+                "params": [params],
+            })
+        
+        async with self._get_session().post(self.rpc_url, json=payload) as http_response:
+            http_response.raise_for_status()
+            body = await http_response.json(content_type=None, loads=_json_loads)
+        
+        if not isinstance(body, list):
+            raise ValueError(f"expected a JSON array, got {type(body).__name__}")
+        
+        # Answers may come back in any order; match them up by id
+        answers = {item.get("id"): item for item in body if isinstance(item, dict)}
+        
+        responses = []
+        for request_id in range(len(requests)):
+            answer = answers.get(request_id)
+            if answer is None or not isinstance(answer.get("result"), dict):
+                raise ValueError(f"no result for request {request_id}")
+            responses.append(json_to_response(answer))
+        return responses
+    
+    async def get_accounts_info(self, addresses: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get account information for several accounts at once.
+        
+        Equivalent to get_account_info for each address, but accounts that
+        are not already cached are fetched with one batch_request instead
+        of a request each. Results are cached for get_account_info.
+        
+        Args:
+            addresses: XRP wallet addresses
+            
+        Returns:
+            Dict mapping each address to its account data, None if the
+            address is invalid, not found or could not be fetched
+        """
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        missing: List[str] = []
+        
+        for address in dict.fromkeys(addresses):
+            if not self.is_valid_address(address):
+                logger.error(f"Invalid XRP address: {address}")
+                results[address] = None
+                continue
+            
+            account_data = self._cached_account_info(address)
+            if account_data is not None:
+                results[address] = account_data
             else:
-                logger.error(f"Ledger request failed: {response.result.get('error_message')}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error getting ledger info: {e}")
-            return None
+                missing.append(address)
+        
+        if missing:
+            requests = [_account_info_request(address, True) for address in missing]
+            try:
+                responses = await self.batch_request(requests)
+            except Exception as e:
+                # Fall back to single lookups, which fail over between nodes
+                logger.warning(f"Batch account info failed, looking up individually: {e}")
+                fetched = await gather_with_concurrency(
+                    self.max_concurrency, *(self.get_account_info(a) for a in missing)
+                )
+                results.update(zip(missing, fetched))
+            else:
+                for address, response in zip(missing, responses):
+                    account_data = None
+                    if response.is_successful():
+                        account_data = response.result.get("account_data")
+                    if account_data is not None:
+                        self._cache_put(("get_account_info", (address,), ()), account_data)
+                    results[address] = account_data
+        
+        return {address: results[address] for address in addresses}
+    
+    async def check_accounts_exist(self, addresses: List[str]) -> Dict[str, bool]:
+        """
+        Check which of several XRP accounts exist and are activated.
+        
+        Args:
+            addresses: XRP wallet addresses
+            
+        Returns:
+            Dict mapping each address to True if the account exists
+        """
+        accounts = await self.get_accounts_info(addresses)
+        return {address: info is not None for address, info in accounts.items()}
     
     # =========================================================================
     # CONVENIENCE METHODS FOR BOT INTEGRATION
@@ -962,9 +1916,51 @@ class XRPLClient:
         if not self.is_valid_address(address):
             return f"❌ Invalid XRP address: `{address}`"
         
-        # Get account info
-        account_info = await self.get_account_info(address)
+        # Get account info and reserve settings in one round trip
+        account_info, reserve_drops = await asyncio.gather(
+            self.get_account_info(address),
+            self._get_reserve_drops(),
+        )
+        
+        return self._format_wallet_summary(address, account_info, reserve_drops)
+    
+    async def get_wallet_summaries(self, addresses: List[str]) -> Dict[str, str]:
+        """
+        Get formatted wallet summaries for several addresses at once.
+        
+        Addresses are validated up front, then all valid accounts are
+        fetched together with get_accounts_info() (one batch request) and
+        the reserve settings once, instead of a round trip per address.
+        
+        Args:
+            addresses: XRP wallet addresses
+            
+        Returns:
+            Dict mapping each address to its summary, as get_wallet_summary
+        """
+        valid = [address for address in addresses if self.is_valid_address(address)]
+        
+        accounts, reserve_drops = await asyncio.gather(
+            self.get_accounts_info(valid),
+            self._get_reserve_drops(),
+        )
         
+        return {
+            address: (
+                self._format_wallet_summary(address, accounts[address], reserve_drops)
+                if address in accounts
+                else f"❌ Invalid XRP address: `{address}`"
+            )
+            for address in addresses
+        }
+    
+    def _format_wallet_summary(
+        self,
+        address: str,
+        account_info: Optional[Dict[str, Any]],
+        reserve_drops: Optional[Tuple[int, int]],
+    ) -> str:
+        """Render get_wallet_summary's text for fetched account data."""
         if account_info is None:
             return (
                 f"⚠️ Account not found or not activated.\n"
@@ -973,30 +1969,25 @@ class XRPLClient:
             )
         
         # Get reserve info
-        reserve_info = await self.get_account_reserve(address)
+        reserve_info = None
+        if reserve_drops is not None:
+            reserve_info = self._calculate_reserve(account_info, reserve_drops)
         
         # Format the summary
         balance = self.drops_to_xrp(account_info.get("Balance", "0"))
         sequence = account_info.get("Sequence", 0)
         owner_count = account_info.get("OwnerCount", 0)
         
-        summary = f"""💰 **Wallet Summary**
-━━━━━━━━━━━━━━━━━━━━━
-**Address:** `{address}`
-**Network:** {self.network.upper()}
-
-**Balance:** {balance:,.6f} XRP
-**Sequence:** {sequence}
-**Objects Owned:** {owner_count}
-"""
+        summary = _WALLET_SUMMARY_TEMPLATE.format(
+            address=address,
+            network=self.network.upper(),
+            balance=balance,
+            sequence=sequence,
+            owner_count=owner_count,
+        )
         
         if reserve_info:
-            summary += f"""
-**Reserves:**
-  • Base Reserve: {reserve_info['base_reserve']} XRP
-  • Owner Reserve: {reserve_info['owner_reserve']} XRP
-  • **Available:** {reserve_info['available_balance']:,.6f} XRP
-"""
+            summary += _WALLET_RESERVES_TEMPLATE.format_map(reserve_info)
         
         return summary
     
@@ -1013,8 +2004,10 @@ class XRPLClient:
         if not self.is_valid_address(address):
             return False
         
-        account_info = await self.get_account_info(address)
-        return account_info is not None
+        if self._cached_account_info(address) is not None:
+            return True
+        
+        return await self.get_account_info(address) is not None
 
 
 # =============================================================================
@@ -1042,9 +2035,16 @@ async def main():
     is_valid = XRPLClient.is_valid_address(test_address)
     print(f"   Valid: {is_valid}")
     
+    # The remaining lookups are independent, so fetch them all at once
+    balance, summary, server, fee = await asyncio.gather(
+        xrpl.get_account_balance(test_address),
+        xrpl.get_wallet_summary(test_address),
+        xrpl.get_server_info(),
+        xrpl.get_current_fee(),
+    )
+    
     # Get balance
     print(f"\n2. Getting balance...")
-    balance = await xrpl.get_account_balance(test_address)
     if balance:
         print(f"   Balance: {balance:,.6f} XRP")
     else:
@@ -1052,23 +2052,22 @@ async def main():
     
     # Get wallet summary (formatted for bot)
     print(f"\n3. Getting wallet summary...")
-    summary = await xrpl.get_wallet_summary(test_address)
     print(summary)
     
     # Get server info
     print(f"\n4. Getting server info...")
-    server = await xrpl.get_server_info()
     if server:
         print(f"   Server: {server.get('build_version')}")
         print(f"   Ledger: {server.get('validated_ledger', {}).get('seq')}")
     
     # Get current fee
     print(f"\n5. Getting current fee...")
-    fee = await xrpl.get_current_fee()
     if fee:
         print(f"   Minimum: {fee['minimum_fee']} drops")
         print(f"   Median: {fee['median_fee']} drops")
     
+    await xrpl.close()
+    
     print("\n" + "=" * 50)
     print("Demo complete!")
 